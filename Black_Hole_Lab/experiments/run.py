@@ -6,12 +6,14 @@ import argparse
 import csv
 import hashlib
 import logging
+import os
 import time
 import tracemalloc
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import yaml
@@ -19,12 +21,28 @@ import yaml
 from tz.backend import get_backend
 from tz.core.checks import ensure_dtype, ensure_finite, ensure_stable
 from tz.core.constants import DEFAULT_DTYPE, DIVERGENCE_THRESHOLD
+from tz.core.precision import REFERENCE_PRECISION, Precision, get_precision
 from tz.core.seed import set_seed
-from tz.db.api import ingest_legacy, log_artifact, log_metric, log_run
-from tz.integrators import build_integrator
-from tz.io import build_run_dir, get_env_info, get_git_info, write_json, write_yaml
-from tz.metrics import energy_harmonic
+from tz.db.api import ingest_legacy, log_artifact, log_metrics, log_run
+from tz.integrators import accepts_out, build_integrator, build_linear_propagator
+from tz.integrators.compiled import build_compiled_stepper
+from tz.io import (
+    GitInfo,
+    build_run_dir,
+    get_env_info,
+    get_git_info,
+    write_json,
+    write_yaml,
+)
+from tz.metrics import precision_drift
 from tz.models import build_model
+from tz.parallel import ChunkedAdvance, SlabDecomposition
+from tz.parallel.threads import AdvanceFn
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+LOG_FORMAT = "%(asctime)s %(levelname)s %(message)s"
+# Larger final states are only stored in the trajectory artifact.
+SUMMARY_STATE_LIMIT = 1024
 
 
 @dataclass
@@ -37,6 +55,9 @@ class RunConfig:
     model: Dict[str, Any]
     integrator: Dict[str, Any]
     metrics: Dict[str, Any]
+    execution: Dict[str, Any]
+    precision: Optional[str] = None
+    backend_options: Dict[str, Any] = field(default_factory=dict)
 
 
 def load_config(path: Path) -> Dict[str, Any]:
@@ -47,135 +68,505 @@ def load_config(path: Path) -> Dict[str, Any]:
 def resolve_config(raw: Dict[str, Any], overrides: Dict[str, Any]) -> RunConfig:
     """Resolve config with CLI overrides."""
     merged = {**raw, **{k: v for k, v in overrides.items() if v is not None}}
+    # ``backend`` is a name, or a mapping of its name and constructor options.
+    backend = merged.get("backend", "numpy")
+    backend_options = dict(backend) if isinstance(backend, dict) else {"name": backend}
     return RunConfig(
         name=merged.get("name", "baseline"),
         seed=int(merged.get("seed", 0)),
-        backend=merged.get("backend", "numpy"),
+        backend=str(backend_options.pop("name", "numpy")),
         device=merged.get("device", "cpu"),
         notes=str(merged.get("notes", "")),
         model=merged.get("model", {}),
         integrator=merged.get("integrator", {}),
         metrics=merged.get("metrics", {}),
+        execution=merged.get("execution") or {},
+        precision=merged.get("precision"),
+        backend_options=backend_options,
     )
 
 
+def model_advance(model: Any, integrator: Any) -> Optional[AdvanceFn]:
+    """The model's own ``advance`` when it implements ``integrator`` (its ``scheme``), else None."""
+    if hasattr(model, "advance") and getattr(model, "scheme", None) == integrator.name:
+        return model.advance
+    return None
+
+
+def build_parallel_advance(
+    model: Any,
+    config: RunConfig,
+    execution: str,
+    inplace: bool,
+    workers: int,
+    max_records: int,
+    own_advance: Optional[AdvanceFn] = None,
+) -> Optional[Union[ChunkedAdvance, SlabDecomposition]]:
+    """Stepping for ``execution.mode`` ``threads`` or ``processes``, or None if unsupported.
+
+    Only row-local models qualify. Thread chunks step with the model's
+    ``own_advance`` or with a fresh integrator each, so in-place workspaces are
+    per chunk; slab workers are separate processes and need a model ``box``.
+    """
+    if not getattr(model, "row_local", False):
+        return None
+    if execution == "processes":
+        box = getattr(model, "box", None)
+        if box is None:
+            return None
+        advance = own_advance
+        if advance is None:
+            advance = build_integrator(config.integrator, inplace=inplace).advance
+        return SlabDecomposition(
+            advance,
+            box=box,
+            workers=workers,
+            exchange_every=int(config.execution.get("exchange_every", 10)),
+            max_records=max_records,
+        )
+    chunks = int(config.execution.get("chunks", 0)) or workers
+    if own_advance is not None:
+        return ChunkedAdvance([own_advance] * chunks, workers=workers)
+    integrators = [build_integrator(config.integrator, inplace=inplace) for _ in range(chunks)]
+    return ChunkedAdvance([integrator.advance for integrator in integrators], workers=workers)
+
+
+def precision_report(
+    config: RunConfig, precision: Precision, backend: Any, steps: int
+) -> Dict[str, Any]:
+    """Compare ``steps`` steps at ``precision`` with a float64 reference from the same start.
+
+    Both runs use the plain model or integrator stepping and sample ten
+    times over the horizon; states and observables are compared sample by
+    sample with :func:`tz.metrics.precision_drift`. Ensembles of models with
+    ``member_observables`` also get the comparison per member, under ``members``.
+    """
+    dt = float(config.integrator.get("dt", 0.01))
+    record_every = max(1, steps // 10)
+    steps -= steps % record_every
+    runs = []
+    for run_precision in (REFERENCE_PRECISION, precision):
+        set_seed(config.seed)
+        model = build_model(config.model, xp=backend.xp, precision=run_precision)
+        integrator = build_integrator(
+            config.integrator,
+            inplace=accepts_out(model.derivative),
+            jacobian=getattr(model, "jacobian", None),
+        )
+        state = backend.asarray(model.initial_state(), dtype=run_precision.state)
+        advance = model_advance(model, integrator) or integrator.advance
+        _, samples = advance(state, 0.0, dt, steps, model.derivative, record_every=record_every)
+        if hasattr(integrator, "close"):
+            integrator.close()
+        runs.append((samples, [model.observables(sample) for sample in samples]))
+    (reference, reference_obs), (trial, trial_obs) = runs
+    observables = {
+        key: precision_drift([obs[key] for obs in reference_obs], [obs[key] for obs in trial_obs])[
+            "max_rel_error"
+        ]
+        for key in (reference_obs[0] if reference_obs else {})
+    }
+    report: Dict[str, Any] = {
+        "precision": precision.name,
+        "reference": REFERENCE_PRECISION.name,
+        "steps": steps,
+        "record_every": record_every,
+        "state": precision_drift(reference, trial),
+        "observables_max_rel_error": observables,
+    }
+    if hasattr(model, "member_observables") and np.ndim(reference) == 3:
+        reference_members = model.member_observables(reference)
+        trial_members = model.member_observables(trial)
+        report["members"] = [
+            {
+                "state": precision_drift(reference[:, member], trial[:, member]),
+                "observables_max_rel_error": {
+                    key: precision_drift(values[:, member], trial_members[key][:, member])[
+                        "max_rel_error"
+                    ]
+                    for key, values in reference_members.items()
+                },
+            }
+            for member in range(reference.shape[1])
+        ]
+    return report
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Theory Zero experiment runner")
     parser.add_argument("--config", required=True, type=Path)
     parser.add_argument("--seed", type=int)
     parser.add_argument("--device")
     parser.add_argument("--backend")
+    parser.add_argument("--precision", choices=("float64", "float32", "mixed"))
     parser.add_argument("--outdir", type=Path)
     parser.add_argument("--resume", action="store_true")
     parser.add_argument("--notes")
     return parser.parse_args()
 
 
-def main() -> None:
-    args = parse_args()
-    raw_config = load_config(args.config)
-    overrides = {
+def cli_overrides(args: argparse.Namespace) -> Dict[str, Any]:
+    """Config overrides from the CLI flags shared by runs and sweeps."""
+    return {
         "seed": args.seed,
         "device": args.device,
         "backend": args.backend,
         "notes": args.notes,
+        "precision": args.precision,
     }
-    config = resolve_config(raw_config, overrides)
 
-    repo_root = Path(__file__).resolve().parents[1]
-    git_info = get_git_info(repo_root)
 
-    run_root = args.outdir or repo_root / "runs"
-    run_dir = build_run_dir(run_root, config.name, git_info.sha)
-
-    logging.basicConfig(
-        level=logging.INFO,
-        handlers=[
-            logging.FileHandler(run_dir / "logs.txt"),
-            logging.StreamHandler(),
-        ],
-        format="%(asctime)s %(levelname)s %(message)s",
-    )
-
-    logging.info("Starting run %s", run_dir.name)
-    if args.resume:
-        logging.warning("Resume flag provided but resume logic is not implemented yet.")
+@dataclass
+class SimulationResult:
+    """What one simulated config produced, before it is written out and logged."""
+
+    summary: Dict[str, Any]
+    resolved: Dict[str, Any]
+    trajectory: np.ndarray
+    observable_log: List[Tuple[int, Dict[str, float]]]
+    step_times: List[Tuple[int, float]]
+    runtime: float
+    extra_metrics: List[Tuple[int, str, float]] = field(default_factory=list)
+    precision_report: Optional[Dict[str, Any]] = None
+
+
+def artifact_path(path: Path) -> str:
+    """``path`` relative to the repository when inside it, else absolute."""
+    path = path.resolve()
+    return str(path.relative_to(REPO_ROOT)) if path.is_relative_to(REPO_ROOT) else str(path)
+
+
+def execute_run(
+    config: RunConfig,
+    raw_config: Dict[str, Any],
+    *,
+    run_root: Optional[Path] = None,
+    run_name: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    git_info: Optional[GitInfo] = None,
+) -> Dict[str, Any]:
+    """Simulate ``config`` in a new run directory under ``run_root`` and log it to the findings DB.
+
+    Log records also go to the run's ``logs.txt`` while it executes. Returns
+    the run summary plus its ``run_dir`` and ``run_id``.
+    """
+    git_info = git_info or get_git_info(REPO_ROOT)
+    run_dir = build_run_dir(run_root or REPO_ROOT / "runs", run_name or config.name, git_info.sha)
+    with run_log(run_dir):
+        logging.info("Starting run %s", run_dir.name)
+        result = simulate(config, run_dir)
+        run_id = record_run(run_dir, config, raw_config, result, git_info, params=params)
+        logging.info("Run complete: %s", run_dir.name)
+    return {**result.summary, "run_dir": str(run_dir), "run_id": run_id}
+
+
+@contextmanager
+def run_log(run_dir: Path) -> Iterator[None]:
+    """Copy log records to ``run_dir/logs.txt`` for the duration of the block."""
+    handler = logging.FileHandler(run_dir / "logs.txt")
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    logger = logging.getLogger()
+    logger.addHandler(handler)
+    try:
+        yield
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def simulate(config: RunConfig, run_dir: Path) -> SimulationResult:
+    """Step ``config``, streaming ``metrics.csv`` (and any precision report) into ``run_dir``."""
     set_seed(config.seed)
 
-    backend = get_backend(config.backend)
-    model = build_model(config.model, xp=backend.xp)
-    integrator = build_integrator(config.integrator)
+    backend = get_backend(config.backend, **config.backend_options)
+    pool = backend.buffer_pool()
+    precision = get_precision(config.precision)
+    model = build_model(config.model, xp=backend.xp, precision=precision)
+    inplace = accepts_out(model.derivative)
+    integrator = build_integrator(
+        config.integrator,
+        inplace=inplace,
+        jacobian=getattr(model, "jacobian", None),
+        pool=pool,
+    )
+    execution = config.execution.get("mode", "serial")
+    if execution not in ("serial", "threads", "processes"):
+        raise ValueError(f"Unsupported execution mode: {execution}")
+    workers = 1
+    if execution != "serial":
+        workers = int(config.execution.get("workers", 0)) or os.cpu_count() or 1
     dt = float(config.integrator.get("dt", 0.01))
     steps = int(config.integrator.get("steps", 1000))
     record_every = int(config.metrics.get("record_every", 1))
-
-    state = backend.asarray(model.initial_state(), dtype=DEFAULT_DTYPE)
+    chunk_steps = int(config.integrator.get("chunk_steps", 1000))
+    # A configured precision wins; otherwise models may declare a working
+    # precision (e.g. float32 lattices), defaulting to float64.
+    if precision is not None:
+        dtype = precision.state
+        logging.info("Running at %s precision", precision.name)
+    else:
+        dtype = np.dtype(getattr(model, "dtype", DEFAULT_DTYPE))
+    own_advance = model_advance(model, integrator)
+    if own_advance is None and hasattr(model, "advance"):
+        logging.warning(
+            "%s.advance implements %s, not %s; stepping its derivative with %s",
+            model.name,
+            model.scheme,
+            integrator.name,
+            integrator.name,
+        )
+    # A model stepping itself does not go through the integrator's stages.
+    derivative_evals = steps * integrator.stages if own_advance is None else None
+    default_advance = own_advance or integrator.advance
+    advance = default_advance
+    linear_mode = config.integrator.get("linear", False)
+    propagator = None
+    if linear_mode:
+        propagator = build_linear_propagator(model, integrator, dt, exact=linear_mode == "exact")
+    if propagator is not None:
+        logging.info("Using linear %s propagator", propagator.name)
+        advance = propagator.advance
+        derivative_evals = integrator.stages
+        # A propagator jumps over unrecorded steps, so one chunk can cover the run.
+        chunk_steps = int(config.integrator.get("chunk_steps", steps))
+    elif config.integrator.get("compile"):
+        compiled = build_compiled_stepper(model, integrator, dtype)
+        if compiled is None and not hasattr(model, "kernel"):
+            logging.warning("%s has no compiled kernel; using NumPy", model.name)
+        elif compiled is None:
+            logging.warning("Compiled stepping unavailable for %s; using NumPy", integrator.name)
+        else:
+            logging.info("Using %s kernel", compiled.name)
+            advance = compiled.advance
+    elif hasattr(integrator, "slices"):
+        # Parareal parallelises across the slices of one chunk, so default to the whole run.
+        chunk_steps = int(config.integrator.get("chunk_steps", steps))
+    # Chunks are whole multiples of record_every so samples land on global steps.
+    chunk_steps = max(record_every, chunk_steps - chunk_steps % record_every)
+    parallel = None
+    if execution != "serial":
+        fixed_step = not hasattr(integrator, "solve") and not hasattr(integrator, "slices")
+        if advance == default_advance and fixed_step:
+            max_records = chunk_steps // record_every if record_every > 0 else 0
+            parallel = build_parallel_advance(
+                model, config, execution, inplace, workers, max_records, own_advance
+            )
+        if parallel is None:
+            logging.warning("Parallel execution needs a row-local particle model; running serially")
+            execution, workers = "serial", 1
+        else:
+            logging.info("Stepping with %s on %d workers", execution, parallel.workers)
+            advance = parallel.advance
+
+    state = backend.asarray(model.initial_state(), dtype=dtype)
     time_value = 0.0
 
-    ensure_dtype(state, dtype=DEFAULT_DTYPE, name="state")
+    ensure_dtype(state, dtype=dtype, name="state")
+    if hasattr(integrator, "allocate") and advance == integrator.advance:
+        integrator.allocate(state)
+        logging.info("Using in-place %s stepping with preallocated workspace", integrator.name)
+    n_particles = getattr(model, "n_particles", None)
+    n_cells = getattr(model, "n_cells", None)
+    ensemble = state.ndim == 2 and n_particles is None
+    n_members = state.shape[0] if ensemble else 1
+    if ensemble:
+        logging.info("Running ensemble of %d members", n_members)
 
     metrics_path = run_dir / "metrics.csv"
     tracemalloc.start()
     with metrics_path.open("w", newline="") as handle:
         writer = csv.writer(handle)
-        writer.writerow(["step", "time", "x", "v", "energy", "step_time_ms"])  # header
-
-        trajectory: List[np.ndarray] = []
-        step_times: List[float] = []
-        energy_log: List[tuple[int, float]] = []
+        writer.writerow(["step", "time", *model.observables(state), "step_time_ms"])  # header
+
+        # Recorded states are written into one pooled array sized for the whole run.
+        trajectory: np.ndarray
+        # Chunks after the first are steady state: every buffer is sized by then.
+        steady_peak: Optional[int] = None
+        warm_allocations = 0
+        memory_peak = 0
+        step_times: List[tuple[int, float]] = []
+        observable_log: List[tuple[int, Dict[str, float]]] = []
+        solver_stats: Dict[str, int] = {}
+
+        def record(step: int, time_value: float, state: np.ndarray, step_time_ms: float) -> None:
+            observables = model.observables(state)
+            writer.writerow([step, time_value, *observables.values(), step_time_ms])
+            trajectory[len(observable_log)] = state
+            observable_log.append((step, observables))
 
         start_time = time.perf_counter()
-        for step in range(steps + 1):
-            step_start = time.perf_counter()
-            if step < steps:
-                state = integrator.step(state, time_value, dt, model.derivative)
-                time_value += dt
+        if hasattr(integrator, "solve"):
+            # Adaptive solvers choose their own steps and sample via dense output.
+            record_times = config.metrics.get("record_times")
+            if record_times is None:
+                record_steps = list(range(0, steps + 1, record_every))
+                t_eval = np.asarray(record_steps, dtype=float) * dt
+            else:
+                t_eval = np.asarray(record_times, dtype=float)
+                record_steps = list(range(len(t_eval)))
+            trajectory = pool.acquire((len(t_eval), *state.shape), state.dtype)
+            solution = integrator.solve(state, time_value, t_eval, model.derivative, dt0=dt)
+            ensure_dtype(solution.states, dtype=dtype, name="state")
+            ensure_finite(solution.states, name="state")
+            ensure_stable(solution.states, threshold=DIVERGENCE_THRESHOLD, name="state")
+            solve_ms = (time.perf_counter() - start_time) * 1000.0
+            step_time_ms = solve_ms / max(solution.n_accepted, 1)
+            for step, sample_time, sample in zip(record_steps, t_eval, solution.states):
+                record(step, float(sample_time), sample, step_time_ms)
+            if len(t_eval):
+                state, time_value = solution.states[-1], float(t_eval[-1])
+                step_times.append((record_steps[-1], step_time_ms))
+            mean_step_ms = step_time_ms
+            solver_stats = {
+                "derivative_evals": solution.n_evals,
+                "accepted_steps": solution.n_accepted,
+                "rejected_steps": solution.n_rejected,
+            }
+        else:
+            trajectory = pool.acquire((1 + steps // record_every, *state.shape), state.dtype)
+            record(0, time_value, state, 0.0)
+            step = 0
+            stepping_ms = 0.0
+            while step < steps:
+                n_steps = min(chunk_steps, steps - step)
+                if step > 0:
+                    memory_peak = max(memory_peak, tracemalloc.get_traced_memory()[1])
+                    tracemalloc.reset_peak()
+                    baseline = tracemalloc.get_traced_memory()[0]
+                chunk_start = time.perf_counter()
+                state, samples = advance(
+                    state, step * dt, dt, n_steps, model.derivative, record_every=record_every
+                )
+                chunk_ms = (time.perf_counter() - chunk_start) * 1000.0
+                if step > 0:
+                    chunk_peak = tracemalloc.get_traced_memory()[1] - baseline
+                    steady_peak = max(steady_peak or 0, chunk_peak)
+                stepping_ms += chunk_ms
+                step_time_ms = chunk_ms / n_steps
+                # Catches silent upcasts, e.g. float64 parameters promoting a float32 state.
+                ensure_dtype(state, dtype=dtype, name="state")
                 ensure_finite(state, name="state")
                 ensure_stable(state, threshold=DIVERGENCE_THRESHOLD, name="state")
-            step_time_ms = (time.perf_counter() - step_start) * 1000.0
-            step_times.append(step_time_ms)
-
-            if step % record_every == 0:
-                energy = energy_harmonic(state, float(config.model.get("omega", 1.0)))
-                writer.writerow([step, time_value, float(state[0]), float(state[1]), energy, step_time_ms])
-                energy_log.append((step, float(energy)))
-                trajectory.append(state.copy())
+                for index, sample in enumerate(samples, start=1):
+                    sample_step = step + index * record_every
+                    record(sample_step, sample_step * dt, sample, step_time_ms)
+                pool.release(samples)
+                if step == 0:
+                    warm_allocations = pool.stats["allocations"]
+                step += n_steps
+                time_value = step * dt
+                step_times.append((step, step_time_ms))
+            mean_step_ms = stepping_ms / steps if steps else 0.0
+            solver_stats = {
+                **({"derivative_evals": derivative_evals} if derivative_evals is not None else {}),
+                **getattr(integrator, "stats", {}),
+                **getattr(parallel, "stats", {}),
+            }
 
         runtime = time.perf_counter() - start_time
+        if hasattr(integrator, "close"):
+            integrator.close()
+        if hasattr(parallel, "close"):
+            parallel.close()
         current, peak = tracemalloc.get_traced_memory()
         tracemalloc.stop()
-
-    config_payload = {
-        **raw_config,
-        "resolved": {
-            "seed": config.seed,
-            "backend": config.backend,
-            "device": config.device,
-            "notes": config.notes,
-        },
+        peak = max(peak, memory_peak)
+        steady_stats: Dict[str, int] = {}
+        if steady_peak is not None:
+            steady_stats = {
+                "steady_state_step_peak_bytes": steady_peak,
+                "pool_steady_state_allocations": pool.stats["allocations"] - warm_allocations,
+            }
+
+    report = None
+    drift_steps = min(steps, int(config.metrics.get("drift_steps", 100)))
+    if precision is not None and precision != REFERENCE_PRECISION and drift_steps > 0:
+        report = precision_report(config, precision, backend, drift_steps)
+        write_json(run_dir / "precision_report.json", report)
+        logging.info(
+            "Precision drift over %d steps: max relative state error %.3g",
+            report["steps"],
+            report["state"]["max_rel_error"],
+        )
+
+    resolved = {
+        "seed": config.seed,
+        "backend": {"name": config.backend, **config.backend_options},
+        "device": config.device,
+        "notes": config.notes,
+        "execution": {"mode": execution, "workers": workers},
+        "precision": precision.name if precision is not None else dtype.name,
     }
-    write_yaml(run_dir / "config_resolved.yaml", config_payload)
-    write_json(run_dir / "env.json", get_env_info())
-    write_json(
-        run_dir / "git.json",
-        {"sha": git_info.sha, "branch": git_info.branch, "dirty": git_info.dirty},
-    )
 
     summary = {
-        "final_state": state.tolist(),
+        "final_state": state.tolist() if state.size <= SUMMARY_STATE_LIMIT else None,
         "runtime_seconds": runtime,
-        "mean_step_ms": float(np.mean(step_times)) if step_times else 0.0,
+        "mean_step_ms": mean_step_ms,
+        "n_members": n_members,
+        "member_steps_per_sec": n_members * steps / runtime if runtime > 0 else 0.0,
+        **(
+            {"n_particles": n_particles, "nodes_per_sec": n_particles * steps / runtime}
+            if n_particles and runtime > 0
+            else {}
+        ),
+        **(
+            {"n_cells": n_cells, "cell_updates_per_sec": n_cells * steps / runtime}
+            if n_cells and runtime > 0
+            else {}
+        ),
+        **solver_stats,
+        "execution": execution,
+        "workers": workers,
+        "precision": precision.name if precision is not None else dtype.name,
+        **(
+            {"precision_max_rel_error": report["state"]["max_rel_error"]}
+            if report is not None
+            else {}
+        ),
         "memory_current_bytes": current,
         "memory_peak_bytes": peak,
+        **steady_stats,
+        "buffer_pool": dict(pool.stats),
         "seed": config.seed,
         "backend": config.backend,
+        **({"backend_workers": backend.workers} if hasattr(backend, "workers") else {}),
         "device": config.device,
     }
-    write_json(run_dir / "summary.json", summary)
+    return SimulationResult(
+        summary=summary,
+        resolved=resolved,
+        trajectory=trajectory[: len(observable_log)],
+        observable_log=observable_log,
+        step_times=step_times,
+        runtime=runtime,
+        extra_metrics=(
+            [(report["steps"], "precision_max_rel_error", report["state"]["max_rel_error"])]
+            if report is not None
+            else []
+        ),
+        precision_report=report,
+    )
+
 
-    trajectory_arr = np.stack(trajectory) if trajectory else np.zeros((0, 2))
+def record_run(
+    run_dir: Path,
+    config: RunConfig,
+    raw_config: Dict[str, Any],
+    result: SimulationResult,
+    git_info: GitInfo,
+    *,
+    params: Optional[Dict[str, Any]] = None,
+) -> int:
+    """Write the config, metadata, summary and trajectory of a run and insert its DB rows."""
+    write_yaml(run_dir / "config_resolved.yaml", {**raw_config, "resolved": result.resolved})
+    write_json(run_dir / "env.json", get_env_info())
+    write_json(
+        run_dir / "git.json",
+        {"sha": git_info.sha, "branch": git_info.branch, "dirty": git_info.dirty},
+    )
+    write_json(run_dir / "summary.json", result.summary)
     artifacts_path = run_dir / "artifacts" / "trajectory.npz"
-    np.savez(artifacts_path, trajectory=trajectory_arr)
+    np.savez(artifacts_path, trajectory=result.trajectory)
 
     config_hash = hashlib.sha256((run_dir / "config_resolved.yaml").read_bytes()).hexdigest()
     run_id = log_run(
@@ -185,22 +576,36 @@ def main() -> None:
         seed=config.seed,
         backend=config.backend,
         device=config.device,
-        runtime=runtime,
+        runtime=result.runtime,
         status="completed",
-        params={"config_name": config.name, "notes": config.notes},
+        params={"config_name": config.name, "notes": config.notes, **(params or {})},
+    )
+    log_metrics(
+        run_id,
+        [
+            *((step, "step_time_ms", float(step_time)) for step, step_time in result.step_times),
+            *result.extra_metrics,
+            *(
+                (step, key, float(value))
+                for step, observables in result.observable_log
+                for key, value in observables.items()
+            ),
+        ],
     )
-
-    for step, step_time in enumerate(step_times):
-        log_metric(run_id, step, "step_time_ms", float(step_time))
-    for step, energy in energy_log:
-        log_metric(run_id, step, "energy", float(energy))
-
     artifact_hash = hashlib.sha256(artifacts_path.read_bytes()).hexdigest()
-    log_artifact(run_id, "trajectory", str(artifacts_path.relative_to(repo_root)), artifact_hash)
+    log_artifact(run_id, "trajectory", artifact_path(artifacts_path), artifact_hash)
+    ingest_legacy(REPO_ROOT / "legacy")
+    return run_id
 
-    ingest_legacy(repo_root / "legacy")
 
-    logging.info("Run complete: %s", run_dir.name)
+def main() -> None:
+    args = parse_args()
+    raw_config = load_config(args.config)
+    config = resolve_config(raw_config, cli_overrides(args))
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    if args.resume:
+        logging.warning("Resume flag provided but resume logic is not implemented yet.")
+    execute_run(config, raw_config, run_root=args.outdir)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,546 @@
+"""Parameter sweeps: expand a sweep file into configs and run them on a process pool."""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import copy
+import csv
+import itertools
+import json
+import logging
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from experiments.run import (
+    LOG_FORMAT,
+    REPO_ROOT,
+    SimulationResult,
+    cli_overrides,
+    execute_run,
+    load_config,
+    record_run,
+    resolve_config,
+    run_log,
+    simulate,
+)
+from tz.integrators import build_integrator, explicit_one_step
+from tz.io import GitInfo, build_run_dir, get_git_info, write_json, write_yaml
+from tz.models import ENSEMBLE_PARAMETERS, build_model
+
+# Summary values copied from each point's run summary into the sweep summary.
+POINT_SUMMARY_KEYS = (
+    "runtime_seconds",
+    "mean_step_ms",
+    "fused_share_runtime_seconds",
+    "fused_share_mean_step_ms",
+    "derivative_evals",
+)
+# Summary values of a fused run that describe the whole ensemble; members keep them under ``fused``.
+ENSEMBLE_SUMMARY_KEYS = (
+    "runtime_seconds",
+    "mean_step_ms",
+    "member_steps_per_sec",
+    "derivative_evals",
+    "memory_current_bytes",
+    "memory_peak_bytes",
+    "steady_state_step_peak_bytes",
+    "pool_steady_state_allocations",
+    "buffer_pool",
+    "precision_max_rel_error",
+)
+
+
+def set_dotted(config: Dict[str, Any], key: str, value: Any) -> None:
+    """Set ``config["a"]["b"] = value`` for ``key`` ``"a.b"``, creating mappings as needed."""
+    *parents, leaf = key.split(".")
+    for name in parents:
+        config = config.setdefault(name, {})
+    config[leaf] = value
+
+
+def expand_points(
+    parameters: Dict[str, Sequence[Any]],
+    mode: str = "grid",
+    samples: int = 0,
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    """Sweep points as ``{dotted key: value}`` dictionaries.
+
+    ``grid`` takes the Cartesian product of the value lists (first key
+    slowest), ``zip`` pairs equal-length lists element by element, and
+    ``random`` draws ``samples`` distinct grid points with ``seed``, in grid
+    order, without materialising the grid.
+    """
+    keys = list(parameters)
+    values = [list(parameters[key]) for key in keys]
+    if mode == "grid":
+        return [dict(zip(keys, point)) for point in itertools.product(*values)]
+    if mode == "zip":
+        lengths = {len(options) for options in values}
+        if len(lengths) > 1:
+            raise ValueError(f"zip sweeps need equal-length parameter lists, got {sorted(lengths)}")
+        return [dict(zip(keys, point)) for point in zip(*values)]
+    if mode == "random":
+        sizes = [len(options) for options in values]
+        total = math.prod(sizes)
+        rng = np.random.default_rng(seed)
+        flat = np.sort(rng.choice(total, size=min(samples or total, total), replace=False))
+        points = []
+        for index in flat.tolist():
+            digits = []
+            for size in reversed(sizes):
+                index, digit = divmod(index, size)
+                digits.append(digit)
+            chosen = zip(keys, values, reversed(digits))
+            points.append({key: options[digit] for key, options, digit in chosen})
+        return points
+    raise ValueError(f"Unknown sweep mode {mode}")
+
+
+def point_configs(
+    base: Dict[str, Any], points: Sequence[Dict[str, Any]], name: str
+) -> List[Dict[str, Any]]:
+    """Raw configs for ``points``: ``base`` with the point's dotted keys set, named per point."""
+    configs = []
+    for index, point in enumerate(points):
+        config = copy.deepcopy(base)
+        for key, value in point.items():
+            set_dotted(config, key, value)
+        config["name"] = f"{name}_{index:04d}"
+        configs.append(config)
+    return configs
+
+
+def load_sweep(path: Path) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Sweep definition and its base config; ``base`` is relative to the sweep file."""
+    sweep = load_config(path)
+    base_path = Path(sweep.get("base", "../configs/baseline.yaml"))
+    if not base_path.is_absolute():
+        base_path = (path.parent / base_path).resolve()
+    return sweep, load_config(base_path)
+
+
+def fusable(config: Dict[str, Any]) -> bool:
+    """Whether a point can run as one member of an ensemble and step exactly as it would alone.
+
+    The model must take per-member values for its :data:`tz.models.ENSEMBLE_PARAMETERS`
+    (scalars in this config), and stepping must be serial, explicit and
+    fixed-step: adaptive step control, Newton and parareal convergence tests
+    all couple the members of an ensemble.
+    """
+    model = config.get("model", {})
+    keys = ENSEMBLE_PARAMETERS.get(model.get("name", "harmonic_oscillator"))
+    if keys is None or model.get("members"):
+        return False
+    if any(isinstance(model.get(key), (list, tuple)) for key in keys):
+        return False
+    if (config.get("execution") or {}).get("mode", "serial") != "serial":
+        return False
+    try:
+        integrator = build_integrator(config.get("integrator", {}))
+    except ValueError:
+        return False  # reported when the point runs on its own
+    return explicit_one_step(integrator)
+
+
+def fuse_groups(configs: Sequence[Dict[str, Any]]) -> List[List[int]]:
+    """Point indices grouped into runs, ordered by first index.
+
+    Fusable points whose configs differ only in ensemble parameters share a
+    group; every other point runs alone.
+    """
+    groups: Dict[str, List[int]] = {}
+    singles = []
+    for index, config in enumerate(configs):
+        if not fusable(config):
+            singles.append([index])
+            continue
+        model = config["model"]
+        keys = ENSEMBLE_PARAMETERS[model.get("name", "harmonic_oscillator")]
+        shared = {
+            **config,
+            "name": None,
+            "model": {key: value for key, value in model.items() if key not in keys},
+        }
+        present = sorted(key for key in keys if key in model)
+        signature = json.dumps([shared, present], sort_keys=True, default=str)
+        groups.setdefault(signature, []).append(index)
+    return sorted([*groups.values(), *singles], key=lambda group: group[0])
+
+
+def fused_config(
+    configs: Sequence[Dict[str, Any]], indices: Sequence[int], name: str
+) -> Dict[str, Any]:
+    """One ensemble config whose members are the points ``indices`` of ``configs``."""
+    config = copy.deepcopy(configs[indices[0]])
+    model = config["model"]
+    for key in ENSEMBLE_PARAMETERS[model.get("name", "harmonic_oscillator")]:
+        if key in model:
+            model[key] = [configs[index]["model"][key] for index in indices]
+    model["members"] = len(indices)
+    config["name"] = name
+    return config
+
+
+def split_members(result: SimulationResult, model: Any) -> List[SimulationResult]:
+    """Per-member results of a fused ensemble run, as if each member had run alone.
+
+    Observables come from ``model.member_observables`` over the stacked
+    trajectory and precision drift from the report's per-member entries.
+    Members have no timing of their own: the fused runtime and step times
+    shared equally between members are reported as ``fused_share_*`` values,
+    never under the measured names. Other ensemble-wide values (throughput,
+    derivative evaluations, memory and pool statistics) are only reported
+    under ``fused``, with the member count and index.
+    """
+    n_members = result.trajectory.shape[1]
+    observables = model.member_observables(result.trajectory)
+    steps = [step for step, _ in result.observable_log]
+    final_state = result.summary.get("final_state")
+    fused = {key: result.summary[key] for key in ENSEMBLE_SUMMARY_KEYS if key in result.summary}
+    shared = {key: value for key, value in result.summary.items() if key not in fused}
+    report = result.precision_report
+    share = 1.0 / n_members
+    members = []
+    for member in range(n_members):
+        member_report = None
+        if report is not None and "members" in report:
+            common = {key: value for key, value in report.items() if key != "members"}
+            member_report = {**common, **report["members"][member]}
+        summary = {
+            **shared,
+            "final_state": final_state[member] if final_state is not None else None,
+            "fused_share_runtime_seconds": result.runtime * share,
+            "fused_share_mean_step_ms": result.summary["mean_step_ms"] * share,
+            "n_members": 1,
+            **(
+                {"precision_max_rel_error": member_report["state"]["max_rel_error"]}
+                if member_report is not None
+                else {}
+            ),
+            "fused": {"members": n_members, "member": member, **fused},
+        }
+        log = [
+            (step, {key: float(values[row, member]) for key, values in observables.items()})
+            for row, step in enumerate(steps)
+        ]
+        extra_metrics = [
+            (step, "fused_share_step_time_ms", ms * share) for step, ms in result.step_times
+        ]
+        if member_report is not None:
+            extra_metrics.append(
+                (report["steps"], "precision_max_rel_error", summary["precision_max_rel_error"])
+            )
+        members.append(
+            SimulationResult(
+                summary=summary,
+                resolved={**result.resolved, "fused": {"members": n_members, "member": member}},
+                trajectory=result.trajectory[:, member],
+                observable_log=log,
+                step_times=[],
+                runtime=result.runtime * share,
+                extra_metrics=extra_metrics,
+                precision_report=member_report,
+            )
+        )
+    return members
+
+
+def write_metrics_csv(path: Path, result: SimulationResult, dt: float) -> None:
+    """``metrics.csv`` in the runner's layout, each sample carrying its chunk's step time.
+
+    Results without step times (fused members) leave ``step_time_ms`` empty.
+    """
+    ends = [step for step, _ in result.step_times]
+    with path.open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        keys = list(result.observable_log[0][1]) if result.observable_log else []
+        writer.writerow(["step", "time", *keys, "step_time_ms"])
+        for step, observables in result.observable_log:
+            chunk = bisect.bisect_left(ends, step)
+            step_time_ms: Any = 0.0
+            if not ends:
+                step_time_ms = ""
+            elif step > 0 and chunk < len(ends):
+                step_time_ms = result.step_times[chunk][1]
+            writer.writerow([step, step * dt, *observables.values(), step_time_ms])
+
+
+def run_point(
+    index: int,
+    raw_config: Dict[str, Any],
+    point: Dict[str, Any],
+    overrides: Dict[str, Any],
+    run_root: Path,
+    sweep_name: str,
+    git_info: GitInfo,
+) -> Dict[str, Any]:
+    """Run one sweep point in its own run directory; failures are reported, not raised."""
+    config = resolve_config(raw_config, overrides)
+    record: Dict[str, Any] = {"index": index, "parameters": point}
+    try:
+        summary = execute_run(
+            config,
+            raw_config,
+            run_root=run_root,
+            params={"sweep": sweep_name, "sweep_point": index, **point},
+            git_info=git_info,
+        )
+    except Exception as error:  # noqa: BLE001 - one failing point must not stop the sweep
+        logging.exception("Sweep point %d failed", index)
+        return {**record, "status": "failed", "error": repr(error)}
+    return {
+        **record,
+        "status": "completed",
+        "run_dir": summary["run_dir"],
+        "run_id": summary["run_id"],
+        **{key: summary[key] for key in POINT_SUMMARY_KEYS if key in summary},
+    }
+
+
+def run_fused(
+    indices: Sequence[int],
+    raw_configs: Sequence[Dict[str, Any]],
+    points: Sequence[Dict[str, Any]],
+    overrides: Dict[str, Any],
+    run_root: Path,
+    sweep_name: str,
+    git_info: GitInfo,
+    group: int,
+) -> List[Dict[str, Any]]:
+    """Run the points ``indices`` as one ensemble, then record each in its own run directory.
+
+    ``raw_configs`` and ``points`` hold those points' configs and parameters,
+    in the order of ``indices``. The ensemble run keeps a directory of its
+    own (config, summary, ensemble metrics and log) but no DB rows; each
+    point gets the usual run artifacts and DB rows, tagged with
+    ``fused_group``.
+    """
+    raw = fused_config(raw_configs, range(len(indices)), f"{sweep_name}_fused_{group:04d}")
+    records = [
+        {"index": index, "parameters": point, "fused_group": group}
+        for index, point in zip(indices, points)
+    ]
+    results: List[Dict[str, Any]] = []
+    try:
+        config = resolve_config(raw, overrides)
+        group_dir = build_run_dir(run_root, config.name, git_info.sha)
+        with run_log(group_dir):
+            logging.info("Fused run of sweep points %s", list(indices))
+            fused = simulate(config, group_dir)
+        write_yaml(group_dir / "config_resolved.yaml", {**raw, "resolved": fused.resolved})
+        write_json(group_dir / "summary.json", fused.summary)
+        members = split_members(fused, build_model(config.model))
+        dt = float(config.integrator.get("dt", 0.01))
+        for member, (record, result) in enumerate(zip(records, members)):
+            index = record["index"]
+            point_config = resolve_config(raw_configs[member], overrides)
+            run_dir = build_run_dir(run_root, point_config.name, git_info.sha)
+            with run_log(run_dir):
+                logging.info("Member %d of fused run %s", member, group_dir.name)
+                write_metrics_csv(run_dir / "metrics.csv", result, dt)
+                if result.precision_report is not None:
+                    write_json(run_dir / "precision_report.json", result.precision_report)
+                run_id = record_run(
+                    run_dir,
+                    point_config,
+                    raw_configs[member],
+                    result,
+                    git_info,
+                    params={
+                        "sweep": sweep_name,
+                        "sweep_point": index,
+                        "fused_group": group,
+                        **points[member],
+                    },
+                )
+            results.append(
+                {
+                    **record,
+                    "status": "completed",
+                    "run_dir": str(run_dir),
+                    "run_id": run_id,
+                    **{
+                        key: result.summary[key]
+                        for key in POINT_SUMMARY_KEYS
+                        if key in result.summary
+                    },
+                }
+            )
+    except Exception as error:  # noqa: BLE001 - one failing group must not stop the sweep
+        logging.exception("Fused sweep group %d failed", group)
+        results.extend(
+            {**record, "status": "failed", "error": repr(error)}
+            for record in records[len(results) :]
+        )
+    return results
+
+
+def run_group(
+    indices: Sequence[int],
+    raw_configs: Sequence[Dict[str, Any]],
+    points: Sequence[Dict[str, Any]],
+    overrides: Dict[str, Any],
+    run_root: Path,
+    sweep_name: str,
+    git_info: GitInfo,
+    group: int,
+) -> List[Dict[str, Any]]:
+    """Records of one group of points: a fused ensemble run, or a plain run for a single point.
+
+    ``raw_configs`` and ``points`` hold only the group's own points, in the
+    order of ``indices``, so a process pool pickles each config once.
+    """
+    if len(indices) > 1:
+        return run_fused(
+            indices, raw_configs, points, overrides, run_root, sweep_name, git_info, group
+        )
+    (index,) = indices
+    return [run_point(index, raw_configs[0], points[0], overrides, run_root, sweep_name, git_info)]
+
+
+def _init_worker() -> None:
+    # Points log to their own logs.txt; keep the shared console to warnings.
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.StreamHandler) and not isinstance(
+            handler, logging.FileHandler
+        ):
+            handler.setLevel(logging.WARNING)
+
+
+def run_sweep(
+    path: Path,
+    *,
+    overrides: Optional[Dict[str, Any]] = None,
+    workers: Optional[int] = None,
+    outdir: Optional[Path] = None,
+    fuse: Optional[bool] = None,
+) -> Dict[str, Any]:
+    """Run every point of the sweep at ``path`` and write the sweep summary.
+
+    Points run on ``workers`` processes (the sweep's ``workers`` key, 0 for
+    every core), each in its own run directory under one sweep directory,
+    and log their own DB rows tagged with the sweep name and point index.
+    With ``fuse`` (the sweep's ``fuse`` key) points that differ only in
+    per-member model parameters run together as one ensemble.
+    """
+    sweep, base = load_sweep(path)
+    name = sweep.get("name", path.stem)
+    points = expand_points(
+        sweep.get("parameters", {}),
+        mode=sweep.get("mode", "grid"),
+        samples=int(sweep.get("samples", 0)),
+        seed=int(sweep.get("seed", 0)),
+    )
+    configs = point_configs(base, points, name)
+    fuse = fuse if fuse is not None else bool(sweep.get("fuse", False))
+    groups = fuse_groups(configs) if fuse else [[index] for index in range(len(configs))]
+    workers = workers if workers is not None else int(sweep.get("workers", 0))
+    workers = max(1, min(workers or os.cpu_count() or 1, len(groups) or 1))
+    overrides = overrides or {}
+    git_info = get_git_info(REPO_ROOT)
+    sweep_dir = build_run_dir(outdir or REPO_ROOT / "runs" / "sweeps", name, git_info.sha)
+    write_yaml(sweep_dir / "sweep.yaml", sweep)
+    logging.info(
+        "Sweep %s: %d points in %d runs on %d workers", name, len(points), len(groups), workers
+    )
+
+    start = time.perf_counter()
+    jobs = [
+        (
+            indices,
+            [configs[index] for index in indices],
+            [points[index] for index in indices],
+            overrides,
+            sweep_dir,
+            name,
+            git_info,
+            group,
+        )
+        for group, indices in enumerate(groups)
+    ]
+    if workers == 1:
+        grouped = [run_group(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            futures = [executor.submit(run_group, *job) for job in jobs]
+            grouped = [future.result() for future in futures]
+    results = sorted(
+        (record for records in grouped for record in records), key=lambda r: r["index"]
+    )
+    wall = time.perf_counter() - start
+
+    completed = sum(result["status"] == "completed" for result in results)
+    summary = {
+        "name": name,
+        "mode": sweep.get("mode", "grid"),
+        "n_points": len(points),
+        "completed": completed,
+        "failed": len(points) - completed,
+        "fuse": fuse,
+        "runs": len(groups),
+        "workers": workers,
+        "wall_seconds": wall,
+        "points_per_sec": len(points) / wall if wall > 0 else 0.0,
+        "points": results,
+    }
+    write_json(sweep_dir / "sweep_summary.json", summary)
+    write_points_csv(sweep_dir / "points.csv", results, list(sweep.get("parameters", {})))
+    logging.info(
+        "Sweep %s: %d/%d points completed in %.2f s (%s)",
+        name,
+        completed,
+        len(points),
+        wall,
+        sweep_dir,
+    )
+    return {**summary, "sweep_dir": str(sweep_dir)}
+
+
+def write_points_csv(path: Path, results: Sequence[Dict[str, Any]], keys: List[str]) -> None:
+    """One row per point: index, parameters, status, fused group, run directory and timings."""
+    columns = ["index", *keys, "status", "fused_group", "run_id", "run_dir", *POINT_SUMMARY_KEYS]
+    with path.open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(columns)
+        for result in results:
+            values = {**result, **result["parameters"]}
+            writer.writerow([values.get(column, "") for column in columns])
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Theory Zero parameter sweeps")
+    parser.add_argument("--sweep", required=True, type=Path)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--device")
+    parser.add_argument("--backend")
+    parser.add_argument("--precision", choices=("float64", "float32", "mixed"))
+    parser.add_argument("--outdir", type=Path)
+    parser.add_argument("--notes")
+    parser.add_argument("--fuse", action=argparse.BooleanOptionalAction, default=None)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    run_sweep(
+        args.sweep,
+        overrides=cli_overrides(args),
+        workers=args.workers,
+        outdir=args.outdir,
+        fuse=args.fuse,
+    )
+
+
+if __name__ == "__main__":
+    main()
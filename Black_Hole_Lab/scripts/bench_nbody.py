@@ -0,0 +1,63 @@
+"""Benchmark Barnes–Hut or particle–mesh force evaluation against the direct sum."""
+
+from __future__ import annotations
+
+import argparse
+import math
+import time
+
+import numpy as np
+
+from tz.models.mesh import ParticleMesh
+from tz.models.nbody import BarnesHut, DirectSum, NBody
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="N-body force solver scaling benchmark")
+    parser.add_argument("--solver", choices=("barnes_hut", "particle_mesh"), default="barnes_hut")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--dim", type=int, default=3, choices=(2, 3))
+    parser.add_argument("--theta", type=float, default=0.5)
+    parser.add_argument("--cells", type=int, default=128)
+    parser.add_argument("--softening", type=float, default=1e-3)
+    parser.add_argument("--direct-limit", type=int, default=20_000)
+    parser.add_argument("--probes", type=int, default=1_000)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    print("| N | solver s | ns / (N log2 N) | direct s | median rel. error |")
+    print("| --- | --- | --- | --- | --- |")
+    for size in args.sizes:
+        model = NBody(n_particles=size, dim=args.dim, seed=0)
+        positions = np.ascontiguousarray(model.initial_state()[:, : args.dim])
+        masses = model.masses
+        if args.solver == "particle_mesh":
+            solver = ParticleMesh(cells=args.cells, softening=args.softening)
+        else:
+            solver = BarnesHut(theta=args.theta, softening=args.softening)
+        direct = DirectSum(softening=args.softening)
+
+        start = time.perf_counter()
+        approx = solver.accelerations(positions, masses)
+        solver_seconds = time.perf_counter() - start
+
+        direct_seconds = math.nan
+        if size <= args.direct_limit:
+            start = time.perf_counter()
+            direct.accelerations(positions, masses)
+            direct_seconds = time.perf_counter() - start
+        # Accuracy from the exact sum at a subset of bodies, which stays O(N).
+        probes = np.linspace(0, size - 1, min(args.probes, size)).astype(int)
+        exact = direct.at(positions[probes], positions, masses)
+        error = np.linalg.norm(approx[probes] - exact, axis=1) / np.linalg.norm(exact, axis=1)
+        per_item = solver_seconds / (size * math.log2(size)) * 1e9
+        print(
+            f"| {size} | {solver_seconds:.3f} | {per_item:.1f} | {direct_seconds:.3f} |"
+            f" {np.median(error):.2e} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
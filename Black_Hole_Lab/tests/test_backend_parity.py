@@ -13,3 +13,23 @@ def test_backend_parity_cpu_gpu():
     cpu_arr = cpu.asarray(data, dtype=np.float64)
     gpu_arr = gpu.asarray(data, dtype=np.float64)
     assert np.allclose(np.asarray(cpu_arr), np.asarray(gpu_arr))
+
+
+def test_threaded_backend_matches_numpy():
+    backend = get_backend("threaded", workers=4, min_size=1000)
+    xp = backend.xp
+    data = np.random.default_rng(0).normal(size=(5000, 3))
+    assert np.array_equal(xp.exp(data), np.exp(data))
+    inplace = data.copy()
+    xp.multiply(inplace, 2.0, out=inplace)
+    assert np.array_equal(inplace, data * 2.0)
+    assert np.array_equal(xp.clip(data, -1.0, 1.0), np.clip(data, -1.0, 1.0))
+    for low, high in ((None, 1.0), (-1.0, None)):
+        clipped = xp.clip(data, low, high)
+        assert clipped.dtype == data.dtype and np.array_equal(clipped, np.clip(data, low, high))
+    assert np.array_equal(xp.clip(data, a_min=-1.0, a_max=1.0), np.clip(data, -1.0, 1.0))
+    assert np.array_equal(xp.sum(data, 0, np.float32), data.sum(0, np.float32))
+    assert np.array_equal(backend.reduce(np.add, data, axis=1), data.sum(axis=1))
+    assert xp.max(data) == data.max()
+    assert np.isclose(xp.sum(data), data.sum(), rtol=1e-12)
+    assert xp.multiply(data.astype(np.float32), 2.0).dtype == np.float32
@@ -0,0 +1,72 @@
+import logging
+
+import numpy as np
+import pytest
+
+from experiments.run import resolve_config, simulate
+from tz.integrators import build_integrator
+from tz.integrators.compiled import build_compiled_stepper, compile_loop, compile_rhs
+from tz.models.base import HarmonicOscillator, harmonic_rhs
+
+
+@pytest.mark.parametrize("name", ["euler", "rk4", "verlet", "yoshida4"])
+def test_compiled_matches_numpy(name):
+    pytest.importorskip("numba")
+    model = HarmonicOscillator(omega=np.array([0.5, 1.0, 2.0]), x0=1.0, v0=0.1)
+    integrator = build_integrator({"name": name})
+    compiled = build_compiled_stepper(model, integrator)
+    assert compiled is not None
+
+    expected, expected_samples = integrator.advance(
+        model.initial_state(), 0.0, 0.01, 200, model.derivative, record_every=50
+    )
+    state, samples = compiled.advance(
+        model.initial_state(), 0.0, 0.01, 200, model.derivative, record_every=50
+    )
+    assert np.allclose(state, expected, rtol=1e-12, atol=1e-14)
+    assert np.allclose(samples, expected_samples, rtol=1e-12, atol=1e-14)
+
+
+def test_compiled_float32_keeps_state_dtype(tmp_path, caplog):
+    pytest.importorskip("numba")
+    model = HarmonicOscillator(omega=np.array([0.5, 1.0, 2.0]), x0=1.0, v0=0.1, dtype="float32")
+    integrator = build_integrator({"name": "rk4"})
+    compiled = build_compiled_stepper(model, integrator)
+    assert compiled is not None and compiled.dtype == np.float32
+
+    expected, _ = integrator.advance(model.initial_state(), 0.0, 0.01, 200, model.derivative)
+    state, samples = compiled.advance(
+        model.initial_state(), 0.0, 0.01, 200, model.derivative, record_every=50
+    )
+    assert state.dtype == samples.dtype == np.float32
+    assert np.allclose(state, expected, rtol=0, atol=1e-5)
+
+    config = resolve_config(
+        {
+            "precision": "float32",
+            "model": {"name": "harmonic_oscillator", "omega": 1.0, "x0": 1.0, "v0": 0.0},
+            "integrator": {
+                "name": "rk4",
+                "dt": 0.01,
+                "steps": 100,
+                "compile": True,
+                "linear": False,
+            },
+            "metrics": {"record_every": 10},
+        },
+        {},
+    )
+    with caplog.at_level(logging.INFO):
+        result = simulate(config, tmp_path)
+    assert "Using compiled_rk4 kernel" in caplog.text
+    assert result.trajectory.dtype == np.float32
+
+
+def test_compiled_kernels_load_from_the_disk_cache():
+    pytest.importorskip("numba")
+    model = HarmonicOscillator(omega=1.0, x0=1.0, v0=0.0)
+    assert build_compiled_stepper(model, build_integrator({"name": "rk4"})) is not None
+    # Fresh dispatchers bypass the in-process lru_cache and must load the saved kernels.
+    for kernel in (compile_rhs.__wrapped__(harmonic_rhs), compile_loop.__wrapped__("rk4")):
+        assert sum(kernel.stats.cache_hits.values()) == 1
+        assert not kernel.stats.cache_misses
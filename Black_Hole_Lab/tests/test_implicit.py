@@ -0,0 +1,69 @@
+import numpy as np
+
+from tz.integrators import build_integrator, finite_difference_jacobian
+from tz.models.base import HarmonicOscillator
+from tz.models.lattice import MetricRelaxation
+
+
+def _dense(matrix):
+    return matrix.toarray() if hasattr(matrix, "toarray") else np.asarray(matrix)
+
+
+def test_sparse_finite_difference_jacobian_matches_analytic():
+    model = MetricRelaxation(size=5, dx=0.5)
+    state = model.initial_state()
+    analytic = _dense(model.jacobian(state, 0.0))
+    numeric = finite_difference_jacobian(model.derivative, state, 0.0, sparsity=analytic != 0)
+    assert np.allclose(_dense(numeric), analytic, atol=1e-6)
+
+
+def test_bdf2_steps_stiff_lattice_with_reused_factorization():
+    model = MetricRelaxation(size=6, dx=0.25, damping=0.1)
+    # Explicit Euler is unstable above dt = 2 / (12 * damping / dx**2) ~ 0.1.
+    integrator = build_integrator({"name": "bdf2"}, jacobian=model.jacobian)
+    state, _ = integrator.advance(model.initial_state(), 0.0, 2.0, 50, model.derivative)
+    assert np.isfinite(state).all()
+    assert np.ptp(state) < 1e-3 * np.ptp(model.initial_state())
+    assert integrator.stats["factorizations"] <= 3
+
+
+def test_bdf2_is_second_order():
+    model = HarmonicOscillator(omega=1.0, x0=1.0, v0=0.0)
+    errors = []
+    for dt in (0.02, 0.01):
+        integrator = build_integrator({"name": "bdf2"})
+        steps = int(round(2.0 / dt))
+        state, _ = integrator.advance(model.initial_state(), 0.0, dt, steps, model.derivative)
+        errors.append(abs(state[0] - np.cos(2.0)))
+    assert 3.0 < errors[0] / errors[1] < 5.0
+
+
+def test_implicit_integrators_refactor_for_a_new_state_size():
+    single = HarmonicOscillator(omega=1.0, x0=1.0, v0=0.0)
+    ensemble = HarmonicOscillator(omega=np.array([0.5, 1.0]), x0=1.0, v0=0.0)
+    for name in ("backward_euler", "bdf2"):
+        integrator = build_integrator({"name": name})
+        integrator.advance(single.initial_state(), 0.0, 0.01, 10, single.derivative)
+        state, _ = integrator.advance(ensemble.initial_state(), 0.0, 0.01, 10, ensemble.derivative)
+        fresh, _ = build_integrator({"name": name}).advance(
+            ensemble.initial_state(), 0.0, 0.01, 10, ensemble.derivative
+        )
+        assert np.allclose(state, fresh, rtol=0, atol=1e-12)
+
+
+def test_bdf2_continues_across_chunks_of_copied_states():
+    model = HarmonicOscillator(omega=1.0, x0=1.0, v0=0.0)
+    expected, _ = build_integrator({"name": "bdf2"}).advance(
+        model.initial_state(), 0.0, 0.01, 300, model.derivative
+    )
+    integrator = build_integrator({"name": "bdf2"})
+    state = model.initial_state()
+    for chunk in range(3):
+        state, _ = integrator.advance(state.copy(), chunk * 1.0, 0.01, 100, model.derivative)
+    assert np.allclose(state, expected, rtol=0, atol=1e-12)
+    integrator.reset()
+    restarted, _ = integrator.advance(model.initial_state(), 3.0, 0.01, 1, model.derivative)
+    backward_euler, _ = build_integrator({"name": "backward_euler"}).advance(
+        model.initial_state(), 3.0, 0.01, 1, model.derivative
+    )
+    assert np.allclose(restarted, backward_euler, rtol=0, atol=1e-12)
@@ -1,6 +1,11 @@
 import numpy as np
+import pytest
 
-from tz.integrators import build_integrator
+from tz.backend import BufferPool
+from tz.core.precision import get_precision
+from tz.integrators import build_integrator, build_linear_propagator
+from tz.metrics import energy_harmonic, precision_drift
+from tz.models import build_model
 from tz.models.base import HarmonicOscillator
 
 
@@ -19,3 +24,178 @@ def test_rk4_harmonic_small_error():
     expected_v = -np.sin(time)
     assert np.allclose(state[0], expected_x, atol=1e-3)
     assert np.allclose(state[1], expected_v, atol=1e-3)
+
+
+def test_rk4_ensemble_matches_members():
+    omegas = np.array([0.5, 1.0, 2.0])
+    ensemble = HarmonicOscillator(omega=omegas, x0=1.0, v0=0.0)
+    integrator = build_integrator({"name": "rk4"})
+    dt = 0.01
+    state = ensemble.initial_state()
+    assert state.shape == (3, 2)
+    members = [HarmonicOscillator(omega=w, x0=1.0, v0=0.0) for w in omegas]
+    member_states = [member.initial_state() for member in members]
+    for step in range(100):
+        state = integrator.step(state, step * dt, dt, ensemble.derivative)
+        member_states = [
+            integrator.step(s, step * dt, dt, m.derivative) for s, m in zip(member_states, members)
+        ]
+
+    assert np.allclose(state, np.stack(member_states), rtol=0, atol=1e-14)
+
+
+def test_rk45_dense_output_matches_exact():
+    model = HarmonicOscillator(omega=1.0, x0=1.0, v0=0.0)
+    integrator = build_integrator({"name": "rk45", "rtol": 1e-8, "atol": 1e-10})
+    t_eval = np.linspace(0.0, 10.0, 101)
+    solution = integrator.solve(model.initial_state(), 0.0, t_eval, model.derivative)
+
+    assert np.allclose(solution.states[:, 0], np.cos(t_eval), atol=1e-6)
+    assert np.allclose(solution.states[:, 1], -np.sin(t_eval), atol=1e-6)
+    # Fixed-step RK4 needs ~4000 evaluations (dt=0.01) for comparable accuracy.
+    assert solution.n_evals < 1500
+
+
+def _max_energy_error(name, dt, steps):
+    model = HarmonicOscillator(omega=1.0, x0=1.0, v0=0.0)
+    integrator = build_integrator({"name": name})
+    state = model.initial_state()
+    worst = 0.0
+    for step in range(steps):
+        state = integrator.step(state, step * dt, dt, model.derivative)
+        worst = max(worst, abs(energy_harmonic(state, 1.0) - 0.5))
+    return worst
+
+
+def test_symplectic_energy_error_is_bounded():
+    # Energy error of a symplectic method oscillates instead of accumulating.
+    assert _max_energy_error("verlet", 0.1, 2000) < 2e-3
+    assert _max_energy_error("verlet", 0.1, 10000) < 2e-3
+    assert _max_energy_error("yoshida4", 0.5, 2000) < 5e-3
+    assert _max_energy_error("rk4", 0.5, 2000) > 10 * _max_energy_error("yoshida6", 0.5, 2000)
+
+
+@pytest.mark.parametrize("name", ["rk4", "verlet", "yoshida4"])
+def test_inplace_integrators_bitwise_match(name):
+    model = HarmonicOscillator(omega=np.array([0.5, 1.0, 3.0]), x0=1.0, v0=0.25)
+    reference = build_integrator({"name": name})
+    inplace = build_integrator({"name": name}, inplace=True)
+    expected = model.initial_state()
+    state = model.initial_state()
+    for step in range(50):
+        expected = reference.step(expected, step * 0.1, 0.1, model.derivative)
+        result = inplace.step(state, step * 0.1, 0.1, model.derivative)
+        assert result is state
+    assert np.array_equal(state, expected)
+
+
+def test_advance_matches_stepping_and_records_samples():
+    model = HarmonicOscillator(omega=1.0, x0=1.0, v0=0.0)
+    integrator = build_integrator({"name": "rk4"})
+    state = model.initial_state()
+    expected = []
+    for step in range(25):
+        state = integrator.step(state, step * 0.01, 0.01, model.derivative)
+        expected.append(state)
+
+    final, samples = integrator.advance(
+        model.initial_state(), 0.0, 0.01, 25, model.derivative, record_every=10
+    )
+    assert np.array_equal(final, expected[-1])
+    assert samples.shape == (2, 2)
+    assert np.array_equal(samples, [expected[9], expected[19]])
+
+
+def test_linear_propagator_matches_stepping_and_exact_solution():
+    model = HarmonicOscillator(omega=np.array([0.5, 1.0, 2.0]), x0=1.0, v0=0.0)
+    integrator = build_integrator({"name": "rk4"})
+    stepped, stepped_samples = integrator.advance(
+        model.initial_state(), 0.0, 0.01, 1000, model.derivative, record_every=100
+    )
+    propagator = build_linear_propagator(model, integrator, 0.01)
+    state, samples = propagator.advance(
+        model.initial_state(), 0.0, 0.01, 1000, model.derivative, record_every=100
+    )
+    assert np.allclose(state, stepped, rtol=0, atol=1e-12)
+    assert np.allclose(samples, stepped_samples, rtol=0, atol=1e-12)
+
+    exact = build_linear_propagator(model, integrator, 0.01, exact=True)
+    state, _ = exact.advance(model.initial_state(), 0.0, 0.01, 1000, model.derivative)
+    assert np.allclose(state[:, 0], np.cos(model.omega * 10.0), atol=1e-12)
+
+
+def test_linear_propagator_skips_multistep_and_parareal():
+    model = HarmonicOscillator(omega=1.0, x0=1.0, v0=0.0)
+    for config in ({"name": "bdf2"}, {"name": "parareal", "workers": 1}, {"name": "rk45"}):
+        assert not build_integrator(config).one_step
+        assert build_linear_propagator(model, build_integrator(config), 0.01) is None
+    for name in ("euler", "rk4", "euler_cromer", "yoshida4"):
+        for inplace in (False, True):
+            assert build_integrator({"name": name}, inplace=inplace).one_step
+    assert build_linear_propagator(model, build_integrator({"name": "rk4"}), 0.01) is not None
+
+
+def test_parareal_matches_serial_fine_solution():
+    model = HarmonicOscillator(omega=np.array([0.5, 1.0, 2.0]), x0=1.0, v0=0.0)
+    serial, serial_samples = build_integrator({"name": "rk4"}).advance(
+        model.initial_state(), 0.0, 0.01, 2000, model.derivative, record_every=100
+    )
+    for workers in (1, 2):
+        parareal = build_integrator({"name": "parareal", "slices": 8, "workers": workers})
+        state, samples = parareal.advance(
+            model.initial_state(), 0.0, 0.01, 2000, model.derivative, record_every=100
+        )
+        parareal.close()
+        assert np.allclose(state, serial, rtol=0, atol=1e-8)
+        assert np.allclose(samples, serial_samples, rtol=0, atol=1e-8)
+        assert parareal.stats["iterations"] < 8
+
+
+def test_parareal_reuses_its_pool_across_chunks():
+    model = HarmonicOscillator(omega=1.0, x0=1.0, v0=0.0)
+    parareal = build_integrator({"name": "parareal", "slices": 4, "workers": 2})
+    state, _ = parareal.advance(model.initial_state(), 0.0, 0.01, 200, model.derivative)
+    pool = parareal._pool
+    parareal.advance(state, 2.0, 0.01, 200, model.derivative)
+    assert pool is not None and parareal._pool is pool
+    parareal.close()
+
+
+def test_float32_precision_keeps_state_dtype():
+    config = {"name": "harmonic_oscillator", "omega": [0.5, 1.0, 2.0], "x0": 1.0}
+    runs = {}
+    for name in ("float64", "float32"):
+        model = build_model(config, precision=get_precision(name))
+        state = model.initial_state()
+        rk4 = build_integrator({"name": "rk4"})
+        for integrator in (rk4, build_linear_propagator(model, rk4, 0.01)):
+            state, samples = integrator.advance(
+                state, 0.0, 0.01, 100, model.derivative, record_every=10
+            )
+            assert state.dtype == samples.dtype == np.dtype(name)
+        runs[name] = samples
+    drift = precision_drift(runs["float64"], runs["float32"])
+    assert 0.0 < drift["max_rel_error"] < 1e-5
+
+
+def test_inplace_rk4_reuses_pooled_buffers():
+    model = HarmonicOscillator(omega=np.array([0.5, 1.0, 2.0]), x0=1.0, v0=0.0)
+    pool = BufferPool()
+    integrator = build_integrator({"name": "rk4"}, inplace=True, pool=pool)
+    reference = build_integrator({"name": "rk4"})
+    state, expected = model.initial_state(), model.initial_state()
+    for chunk in range(3):
+        state, samples = integrator.advance(
+            state, chunk, 0.01, 100, model.derivative, record_every=50
+        )
+        expected, expected_samples = reference.advance(
+            expected, chunk, 0.01, 100, model.derivative, record_every=50
+        )
+        assert np.array_equal(samples, expected_samples)
+        pool.release(samples)
+    assert np.array_equal(state, expected)
+    assert pool.stats["allocations"] == 3  # stages, stage state, samples
+    assert pool.stats["reuses"] == 2
+    with pool.scoped((2, 3), count=2) as (first, second):
+        assert first is not second and pool.in_use == 4
+    assert pool.in_use == 2
@@ -1,9 +1,87 @@
+from pathlib import Path
+
 import numpy as np
+import pytest
+
+from tz.metrics import (
+    curvature_scalar,
+    energy_harmonic,
+    grid_laplacian,
+    node_entropy,
+    stream_node_entropy,
+)
+from tz.models import build_field
+from tz.models.lattice import MetricLattice
+from tz.models.tables import tabulate
 
-from tz.metrics import energy_harmonic
+PHASE2_WIJ = Path(__file__).resolve().parents[1] / "legacy" / "refs" / "phase2_wij.npy"
+LEGACY_SIM = Path(__file__).resolve().parents[1] / "legacy" / "sim"
 
 
 def test_energy_harmonic():
     state = np.array([2.0, 3.0])
     energy = energy_harmonic(state, omega=2.0)
     assert np.isclose(energy, 0.5 * (3.0**2 + (2.0 * 2.0) ** 2))
+
+
+def test_energy_harmonic_ensemble():
+    state = np.array([[2.0, 3.0], [1.0, 0.0]])
+    energy = energy_harmonic(state, omega=np.array([2.0, 1.0]))
+    assert np.allclose(energy, [0.5 * (3.0**2 + 4.0**2), 0.5])
+
+
+def test_stream_node_entropy_matches_dense(tmp_path):
+    rng = np.random.default_rng(0)
+    weights = rng.uniform(0.0, 1.0, (300, 257))
+    weights[weights < 0.3] = 0.0
+    path = tmp_path / "wij.npy"
+    np.save(path, weights)
+    dense = node_entropy(weights)
+    for budget in (1, 10_000, 1 << 20):
+        assert np.array_equal(stream_node_entropy(path, memory_budget=budget), dense)
+    if PHASE2_WIJ.exists():
+        wij = np.load(PHASE2_WIJ)
+        assert np.array_equal(
+            stream_node_entropy(PHASE2_WIJ, memory_budget=4096), node_entropy(wij)
+        )
+
+
+def test_stream_node_entropy_sparse():
+    sp = pytest.importorskip("scipy.sparse")
+    weights = sp.random(300, 257, density=0.05, random_state=1, format="csr")
+    dense = node_entropy(weights.toarray())
+    assert np.allclose(stream_node_entropy(weights, memory_budget=4096), dense, rtol=1e-12)
+    exact = stream_node_entropy(weights, memory_budget=4096, exact=True)
+    assert np.array_equal(exact, dense)
+
+
+class _FieldOnly:
+    """A field without an analytic Laplacian, to exercise the stencil fallback."""
+
+    def __init__(self, field):
+        self.field = field.field
+
+
+def test_curvature_scalar_matches_legacy(monkeypatch):
+    monkeypatch.syspath_prepend(str(LEGACY_SIM))
+    from backend import Backend
+    from physics import Physics
+
+    positions = np.random.default_rng(2).uniform(0.0, 1.0, (5000, 2))
+    legacy = Physics(Backend(), sigma=0.1).curvature_scalar(positions)
+    well = build_field({"name": "gaussian", "center": [0.5, 0.5], "sigma": 0.1})
+    stencil = curvature_scalar(_FieldOnly(well), positions, block_size=1000)
+    assert np.allclose(stencil, legacy, rtol=0, atol=1e-10)
+    # The closed form differs from the legacy differences by their truncation error.
+    analytic = curvature_scalar(well, positions)
+    assert np.allclose(analytic, legacy, rtol=0, atol=1e-2)
+    table = tabulate(well, [(0.0, 1.0), (0.0, 1.0)], (512, 512))
+    assert np.allclose(curvature_scalar(table, positions), analytic, rtol=0, atol=1e-2)
+
+
+def test_grid_laplacian_matches_lattice_stencil():
+    lattice = MetricLattice(size=12, dx=0.5)
+    g = np.random.default_rng(3).normal(size=(12, 12, 12))
+    assert np.allclose(grid_laplacian(g, lattice.dx), lattice.laplacian(g), rtol=0, atol=1e-12)
+    single = grid_laplacian(g.astype(np.float32), lattice.dx)
+    assert single.dtype == np.float32
@@ -0,0 +1,51 @@
+import numpy as np
+
+from tz.integrators import build_integrator
+from tz.models import build_force_solver, build_model
+from tz.models.mesh import ParticleMesh
+from tz.models.nbody import BarnesHut, DirectSum
+
+
+def test_barnes_hut_matches_direct_sum():
+    for dim in (2, 3):
+        model = build_model({"name": "nbody", "n_particles": 2000, "dim": dim, "seed": 4})
+        positions = model.initial_state()[:, :dim]
+        exact = DirectSum(softening=1e-3).accelerations(positions, model.masses)
+        opened = BarnesHut(theta=0.0, softening=1e-3).accelerations(positions, model.masses)
+        assert np.allclose(opened, exact, rtol=1e-10, atol=0.0)
+
+        approx = BarnesHut(theta=0.5, softening=1e-3).accelerations(positions, model.masses)
+        error = np.linalg.norm(approx - exact, axis=1) / np.linalg.norm(exact, axis=1)
+        assert np.median(error) < 1e-2
+
+
+def test_nbody_leapfrog_conserves_momentum():
+    model = build_model(
+        {"name": "nbody", "n_particles": 300, "dim": 2, "seed": 5, "solver": {"softening": 0.05}}
+    )
+    integrator = build_integrator({"name": "verlet"})
+    state, _ = integrator.advance(model.initial_state(), 0.0, 0.01, 50, model.derivative)
+    assert np.isfinite(state).all()
+    assert model.observables(state)["momentum"] < 1e-3
+
+
+def test_particle_mesh_forces():
+    model = build_model({"name": "nbody", "n_particles": 3000, "dim": 2, "seed": 6})
+    positions, masses = model.initial_state()[:, :2], model.masses
+    solver = build_force_solver({"name": "particle_mesh", "cells": 256, "softening": 0.05})
+    approx = solver.accelerations(positions, masses)
+    exact = DirectSum(softening=0.05).accelerations(positions, masses)
+    error = np.linalg.norm(approx - exact, axis=1) / np.linalg.norm(exact, axis=1)
+    assert np.median(error) < 1e-2
+    assert np.allclose(masses @ approx, 0.0, atol=1e-12)
+
+    # A density wave rho = 1 + eps cos(k x) on the nodes of a periodic box.
+    cells, length, eps = 32, 2.0, 0.1
+    axis = np.arange(cells) * length / cells
+    nodes = np.stack([grid.ravel() for grid in np.meshgrid(axis, axis, indexing="ij")], axis=1)
+    wave = 2 * np.pi / length
+    masses = (1 + eps * np.cos(wave * nodes[:, 0])) * (length / cells) ** 2
+    periodic = ParticleMesh(cells=cells, box=(0.0, length), periodic=True)
+    accelerations = periodic.accelerations(nodes, masses)
+    assert np.allclose(accelerations[:, 0], -4 * np.pi * eps * np.sin(wave * nodes[:, 0]) / wave)
+    assert np.allclose(accelerations[:, 1], 0.0)
@@ -0,0 +1,158 @@
+import os
+import signal
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from experiments.run import model_advance
+from tz.integrators import build_integrator
+from tz.models import build_field, build_model
+from tz.parallel import ChunkedAdvance, SlabDecomposition
+
+LEGACY_SIM = Path(__file__).resolve().parents[1] / "legacy" / "sim"
+
+
+def test_entropy_well_matches_legacy_phase3(monkeypatch):
+    monkeypatch.syspath_prepend(str(LEGACY_SIM))
+    from backend import Backend
+    from integrators import Integrator
+    from physics import Physics
+
+    model = build_model({"name": "entropy_well", "n_particles": 500, "seed": 3})
+    state = model.initial_state()
+    positions, velocities = state[:, :2].copy(), state[:, 2:].copy()
+    backend = Backend()
+    legacy = Integrator(backend, Physics(backend, sigma=0.1), dt=0.01)
+    for _ in range(50):
+        positions, velocities = legacy.step(positions, velocities)
+
+    final, samples = model.advance(state, 0.0, 0.01, 50, model.derivative, record_every=25)
+    assert samples.shape == (2, 500, 4)
+    assert np.allclose(final[:, :2], positions, rtol=0, atol=1e-10)
+    assert np.allclose(final[:, 2:], velocities, rtol=0, atol=1e-10)
+    assert np.all((final[:, :2] >= 0.0) & (final[:, :2] <= 1.0))
+
+
+def test_multi_well_cutoff_matches_all_pairs():
+    rng = np.random.default_rng(0)
+    config = {
+        "name": "multi_well",
+        "centers": rng.uniform(0.0, 1.0, (200, 2)).tolist(),
+        "sigmas": rng.uniform(0.01, 0.03, 200).tolist(),
+        "strengths": rng.uniform(0.5, 1.0, 200).tolist(),
+    }
+    culled = build_field({**config, "cutoff": 6.0})
+    exact = build_field({**config, "cutoff": 0.0})
+    positions = rng.uniform(-0.1, 1.1, (20000, 2))
+    assert np.allclose(culled.field(positions), exact.field(positions), rtol=0, atol=1e-7)
+    assert np.allclose(culled.gradient(positions), exact.gradient(positions), rtol=0, atol=1e-4)
+
+    sources = [{"center": [0.3, 0.5], "sigma": 0.05}]
+    one = build_field({"name": "multi_well", "sources": sources, "cutoff": 0.0})
+    single = build_field({"name": "gaussian", "center": [0.3, 0.5], "sigma": 0.05})
+    assert np.allclose(one.gradient(positions), single.gradient(positions), rtol=0, atol=1e-12)
+
+
+def test_field_table_interpolates_and_caches(tmp_path):
+    config = {
+        "name": "gaussian",
+        "sigma": 0.1,
+        "table": {"shape": [513, 513], "cache_dir": tmp_path},
+    }
+    table = build_field(config)
+    assert len(list(tmp_path.glob("*.npy"))) == 2
+    cached = build_field(config)
+    assert isinstance(cached.gradients, np.memmap)
+
+    exact = build_field({"name": "gaussian", "sigma": 0.1})
+    positions = np.random.default_rng(1).uniform(0.0, 1.0, (5000, 2))
+    scale = np.abs(exact.gradient(positions)).max()
+    assert np.allclose(table.field(positions), exact.field(positions), rtol=0, atol=1e-4)
+    assert np.allclose(cached.gradient(positions), exact.gradient(positions), atol=1e-3 * scale)
+
+
+def test_field_particles_gather_matches_verlet_stepping():
+    for scheme in ("nearest", "linear"):
+        field = {"name": "metric_lattice", "size": 16, "dtype": "float32", "scheme": scheme}
+        config = {"name": "field_particles", "n_particles": 400, "field": field, "seed": 2}
+        model = build_model({**config, "box": [0.0, 16.0], "force_scale": 40.0})
+        # Node positions sample the tabulated gradients exactly under either scheme.
+        nodes = np.full((1, 3), 5.5)
+        assert np.allclose(model.field.gradient(nodes), model.field.gradients[5, 5, 5])
+
+        integrator = build_integrator({"name": "verlet"}, inplace=True)
+        expected, expected_samples = integrator.advance(
+            model.initial_state(), 0.0, 0.1, 30, model.derivative, record_every=10
+        )
+        state, samples = model.advance(
+            model.initial_state(), 0.0, 0.1, 30, model.derivative, record_every=10
+        )
+        assert np.array_equal(state, expected)
+        assert np.array_equal(samples, expected_samples)
+        assert not np.allclose(state, model.initial_state())
+
+
+def test_threaded_chunks_match_serial_stepping():
+    model = build_model({"name": "entropy_well", "n_particles": 1001, "seed": 5})
+    state = model.initial_state()
+    serial = model.advance(state.copy(), 0.0, 0.01, 20, model.derivative, record_every=5)
+    threaded = ChunkedAdvance([model.advance] * 3, workers=3).advance(
+        state.copy(), 0.0, 0.01, 20, model.derivative, record_every=5
+    )
+    assert all(np.array_equal(a, b) for a, b in zip(serial, threaded))
+    integrators = [build_integrator({"name": "rk4"}, inplace=True) for _ in range(2)]
+    rk4 = ChunkedAdvance([integrator.advance for integrator in integrators], workers=2)
+    final, _ = rk4.advance(state.copy(), 0.0, 0.01, 5, model.derivative)
+    expected, _ = build_integrator({"name": "rk4"}).advance(state, 0.0, 0.01, 5, model.derivative)
+    assert np.array_equal(final, expected)
+
+
+def test_slab_decomposition_matches_serial_stepping():
+    model = build_model({"name": "entropy_well", "n_particles": 2000, "seed": 6, "max_speed": 1.0})
+    state = model.initial_state()
+    serial = model.advance(state.copy(), 0.0, 0.01, 12, model.derivative, record_every=2)
+    slabs = SlabDecomposition(model.advance, box=model.box, workers=2, exchange_every=4)
+    try:
+        final, samples = slabs.advance(
+            state.copy(), 0.0, 0.01, 12, model.derivative, record_every=2
+        )
+    finally:
+        slabs.close()
+    assert np.array_equal(final, serial[0]) and np.array_equal(samples, serial[1])
+    assert slabs.stats["exchanges"] == 2 and slabs.stats["migrated_particles"] > 0
+
+
+def test_slab_decomposition_survives_restarts_and_dead_workers():
+    model = build_model({"name": "entropy_well", "n_particles": 2000, "seed": 6, "max_speed": 1.0})
+    larger = build_model({"name": "entropy_well", "n_particles": 3000, "seed": 7, "max_speed": 1.0})
+    counts = []
+    for states in ([model.initial_state()], [larger.initial_state()]):
+        single = SlabDecomposition(model.advance, box=model.box, workers=2, exchange_every=4)
+        try:
+            single.advance(states[0], 0.0, 0.01, 12, model.derivative)
+        finally:
+            single.close()
+        counts.append(single.stats["migrated_particles"])
+    slabs = SlabDecomposition(model.advance, box=model.box, workers=2, exchange_every=4)
+    try:
+        slabs.advance(model.initial_state(), 0.0, 0.01, 12, model.derivative)
+        # A new state size restarts the workers; earlier migrations still count.
+        slabs.advance(larger.initial_state(), 0.0, 0.01, 12, model.derivative)
+        assert slabs.stats["migrated_particles"] == sum(counts)
+
+        os.kill(slabs._processes[0].pid, signal.SIGKILL)
+        with pytest.raises(RuntimeError, match="exit codes"):
+            slabs.advance(larger.initial_state(), 0.0, 0.01, 12, model.derivative)
+    finally:
+        slabs.close()
+
+
+def test_model_advance_only_replaces_its_own_scheme():
+    entropy = build_model({"name": "entropy_well", "n_particles": 10, "seed": 1})
+    particles = build_model({"name": "field_particles", "n_particles": 10, "seed": 1})
+    assert model_advance(entropy, build_integrator({"name": "euler_cromer"})) == entropy.advance
+    assert model_advance(entropy, build_integrator({"name": "euler"})) is None
+    assert model_advance(particles, build_integrator({"name": "leapfrog"})) == particles.advance
+    for name in ("rk4", "yoshida4"):
+        assert model_advance(particles, build_integrator({"name": name}, inplace=True)) is None
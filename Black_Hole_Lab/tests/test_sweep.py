@@ -0,0 +1,106 @@
+import json
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+from experiments.sweep import expand_points, point_configs, run_sweep
+
+
+def test_expand_points_grid_zip_and_random():
+    parameters = {"integrator.dt": [0.01, 0.005], "model.omega": [0.5, 1.0, 2.0]}
+    grid = expand_points(parameters)
+    assert len(grid) == 6
+    assert grid[1] == {"integrator.dt": 0.01, "model.omega": 1.0}
+
+    sampled = expand_points(parameters, mode="random", samples=4, seed=3)
+    assert len(sampled) == 4
+    assert all(point in grid for point in sampled)
+    assert sampled == sorted(sampled, key=grid.index)
+
+    zipped = expand_points({"a": [1, 2], "b": [3, 4]}, mode="zip")
+    assert zipped == [{"a": 1, "b": 3}, {"a": 2, "b": 4}]
+    with pytest.raises(ValueError):
+        expand_points({"a": [1, 2], "b": [3]}, mode="zip")
+
+
+def test_point_configs_set_dotted_keys_without_touching_base():
+    base = {"name": "baseline", "model": {"name": "harmonic_oscillator", "omega": 1.0}}
+    configs = point_configs(base, [{"model.omega": 2.0, "integrator.dt": 0.1}], "sweep")
+    assert configs[0]["name"] == "sweep_0000"
+    assert configs[0]["model"] == {"name": "harmonic_oscillator", "omega": 2.0}
+    assert configs[0]["integrator"] == {"dt": 0.1}
+    assert base["model"]["omega"] == 1.0
+
+
+def test_fused_sweep_points_match_separate_runs(tmp_path, monkeypatch):
+    monkeypatch.setattr("tz.db.api.DB_PATH", tmp_path / "findings.sqlite")
+    base = {
+        "name": "scan",
+        "seed": 0,
+        "precision": "float32",
+        "model": {"name": "harmonic_oscillator", "omega": 1.0, "x0": 1.0, "v0": 0.0},
+        "integrator": {"name": "rk4", "dt": 0.01, "steps": 50, "linear": False},
+        "metrics": {"record_every": 5},
+    }
+    (tmp_path / "base.yaml").write_text(yaml.safe_dump(base))
+    sweep = {"base": "base.yaml", "parameters": {"model.omega": [0.5, 1.0, 2.0]}}
+    (tmp_path / "scan.yaml").write_text(yaml.safe_dump(sweep))
+
+    separate = run_sweep(tmp_path / "scan.yaml", workers=1, outdir=tmp_path / "separate")
+    fused = run_sweep(tmp_path / "scan.yaml", workers=1, outdir=tmp_path / "fused", fuse=True)
+    assert (separate["runs"], fused["runs"]) == (3, 1)
+    for alone, member in zip(separate["points"], fused["points"]):
+        assert member["status"] == "completed" and member["fused_group"] == 0
+        trajectories = [
+            np.load(Path(point["run_dir"]) / "artifacts" / "trajectory.npz")["trajectory"]
+            for point in (alone, member)
+        ]
+        np.testing.assert_allclose(*trajectories, rtol=1e-12, atol=1e-12)
+        metrics = [
+            (Path(point["run_dir"]) / "metrics.csv").read_text().splitlines()
+            for point in (alone, member)
+        ]
+        assert metrics[0][0] == metrics[1][0]
+        assert [row.split(",")[:5] for row in metrics[0]] == [
+            row.split(",")[:5] for row in metrics[1]
+        ]
+        assert all(row.endswith(",") for row in metrics[1][1:])  # no per-member step time
+        summaries = [
+            json.loads((Path(point["run_dir"]) / "summary.json").read_text())
+            for point in (alone, member)
+        ]
+        assert summaries[1]["fused"]["members"] == 3 and "memory_peak_bytes" not in summaries[1]
+        assert "runtime_seconds" not in summaries[1] and "mean_step_ms" not in summaries[1]
+        assert summaries[1]["fused_share_runtime_seconds"] == pytest.approx(
+            summaries[1]["fused"]["runtime_seconds"] / 3
+        )
+        assert summaries[1]["precision_max_rel_error"] == pytest.approx(
+            summaries[0]["precision_max_rel_error"], rel=1e-6
+        )
+
+
+def test_sweep_points_run_on_a_process_pool(tmp_path, monkeypatch):
+    db_path = tmp_path / "findings.sqlite"
+    monkeypatch.setattr("tz.db.api.DB_PATH", db_path)
+    base = {
+        "name": "pool",
+        "model": {"name": "harmonic_oscillator", "omega": 1.0, "x0": 1.0, "v0": 0.0},
+        "integrator": {"name": "rk4", "dt": 0.01, "steps": 20},
+        "metrics": {"record_every": 10},
+    }
+    (tmp_path / "base.yaml").write_text(yaml.safe_dump(base))
+    sweep = {"base": "base.yaml", "parameters": {"model.omega": [0.5, 1.0, 1.5, 2.0]}}
+    (tmp_path / "pool.yaml").write_text(yaml.safe_dump(sweep))
+
+    summary = run_sweep(tmp_path / "pool.yaml", workers=2, outdir=tmp_path / "runs")
+    assert (summary["workers"], summary["runs"], summary["completed"]) == (2, 4, 4)
+    assert [point["index"] for point in summary["points"]] == [0, 1, 2, 3]
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT run_id, value FROM params WHERE key = 'sweep_point' ORDER BY run_id"
+        ).fetchall()
+    assert sorted(run_id for run_id, _ in rows) == sorted(p["run_id"] for p in summary["points"])
+    assert sorted(int(value) for _, value in rows) == [0, 1, 2, 3]
@@ -1,5 +1,7 @@
 """Backend exports."""
 
 from tz.backend.base import ArrayBackend, get_backend
+from tz.backend.pool import BufferPool
+from tz.backend.threaded import ThreadedBackend, ThreadedNamespace
 
-__all__ = ["ArrayBackend", "get_backend"]
+__all__ = ["ArrayBackend", "BufferPool", "ThreadedBackend", "ThreadedNamespace", "get_backend"]
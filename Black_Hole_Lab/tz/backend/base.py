@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Any, Optional, Protocol
 
 import numpy as np
 
+from tz.backend.ops import NamespaceOps, Shape
+from tz.backend.pool import BufferPool
+from tz.backend.threaded import ThreadedBackend
+
 
 class ArrayBackend(Protocol):
-    """Protocol for array backends."""
+    """Protocol for array backends.
+
+    ``xp`` is the array namespace models are built with. The methods cover
+    allocation (including a per-run :class:`BufferPool`), elementwise maths
+    and reductions by NumPy ufunc, and transfer of results back to host
+    NumPy arrays.
+    """
 
     name: str
     xp: object
@@ -17,20 +27,38 @@ class ArrayBackend(Protocol):
     def asarray(self, data, dtype=None):  # noqa: ANN001
         ...
 
+    def empty(self, shape: Shape, dtype: Any = ...) -> Any:
+        ...
+
+    def zeros(self, shape: Shape, dtype: Any = ...) -> Any:
+        ...
+
+    def empty_like(self, array: Any) -> Any:
+        ...
+
+    def buffer_pool(self) -> BufferPool:
+        ...
+
+    def elementwise(self, ufunc: np.ufunc, *inputs: Any, out: Optional[Any] = None) -> Any:
+        ...
+
+    def reduce(self, ufunc: np.ufunc, array: Any, axis: Optional[int] = None) -> Any:
+        ...
+
+    def to_host(self, array: Any) -> np.ndarray:
+        ...
+
 
 @dataclass(frozen=True)
-class NumpyBackend:
+class NumpyBackend(NamespaceOps):
     """Numpy backend implementation."""
 
     name: str = "numpy"
     xp: object = np
 
-    def asarray(self, data, dtype=None):  # noqa: ANN001
-        return np.asarray(data, dtype=dtype)
-
 
 @dataclass(frozen=True)
-class CupyBackend:
+class CupyBackend(NamespaceOps):
     """Cupy backend implementation (optional)."""
 
     name: str = "cupy"
@@ -42,19 +70,20 @@ class CupyBackend:
 
             object.__setattr__(self, "xp", cp)
 
-    def asarray(self, data, dtype=None):  # noqa: ANN001
-        return self.xp.asarray(data, dtype=dtype)
+    def to_host(self, array: Any) -> np.ndarray:
+        return self.xp.asnumpy(array)
 
 
 BACKENDS = {
     "numpy": NumpyBackend,
     "cupy": CupyBackend,
+    "threaded": ThreadedBackend,
 }
 
 
-def get_backend(name: str) -> ArrayBackend:
-    """Return backend instance by name."""
+def get_backend(name: str, **options: Any) -> ArrayBackend:
+    """Return backend instance by name; ``options`` (e.g. ``workers``) go to its constructor."""
     name = name.lower()
     if name not in BACKENDS:
         raise ValueError(f"Unsupported backend: {name}")
-    return BACKENDS[name]()
+    return BACKENDS[name](**options)
@@ -0,0 +1,45 @@
+"""Backend protocol methods shared by backends that forward to an array namespace."""
+
+from __future__ import annotations
+
+from typing import Any, Optional, Tuple, Union
+
+import numpy as np
+
+from tz.backend.pool import BufferPool
+from tz.core.constants import DEFAULT_DTYPE
+
+Shape = Union[int, Tuple[int, ...]]
+
+
+class NamespaceOps:
+    """Allocation, buffer pools, elementwise maths, reductions and host transfer via ``self.xp``."""
+
+    xp: Any
+
+    def asarray(self, data, dtype=None):  # noqa: ANN001
+        return self.xp.asarray(data, dtype=dtype)
+
+    def empty(self, shape: Shape, dtype: Any = DEFAULT_DTYPE) -> Any:
+        return self.xp.empty(shape, dtype=dtype)
+
+    def zeros(self, shape: Shape, dtype: Any = DEFAULT_DTYPE) -> Any:
+        return self.xp.zeros(shape, dtype=dtype)
+
+    def empty_like(self, array: Any) -> Any:
+        return self.xp.empty_like(array)
+
+    def elementwise(self, ufunc: np.ufunc, *inputs: Any, out: Optional[Any] = None) -> Any:
+        """Apply ``ufunc`` (a NumPy ufunc, resolved by name in ``xp``) to ``inputs``."""
+        return getattr(self.xp, ufunc.__name__)(*inputs, out=out)
+
+    def reduce(self, ufunc: np.ufunc, array: Any, axis: Optional[int] = None) -> Any:
+        return getattr(self.xp, ufunc.__name__).reduce(array, axis=axis)
+
+    def buffer_pool(self) -> BufferPool:
+        """A new, empty pool of scratch arrays allocated by this backend."""
+        return BufferPool(xp=self.xp)
+
+    def to_host(self, array: Any) -> np.ndarray:
+        """Copy ``array`` to a host NumPy array (no copy if it is one already)."""
+        return np.asarray(array)
@@ -0,0 +1,225 @@
+"""Multi-threaded CPU backend: large NumPy ufuncs and reductions evaluated in row blocks."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import numpy as np
+
+from tz.backend.ops import NamespaceOps
+from tz.parallel.threads import chunk_bounds, in_pool_thread, run_chunks
+
+# Arrays smaller than this many elements are not worth a thread hand-off.
+MIN_PARALLEL_SIZE = 1 << 16
+_POOL_PREFIX = "tz-array"
+
+
+def _result_dtype(func: Callable[..., Any], inputs: Sequence[Any]) -> np.dtype:
+    """Dtype of ``func(*inputs)``, found from empty slices so no values are computed."""
+    probes = [
+        a if isinstance(a, (int, float, complex)) else np.asarray(a).reshape(-1)[:0] for a in inputs
+    ]
+    return np.asarray(func(*probes)).dtype
+
+
+def _same_view(a: np.ndarray, b: np.ndarray) -> bool:
+    """Whether ``a`` and ``b`` address exactly the same elements (an in-place operation)."""
+    return (
+        a.shape == b.shape
+        and a.strides == b.strides
+        and a.__array_interface__["data"][0] == b.__array_interface__["data"][0]
+    )
+
+
+def _block(value: Any, ndim: int, start: int, stop: int) -> Any:
+    """Rows ``start:stop`` of an input broadcast to ``ndim`` dimensions."""
+    if np.ndim(value) == ndim and np.shape(value)[0] != 1:
+        return value[start:stop]
+    return value
+
+
+def blocked_elementwise(
+    func: Callable[..., Any],
+    inputs: Sequence[Any],
+    out: Optional[np.ndarray],
+    workers: int,
+    min_size: int = MIN_PARALLEL_SIZE,
+    **kwargs: Any,
+) -> np.ndarray:
+    """``func(*inputs, out=out, **kwargs)`` evaluated on row blocks of the broadcast shape.
+
+    Each of ``workers`` threads writes its own rows of ``out``, so the result
+    is bit-identical to one call. Small arrays, outputs that overlap an input
+    other than in place, and calls from pool threads run as one call.
+    """
+    shape = np.broadcast_shapes(*(np.shape(a) for a in inputs))
+    size = int(np.prod(shape))
+    serial = workers <= 1 or size < min_size or len(shape) == 0 or shape[0] < 2
+    if not serial and out is not None:
+        serial = out.shape != shape or any(
+            isinstance(a, np.ndarray) and np.may_share_memory(a, out) and not _same_view(a, out)
+            for a in inputs
+        )
+    if serial or in_pool_thread():
+        return func(*inputs, out=out, **kwargs)
+    if out is None:
+        out = np.empty(shape, dtype=_result_dtype(func, inputs))
+    ndim = len(shape)
+
+    def task(index: int, start: int, stop: int) -> None:  # noqa: ARG001
+        func(*(_block(a, ndim, start, stop) for a in inputs), out=out[start:stop], **kwargs)
+
+    run_chunks(task, chunk_bounds(shape[0], workers), workers, _POOL_PREFIX)
+    return out
+
+
+def blocked_reduce(
+    ufunc: np.ufunc,
+    array: Any,
+    axis: Optional[int],
+    workers: int,
+    min_size: int = MIN_PARALLEL_SIZE,
+) -> Any:
+    """``ufunc.reduce(array, axis)`` from per-row-block partial reductions.
+
+    Reductions along a later axis reduce each row block on its own and are
+    bit-identical to NumPy. Over the rows (``axis`` 0 or None) the block
+    partials are combined at the end: exact for ``maximum``/``minimum``, equal
+    to rounding for sums, whose pairwise order changes.
+    """
+    array = np.asarray(array)
+    if workers <= 1 or array.size < min_size or array.ndim == 0 or in_pool_thread():
+        return ufunc.reduce(array, axis=axis)
+    axis = None if axis is None else axis % array.ndim
+    bounds = chunk_bounds(array.shape[0], workers)
+    if axis not in (None, 0):
+        dtype = ufunc.reduce(array[:1], axis=axis).dtype
+        out = np.empty(np.delete(array.shape, axis), dtype=dtype)
+
+        def rows(index: int, start: int, stop: int) -> None:  # noqa: ARG001
+            ufunc.reduce(array[start:stop], axis=axis, out=out[start:stop])
+
+        run_chunks(rows, bounds, workers, _POOL_PREFIX)
+        return out
+
+    def partial(index: int, start: int, stop: int) -> Any:  # noqa: ARG001
+        return ufunc.reduce(array[start:stop], axis=axis)
+
+    return ufunc.reduce(np.stack(run_chunks(partial, bounds, workers, _POOL_PREFIX)), axis=0)
+
+
+class BlockedUfunc:
+    """A NumPy ufunc whose plain calls run through :func:`blocked_elementwise`.
+
+    Calls with extra keywords (``where``, ``dtype``, ...) and ufunc methods
+    (``reduce``, ``at``, ...) go straight to NumPy.
+    """
+
+    def __init__(self, ufunc: np.ufunc, workers: int, min_size: int) -> None:
+        self.ufunc = ufunc
+        self.workers = workers
+        self.min_size = min_size
+
+    def __call__(self, *inputs: Any, out: Any = None, **kwargs: Any) -> Any:
+        if isinstance(out, tuple):
+            (out,) = out
+        if kwargs or len(inputs) != self.ufunc.nin:
+            return self.ufunc(*inputs, out=out, **kwargs)
+        return blocked_elementwise(self.ufunc, inputs, out, self.workers, self.min_size)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.ufunc, name)
+
+    def __repr__(self) -> str:
+        return f"BlockedUfunc({self.ufunc.__name__})"
+
+
+class ThreadedNamespace:
+    """Drop-in ``numpy`` namespace whose single-output ufuncs, ``clip`` and reductions are threaded.
+
+    Models written against ``xp`` pick it up unchanged; every other name
+    resolves to NumPy itself.
+    """
+
+    def __init__(self, workers: int, min_size: int = MIN_PARALLEL_SIZE) -> None:
+        self.workers = workers
+        self.min_size = min_size
+        self._overrides: Dict[str, Any] = {
+            name: BlockedUfunc(value, workers, min_size)
+            for name, value in vars(np).items()
+            if isinstance(value, np.ufunc) and value.nout == 1
+        }
+        for name, ufunc in (("sum", np.add), ("max", np.maximum), ("min", np.minimum)):
+            self._overrides[name] = self._reduction(getattr(np, name), ufunc)
+        self._overrides["amax"] = self._overrides["max"]
+        self._overrides["amin"] = self._overrides["min"]
+        self._overrides["mean"] = self._mean
+        self._overrides["clip"] = self._clip
+
+    def __getattr__(self, name: str) -> Any:
+        overrides = self.__dict__.get("_overrides", {})
+        return overrides[name] if name in overrides else getattr(np, name)
+
+    def __repr__(self) -> str:
+        return f"ThreadedNamespace(workers={self.workers})"
+
+    def _reduction(self, plain: Callable[..., Any], ufunc: np.ufunc) -> Callable[..., Any]:
+        def reduce(array: Any, axis: Optional[int] = None, *args: Any, **kwargs: Any) -> Any:
+            # Positional ``dtype``/``out`` and keywords go straight to NumPy.
+            if args or kwargs or not isinstance(axis, (int, type(None))):
+                return plain(array, axis, *args, **kwargs)
+            return blocked_reduce(ufunc, array, axis, self.workers, self.min_size)
+
+        reduce.__name__ = plain.__name__
+        return reduce
+
+    def _mean(self, array: Any, axis: Optional[int] = None, **kwargs: Any) -> Any:
+        array = np.asarray(array)
+        if kwargs or array.dtype.kind not in "fc" or not isinstance(axis, (int, type(None))):
+            return np.mean(array, axis=axis, **kwargs)
+        count = array.size if axis is None else array.shape[axis]
+        return blocked_reduce(np.add, array, axis, self.workers, self.min_size) / count
+
+    def _clip(
+        self,
+        a: Any,
+        a_min: Any = None,
+        a_max: Any = None,
+        out: Optional[np.ndarray] = None,
+        **kwargs: Any,
+    ) -> Any:
+        # A missing bound is a one-sided maximum/minimum; keywords go straight to NumPy.
+        if kwargs or (a_min is None and a_max is None):
+            return np.clip(a, a_min, a_max, out=out, **kwargs)
+        if a_min is None:
+            func, inputs = np.minimum, (a, a_max)
+        elif a_max is None:
+            func, inputs = np.maximum, (a, a_min)
+        else:
+            func, inputs = np.clip, (a, a_min, a_max)
+        return blocked_elementwise(func, inputs, out, self.workers, self.min_size)
+
+
+@dataclass(frozen=True)
+class ThreadedBackend(NamespaceOps):
+    """NumPy on the host with large elementwise and reduction work split across threads.
+
+    ``xp`` is a :class:`ThreadedNamespace`, so models built with it thread
+    their ufunc calls without code changes. ``workers`` defaults to every
+    core; arrays below ``min_size`` elements run as plain NumPy.
+    """
+
+    name: str = "threaded"
+    workers: int = 0
+    min_size: int = MIN_PARALLEL_SIZE
+    xp: Any = field(default=None, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "workers", self.workers or os.cpu_count() or 1)
+        if self.xp is None:
+            object.__setattr__(self, "xp", ThreadedNamespace(self.workers, self.min_size))
+
+    def reduce(self, ufunc: np.ufunc, array: Any, axis: Optional[int] = None) -> Any:
+        return blocked_reduce(ufunc, array, axis, self.workers, self.min_size)
@@ -1,6 +1,14 @@
 """Core utilities."""
 
 from tz.core.constants import DEFAULT_DTYPE, DIVERGENCE_THRESHOLD
+from tz.core.precision import PRECISIONS, Precision, get_precision
 from tz.core.seed import set_seed
 
-__all__ = ["DEFAULT_DTYPE", "DIVERGENCE_THRESHOLD", "set_seed"]
+__all__ = [
+    "DEFAULT_DTYPE",
+    "DIVERGENCE_THRESHOLD",
+    "PRECISIONS",
+    "Precision",
+    "get_precision",
+    "set_seed",
+]
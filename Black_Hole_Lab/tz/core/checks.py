@@ -7,7 +7,8 @@ import numpy as np
 
 def ensure_finite(array: np.ndarray, *, name: str) -> None:
     """Raise if an array contains NaN or Inf."""
-    if not np.isfinite(array).all():
+    # max/min propagate NaN and expose infinities without a full-size mask.
+    if array.size and not (np.isfinite(array.max()) and np.isfinite(array.min())):
         raise ValueError(f"{name} contains NaN/Inf values")
 
 
@@ -18,6 +19,7 @@ def ensure_dtype(array: np.ndarray, *, dtype: np.dtype, name: str) -> None:
 
 
 def ensure_stable(array: np.ndarray, *, threshold: float, name: str) -> None:
-    """Raise if an array norm exceeds a divergence threshold."""
-    if np.linalg.norm(array) > threshold:
+    """Raise if an array norm (per member for ensemble states) exceeds a threshold."""
+    # Squared norms via einsum avoid a full-size temporary of squares.
+    if np.sqrt(np.einsum("...i,...i->...", array, array).max()) > threshold:
         raise ValueError(f"{name} diverged beyond threshold {threshold}")
@@ -0,0 +1,42 @@
+"""Run precision modes."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from tz.core.constants import DEFAULT_DTYPE
+
+
+@dataclass(frozen=True)
+class Precision:
+    """Dtypes of a run: ``state`` for the integrated state, ``compute`` for bulk field data.
+
+    ``mixed`` keeps the state, and so every integrator update, in float64
+    while lattices and field tables are stored and streamed in float32.
+    """
+
+    name: str
+    state: np.dtype
+    compute: np.dtype
+
+
+PRECISIONS: Dict[str, Precision] = {
+    "float64": Precision("float64", np.dtype(np.float64), np.dtype(np.float64)),
+    "float32": Precision("float32", np.dtype(np.float32), np.dtype(np.float32)),
+    "mixed": Precision("mixed", np.dtype(np.float64), np.dtype(np.float32)),
+}
+
+REFERENCE_PRECISION = PRECISIONS[np.dtype(DEFAULT_DTYPE).name]
+
+
+def get_precision(name: Optional[Union[str, Precision]]) -> Optional[Precision]:
+    """Return the precision called ``name`` (None when unset)."""
+    if name is None or isinstance(name, Precision):
+        return name
+    key = str(name).lower()
+    if key not in PRECISIONS:
+        raise ValueError(f"Unsupported precision: {name}")
+    return PRECISIONS[key]
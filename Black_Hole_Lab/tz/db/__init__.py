@@ -1,5 +1,5 @@
 """Database package exports."""
 
-from tz.db.api import add_finding, log_metric, log_run, query
+from tz.db.api import add_finding, log_metric, log_metrics, log_run, query
 
-__all__ = ["add_finding", "log_metric", "log_run", "query"]
+__all__ = ["add_finding", "log_metric", "log_metrics", "log_run", "query"]
@@ -6,18 +6,20 @@ import hashlib
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from tz.db.schema import schema_sql
 
 
 DB_PATH = Path(__file__).resolve().parents[2] / "db" / "findings.sqlite"
+# Seconds to wait on a write lock; parallel sweep points share the database.
+BUSY_TIMEOUT = 60.0
 
 
 def connect() -> sqlite3.Connection:
     """Connect to the SQLite database, creating schema if needed."""
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(DB_PATH, timeout=BUSY_TIMEOUT)
     conn.row_factory = sqlite3.Row
     conn.executescript(schema_sql())
     conn.commit()
@@ -80,6 +82,16 @@ def log_metric(run_id: int, step: int, key: str, value: float) -> None:
         conn.commit()
 
 
+def log_metrics(run_id: int, rows: Iterable[Tuple[int, str, float]]) -> None:
+    """Insert many ``(step, key, value)`` metric records in one transaction."""
+    with connect() as conn:
+        conn.executemany(
+            "INSERT INTO metrics (run_id, step, key, value) VALUES (?, ?, ?, ?)",
+            [(run_id, step, key, value) for step, key, value in rows],
+        )
+        conn.commit()
+
+
 def log_artifact(run_id: int, kind: str, path: str, hash_value: str) -> None:
     """Insert artifact record."""
     with connect() as conn:
@@ -2,19 +2,129 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from tz.integrators.base import EulerIntegrator, Integrator, RK4Integrator
+from tz.integrators.adaptive import AdaptiveSolution, DormandPrinceIntegrator
+from tz.integrators.base import (
+    EulerIntegrator,
+    InPlaceEulerIntegrator,
+    InPlaceRK4Integrator,
+    Integrator,
+    RK4Integrator,
+    StepAdvance,
+    accepts_out,
+    advance_steps,
+    explicit_one_step,
+)
+from tz.integrators.implicit import (
+    BackwardEulerIntegrator,
+    BDF2Integrator,
+    JacobianFn,
+    finite_difference_jacobian,
+)
+from tz.integrators.linear import LinearPropagator, build_linear_propagator
+from tz.integrators.parareal import PararealIntegrator
+from tz.integrators.symplectic import (
+    VERLET_WEIGHTS,
+    YOSHIDA4_WEIGHTS,
+    YOSHIDA6_WEIGHTS,
+    ComposedVerletIntegrator,
+    EulerCromerIntegrator,
+    InPlaceComposedVerletIntegrator,
+    split_state,
+)
 
+if TYPE_CHECKING:
+    from tz.backend.pool import BufferPool
 
-def build_integrator(config: Dict[str, Any]) -> Integrator:
-    """Build integrator from config dict."""
+SYMPLECTIC_WEIGHTS = {
+    "verlet": VERLET_WEIGHTS,
+    "yoshida4": YOSHIDA4_WEIGHTS,
+    "yoshida6": YOSHIDA6_WEIGHTS,
+}
+
+
+def build_integrator(
+    config: Dict[str, Any],
+    *,
+    inplace: bool = False,
+    jacobian: Optional[JacobianFn] = None,
+    sparsity: Any = None,
+    pool: Optional[BufferPool] = None,
+) -> Integrator:
+    """Build integrator from config dict.
+
+    With ``inplace=True`` integrators that have an allocation-free variant
+    return it; those update the state in place and need ``derivative(..., out=)``.
+    Implicit integrators use ``jacobian`` when given, else finite differences
+    compressed by the optional ``sparsity`` pattern. ``parareal`` wraps the
+    ``fine`` and ``coarse`` sub-configs, each built by this function. In-place
+    integrators take their workspaces and chunk samples from ``pool``.
+    """
     name = config.get("name", "rk4")
+    if name == "parareal":
+        options = dict(inplace=inplace, jacobian=jacobian, sparsity=sparsity)
+        return PararealIntegrator(
+            fine=build_integrator(config.get("fine", {"name": "rk4"}), **options),
+            coarse=build_integrator(config.get("coarse", {"name": "rk4"}), **options),
+            slices=int(config.get("slices", 0)),
+            workers=int(config.get("workers", 0)),
+            coarse_ratio=int(config.get("coarse_ratio", 10)),
+            tol=float(config.get("tol", 1e-9)),
+            max_iterations=int(config.get("max_iterations", 0)),
+        )
     if name == "euler":
-        return EulerIntegrator()
+        return InPlaceEulerIntegrator(pool=pool) if inplace else EulerIntegrator()
+    if name == "euler_cromer":
+        return EulerCromerIntegrator()
     if name == "rk4":
-        return RK4Integrator()
+        return InPlaceRK4Integrator(pool=pool) if inplace else RK4Integrator()
+    if name in ("velocity_verlet", "leapfrog"):
+        name = "verlet"
+    if name in SYMPLECTIC_WEIGHTS:
+        if inplace:
+            return InPlaceComposedVerletIntegrator(
+                weights=SYMPLECTIC_WEIGHTS[name], name=name, pool=pool
+            )
+        return ComposedVerletIntegrator(weights=SYMPLECTIC_WEIGHTS[name], name=name)
+    if name in ("backward_euler", "bdf2"):
+        cls = BackwardEulerIntegrator if name == "backward_euler" else BDF2Integrator
+        return cls(
+            jacobian=jacobian,
+            sparsity=sparsity,
+            newton_tol=float(config.get("newton_tol", 1e-10)),
+            max_newton_iter=int(config.get("max_newton_iter", 8)),
+        )
+    if name in ("rk45", "dopri5"):
+        return DormandPrinceIntegrator(
+            rtol=float(config.get("rtol", 1e-6)),
+            atol=float(config.get("atol", 1e-9)),
+            max_steps=int(config.get("max_steps", 1_000_000)),
+        )
     raise ValueError(f"Unknown integrator {name}")
 
 
-__all__ = ["build_integrator", "EulerIntegrator", "Integrator", "RK4Integrator"]
+__all__ = [
+    "build_integrator",
+    "AdaptiveSolution",
+    "BackwardEulerIntegrator",
+    "BDF2Integrator",
+    "ComposedVerletIntegrator",
+    "DormandPrinceIntegrator",
+    "EulerCromerIntegrator",
+    "EulerIntegrator",
+    "InPlaceComposedVerletIntegrator",
+    "InPlaceEulerIntegrator",
+    "InPlaceRK4Integrator",
+    "LinearPropagator",
+    "Integrator",
+    "PararealIntegrator",
+    "RK4Integrator",
+    "StepAdvance",
+    "accepts_out",
+    "advance_steps",
+    "build_linear_propagator",
+    "explicit_one_step",
+    "finite_difference_jacobian",
+    "split_state",
+]
@@ -0,0 +1,165 @@
+"""Adaptive-step integrators."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import ClassVar
+
+import numpy as np
+
+from tz.integrators.base import DerivativeFn, StepAdvance
+
+# Dormand–Prince 5(4) tableau.
+_C = np.array([0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0])
+_A = [
+    np.array([]),
+    np.array([1 / 5]),
+    np.array([3 / 40, 9 / 40]),
+    np.array([44 / 45, -56 / 15, 32 / 9]),
+    np.array([19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729]),
+    np.array([9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656]),
+]
+_B = np.array([35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0.0])
+# Difference between the 5th and embedded 4th order weights.
+_E = np.array([-71 / 57600, 0.0, 71 / 16695, -71 / 1920, 17253 / 339200, -22 / 525, 1 / 40])
+# Coefficients of the 4th-order continuous extension in powers of theta.
+_P = np.array(
+    [
+        [1.0, -8048581381 / 2820520608, 8663915743 / 2820520608, -12715105075 / 11282082432],
+        [0.0, 0.0, 0.0, 0.0],
+        [0.0, 131558114200 / 32700410799, -68118460800 / 10900136933, 87487479700 / 32700410799],
+        [0.0, -1754552775 / 470086768, 14199869525 / 1410260304, -10690763975 / 1880347072],
+        [
+            0.0,
+            127303824393 / 49829197408,
+            -318862633887 / 49829197408,
+            701980252875 / 199316789632,
+        ],
+        [0.0, -282668133 / 205662961, 2019193451 / 616988883, -1453857185 / 822651844],
+        [0.0, 40617522 / 29380423, -110615467 / 29380423, 69997945 / 29380423],
+    ]
+)
+
+
+@dataclass
+class AdaptiveSolution:
+    """States sampled at requested times plus solver statistics."""
+
+    times: np.ndarray
+    states: np.ndarray
+    n_accepted: int
+    n_rejected: int
+    n_evals: int
+
+
+@dataclass(frozen=True)
+class DormandPrinceIntegrator(StepAdvance):
+    """Embedded RK45 (Dormand–Prince) with error control and dense output.
+
+    The error norm is an RMS over every component (all members of an ensemble
+    share one step size). Samples between accepted steps come from the 4th-order
+    continuous extension, so recording times never shorten the step.
+    """
+
+    rtol: float = 1e-6
+    atol: float = 1e-9
+    safety: float = 0.9
+    min_factor: float = 0.2
+    max_factor: float = 10.0
+    max_steps: int = 1_000_000
+    name: str = "rk45"
+    stages: int = 7
+    one_step: ClassVar[bool] = False
+
+    def step(self, state: np.ndarray, time: float, dt: float, deriv: DerivativeFn) -> np.ndarray:
+        """Advance ``state`` by ``dt`` using as many adaptive substeps as needed."""
+        return self.solve(state, time, np.array([time + dt]), deriv, dt0=dt).states[-1]
+
+    def solve(
+        self,
+        state: np.ndarray,
+        time: float,
+        t_eval: np.ndarray,
+        deriv: DerivativeFn,
+        *,
+        dt0: float | None = None,
+    ) -> AdaptiveSolution:
+        """Integrate from ``time`` to ``t_eval[-1]``, sampling at each of ``t_eval``."""
+        t_eval = np.asarray(t_eval, dtype=float)
+        if t_eval.ndim != 1 or np.any(np.diff(t_eval) < 0) or (t_eval.size and t_eval[0] < time):
+            raise ValueError("t_eval must be a non-decreasing 1D array starting at or after time")
+        samples = np.empty((t_eval.size, *state.shape), dtype=state.dtype)
+        t_end = float(t_eval[-1]) if t_eval.size else time
+        next_sample = 0
+        while next_sample < t_eval.size and t_eval[next_sample] <= time:
+            samples[next_sample] = state
+            next_sample += 1
+
+        stages = np.empty((7, *state.shape), dtype=state.dtype)
+        stages[0] = deriv(state, time)
+        n_evals = 1
+        if dt0:
+            dt = dt0
+        else:
+            dt = self._initial_step(state, time, stages[0], deriv)
+            n_evals += 1
+        n_accepted = n_rejected = 0
+
+        while time < t_end:
+            if n_accepted + n_rejected >= self.max_steps:
+                raise RuntimeError(f"{self.name} exceeded max_steps={self.max_steps}")
+            last = dt >= t_end - time
+            if last:
+                dt = t_end - time
+            for i in range(1, 6):
+                stage_state = state + dt * np.tensordot(_A[i], stages[:i], axes=1)
+                stages[i] = deriv(stage_state, time + _C[i] * dt)
+            new_state = state + dt * np.tensordot(_B[:6], stages[:6], axes=1)
+            stages[6] = deriv(new_state, time + dt)
+            n_evals += 6
+
+            error = dt * np.tensordot(_E, stages, axes=1)
+            scale = self.atol + self.rtol * np.maximum(np.abs(state), np.abs(new_state))
+            error_norm = float(np.sqrt(np.mean((error / scale) ** 2)))
+            if error_norm > 1.0:
+                n_rejected += 1
+                dt *= max(self.min_factor, self.safety * error_norm**-0.2)
+                continue
+
+            t_new = t_end if last else time + dt
+            if next_sample < t_eval.size and t_eval[next_sample] <= t_new:
+                dense = np.tensordot(_P.T, stages, axes=1)
+                while next_sample < t_eval.size and t_eval[next_sample] <= t_new:
+                    theta = (t_eval[next_sample] - time) / dt
+                    powers = theta ** np.arange(1, 5)
+                    samples[next_sample] = state + dt * np.tensordot(powers, dense, axes=1)
+                    next_sample += 1
+            n_accepted += 1
+            state, time = new_state, t_new
+            stages[0] = stages[6]
+            factor = self.max_factor if error_norm == 0 else self.safety * error_norm**-0.2
+            dt *= min(self.max_factor, max(self.min_factor, factor))
+
+        return AdaptiveSolution(
+            times=t_eval,
+            states=samples,
+            n_accepted=n_accepted,
+            n_rejected=n_rejected,
+            n_evals=n_evals,
+        )
+
+    def _initial_step(
+        self, state: np.ndarray, time: float, f0: np.ndarray, deriv: DerivativeFn
+    ) -> float:
+        """Hairer's starting step heuristic."""
+        scale = self.atol + self.rtol * np.abs(state)
+        d0 = float(np.sqrt(np.mean((state / scale) ** 2)))
+        d1 = float(np.sqrt(np.mean((f0 / scale) ** 2)))
+        h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+        f1 = deriv(state + h0 * f0, time + h0)
+        d2 = float(np.sqrt(np.mean(((f1 - f0) / scale) ** 2))) / h0
+        if max(d1, d2) <= 1e-15:
+            h1 = max(1e-6, h0 * 1e-3)
+        else:
+            h1 = (0.01 / max(d1, d2)) ** 0.2
+        return min(100 * h0, h1)
@@ -2,33 +2,121 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable, Protocol
+import inspect
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Optional, Protocol, Tuple
 
 import numpy as np
 
+if TYPE_CHECKING:
+    from tz.backend.pool import BufferPool
+
 
 DerivativeFn = Callable[[np.ndarray, float], np.ndarray]
+Chunk = Tuple[np.ndarray, np.ndarray]
 
 
 class Integrator(Protocol):
+    """Protocol for integrators.
+
+    Steps are pure array arithmetic, so a state with a leading member axis
+    advances a whole ensemble in one call. ``stages`` is the number of
+    derivative evaluations per step. ``one_step`` is True when each step is a
+    fixed explicit map of the current state alone (not adaptive, multistep,
+    implicit or parallel-in-time).
+    """
+
     name: str
+    stages: int
+    one_step: ClassVar[bool]
 
     def step(self, state: np.ndarray, time: float, dt: float, deriv: DerivativeFn) -> np.ndarray:
         ...
 
+    def advance(
+        self,
+        state: np.ndarray,
+        time: float,
+        dt: float,
+        n_steps: int,
+        deriv: DerivativeFn,
+        *,
+        record_every: int = 0,
+    ) -> Chunk:
+        ...
+
+
+def advance_steps(
+    integrator: Integrator,
+    state: np.ndarray,
+    time: float,
+    dt: float,
+    n_steps: int,
+    deriv: DerivativeFn,
+    *,
+    record_every: int = 0,
+    pool: Optional[BufferPool] = None,
+) -> Chunk:
+    """Take ``n_steps`` steps and return ``(final_state, samples)``.
+
+    ``samples`` stacks the state after every ``record_every``-th step of the
+    chunk (none when ``record_every`` is 0). Step times are ``time + k * dt``.
+    With a ``pool`` the samples buffer is acquired from it, and the caller
+    releases it once the samples are consumed.
+    """
+    n_records = n_steps // record_every if record_every > 0 else 0
+    samples = workspace(pool, (n_records, *np.shape(state)), state.dtype)
+    step_fn = integrator.step
+    for k in range(n_steps):
+        state = step_fn(state, time + k * dt, dt, deriv)
+        if n_records and (k + 1) % record_every == 0:
+            samples[(k + 1) // record_every - 1] = state
+    return state, samples
+
+
+class StepAdvance:
+    """Mixin giving integrators that define ``step`` an ``advance`` via :func:`advance_steps`.
+
+    Chunk samples come from the integrator's ``pool`` when it has one.
+    """
+
+    def advance(
+        self,
+        state: np.ndarray,
+        time: float,
+        dt: float,
+        n_steps: int,
+        deriv: DerivativeFn,
+        *,
+        record_every: int = 0,
+    ) -> Chunk:
+        return advance_steps(
+            self,  # type: ignore[arg-type]
+            state,
+            time,
+            dt,
+            n_steps,
+            deriv,
+            record_every=record_every,
+            pool=getattr(self, "pool", None),
+        )
+
 
 @dataclass(frozen=True)
-class EulerIntegrator:
+class EulerIntegrator(StepAdvance):
     name: str = "euler"
+    stages: int = 1
+    one_step: ClassVar[bool] = True
 
     def step(self, state: np.ndarray, time: float, dt: float, deriv: DerivativeFn) -> np.ndarray:
         return state + dt * deriv(state, time)
 
 
 @dataclass(frozen=True)
-class RK4Integrator:
+class RK4Integrator(StepAdvance):
     name: str = "rk4"
+    stages: int = 4
+    one_step: ClassVar[bool] = True
 
     def step(self, state: np.ndarray, time: float, dt: float, deriv: DerivativeFn) -> np.ndarray:
         k1 = deriv(state, time)
@@ -36,3 +124,110 @@ class RK4Integrator:
         k3 = deriv(state + 0.5 * dt * k2, time + 0.5 * dt)
         k4 = deriv(state + dt * k3, time + dt)
         return state + (dt / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
+
+
+def workspace(
+    pool: Optional[BufferPool], shape: Tuple[int, ...], dtype: Any, previous: Any = None
+) -> np.ndarray:
+    """Scratch array from ``pool``, returning ``previous`` to it; a new array without a pool."""
+    if pool is None:
+        return np.empty(shape, dtype=dtype)
+    if previous is not None:
+        pool.release(previous)
+    return pool.acquire(shape, dtype)
+
+
+def explicit_one_step(integrator: Any) -> bool:
+    """Whether each step of ``integrator`` is a fixed explicit map of the current state alone.
+
+    Reads the integrator's declared ``one_step``; integrators that do not
+    declare it are assumed not to be.
+    """
+    return bool(getattr(integrator, "one_step", False))
+
+
+def accepts_out(deriv: Callable[..., np.ndarray]) -> bool:
+    """Return True if ``deriv`` can write into a buffer via ``out=``."""
+    try:
+        return "out" in inspect.signature(deriv).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+@dataclass
+class InPlaceEulerIntegrator(StepAdvance):
+    """Euler step that updates ``state`` in place using one reusable buffer.
+
+    ``deriv`` must accept ``out=``. With a ``pool`` the buffer and the chunk
+    samples come from it.
+    """
+
+    name: str = "euler"
+    stages: int = 1
+    pool: Optional[BufferPool] = field(default=None, repr=False, compare=False)
+    _rate: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    one_step: ClassVar[bool] = True
+
+    def allocate(self, state: np.ndarray) -> None:
+        """Size the workspace for states shaped like ``state``."""
+        self._rate = workspace(self.pool, state.shape, state.dtype, self._rate)
+
+    def step(self, state: np.ndarray, time: float, dt: float, deriv: DerivativeFn) -> np.ndarray:
+        if self._rate is None or self._rate.shape != state.shape or self._rate.dtype != state.dtype:
+            self.allocate(state)
+        rate = deriv(state, time, out=self._rate)  # type: ignore[call-arg]
+        rate *= dt
+        state += rate
+        return state
+
+
+@dataclass
+class InPlaceRK4Integrator(StepAdvance):
+    """RK4 step that updates ``state`` in place using preallocated stage buffers.
+
+    ``deriv`` must accept ``out=``. Results are bitwise identical to
+    :class:`RK4Integrator`; the workspace is sized on first use (or via
+    :meth:`allocate`) and reused for every later step. With a ``pool`` the
+    workspace and the chunk samples come from it.
+    """
+
+    name: str = "rk4"
+    stages: int = 4
+    pool: Optional[BufferPool] = field(default=None, repr=False, compare=False)
+    _stages: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    _stage_state: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+    one_step: ClassVar[bool] = True
+
+    def allocate(self, state: np.ndarray) -> None:
+        """Size the workspace for states shaped like ``state``."""
+        self._stages = workspace(self.pool, (4, *state.shape), state.dtype, self._stages)
+        self._stage_state = workspace(self.pool, state.shape, state.dtype, self._stage_state)
+
+    def step(self, state: np.ndarray, time: float, dt: float, deriv: DerivativeFn) -> np.ndarray:
+        if (
+            self._stages is None
+            or self._stages.shape[1:] != state.shape
+            or self._stages.dtype != state.dtype
+        ):
+            self.allocate(state)
+        k1, k2, k3, k4 = self._stages
+        tmp = self._stage_state
+        deriv(state, time, out=k1)  # type: ignore[call-arg]
+        np.multiply(k1, 0.5 * dt, out=tmp)
+        tmp += state
+        deriv(tmp, time + 0.5 * dt, out=k2)  # type: ignore[call-arg]
+        np.multiply(k2, 0.5 * dt, out=tmp)
+        tmp += state
+        deriv(tmp, time + 0.5 * dt, out=k3)  # type: ignore[call-arg]
+        np.multiply(k3, dt, out=tmp)
+        tmp += state
+        deriv(tmp, time + dt, out=k4)  # type: ignore[call-arg]
+        # Same summation order as RK4Integrator: ((k1 + 2 k2) + 2 k3) + k4.
+        k2 *= 2
+        k3 *= 2
+        k1 += k2
+        k1 += k3
+        k1 += k4
+        k1 *= dt / 6.0
+        state += k1
+        return state
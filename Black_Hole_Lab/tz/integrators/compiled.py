@@ -0,0 +1,206 @@
+"""Optional Numba-compiled stepping kernels.
+
+Models opt in by defining ``kernel()``, which returns a plain-Python
+right-hand side ``rhs(state, time, params, out)`` over ``(n_members,
+state_dim)`` arrays together with its ``(n_members, n_params)`` parameter
+array. The right-hand side and the integrator loop are compiled with fixed
+signatures for the state dtype (float32 or float64; the loop takes the
+right-hand side as a typed first-class function), so both are cached on disk
+and repeat runs skip the JIT warm-up. Without numba,
+:func:`build_compiled_stepper` returns ``None`` and callers keep the NumPy
+path.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from tz.integrators.base import Chunk, DerivativeFn, Integrator
+
+try:
+    import numba
+    from numba import types
+except ImportError:  # pragma: no cover - optional dependency
+    numba = None
+
+
+def euler_loop(rhs, state, time, dt, n_steps, params, record_every, samples, work, weights):
+    rate = work[0]
+    for k in range(n_steps):
+        rhs(state, time + k * dt, params, rate)
+        for i in range(state.shape[0]):
+            for j in range(state.shape[1]):
+                state[i, j] += dt * rate[i, j]
+        if record_every > 0 and (k + 1) % record_every == 0:
+            samples[(k + 1) // record_every - 1] = state
+
+
+def rk4_loop(rhs, state, time, dt, n_steps, params, record_every, samples, work, weights):
+    k1, k2, k3, k4, tmp = work[0], work[1], work[2], work[3], work[4]
+    n, d = state.shape
+    for k in range(n_steps):
+        t = time + k * dt
+        rhs(state, t, params, k1)
+        for i in range(n):
+            for j in range(d):
+                tmp[i, j] = state[i, j] + 0.5 * dt * k1[i, j]
+        rhs(tmp, t + 0.5 * dt, params, k2)
+        for i in range(n):
+            for j in range(d):
+                tmp[i, j] = state[i, j] + 0.5 * dt * k2[i, j]
+        rhs(tmp, t + 0.5 * dt, params, k3)
+        for i in range(n):
+            for j in range(d):
+                tmp[i, j] = state[i, j] + dt * k3[i, j]
+        rhs(tmp, t + dt, params, k4)
+        for i in range(n):
+            for j in range(d):
+                state[i, j] += (dt / 6.0) * (k1[i, j] + 2 * k2[i, j] + 2 * k3[i, j] + k4[i, j])
+        if record_every > 0 and (k + 1) % record_every == 0:
+            samples[(k + 1) // record_every - 1] = state
+
+
+def verlet_loop(rhs, state, time, dt, n_steps, params, record_every, samples, work, weights):
+    rate = work[0]
+    n, d = state.shape
+    half = d // 2
+    n_weights = weights.shape[0]
+    for k in range(n_steps):
+        t = time + k * dt
+        kick = 0.5 * weights[0]
+        for index in range(n_weights + 1):
+            rhs(state, t, params, rate)
+            for i in range(n):
+                for j in range(half, d):
+                    state[i, j] += kick * dt * rate[i, j]
+            if index == n_weights:
+                break
+            weight = weights[index]
+            for i in range(n):
+                for j in range(half):
+                    state[i, j] += weight * dt * state[i, j + half]
+            t += weight * dt
+            next_weight = weights[index + 1] if index + 1 < n_weights else 0.0
+            kick = 0.5 * (weight + next_weight)
+        if record_every > 0 and (k + 1) % record_every == 0:
+            samples[(k + 1) // record_every - 1] = state
+
+
+_LOOPS = {"euler": (euler_loop, 1), "rk4": (rk4_loop, 5), "symplectic": (verlet_loop, 1)}
+DTYPES = ("float32", "float64")
+
+
+def numba_available() -> bool:
+    """Return True if numba can be imported."""
+    return numba is not None
+
+
+@lru_cache(maxsize=None)
+def _rhs_signature(dtype: str) -> Any:
+    matrix = numba.from_dtype(np.dtype(dtype))[:, ::1]
+    return types.void(matrix, types.float64, matrix, matrix)
+
+
+@lru_cache(maxsize=None)
+def compile_rhs(rhs: Callable[..., None], dtype: str = "float64") -> Any:
+    """JIT-compile a model right-hand side with the shared kernel signature for ``dtype``."""
+    return numba.njit(_rhs_signature(dtype), cache=True)(rhs)
+
+
+@lru_cache(maxsize=None)
+def compile_loop(kind: str, dtype: str = "float64") -> Any:
+    """JIT-compile the integrator loop ``kind`` (euler, rk4 or symplectic) for ``dtype`` states."""
+    scalar = numba.from_dtype(np.dtype(dtype))
+    matrix = scalar[:, ::1]
+    block = scalar[:, :, ::1]
+    signature = types.void(
+        types.FunctionType(_rhs_signature(dtype)),
+        matrix,
+        types.float64,
+        types.float64,
+        types.int64,
+        matrix,
+        types.int64,
+        block,
+        block,
+        types.float64[::1],
+    )
+    return numba.njit(signature, cache=True)(_LOOPS[kind][0])
+
+
+@dataclass(frozen=True)
+class CompiledStepper:
+    """Chunked stepping through a compiled model/integrator kernel pair.
+
+    States, samples and parameters are held in ``dtype``, the dtype the pair
+    was compiled for.
+    """
+
+    rhs: Any
+    loop: Any
+    params: np.ndarray
+    work_stages: int
+    weights: np.ndarray
+    name: str
+    dtype: np.dtype = np.dtype(np.float64)
+
+    def advance(
+        self,
+        state: np.ndarray,
+        time: float,
+        dt: float,
+        n_steps: int,
+        deriv: DerivativeFn,  # noqa: ARG002
+        *,
+        record_every: int = 0,
+    ) -> Chunk:
+        state = np.ascontiguousarray(state, dtype=self.dtype)
+        matrix = state.reshape(-1, state.shape[-1])
+        n_records = n_steps // record_every if record_every > 0 else 0
+        samples = np.empty((n_records, *matrix.shape), dtype=self.dtype)
+        work = np.empty((self.work_stages, *matrix.shape), dtype=self.dtype)
+        self.loop(
+            self.rhs,
+            matrix,
+            float(time),
+            float(dt),
+            int(n_steps),
+            self.params,
+            int(record_every),
+            samples,
+            work,
+            self.weights,
+        )
+        return state, samples.reshape(n_records, *state.shape)
+
+
+def build_compiled_stepper(
+    model: Any, integrator: Integrator, dtype: Any = None
+) -> Optional[CompiledStepper]:
+    """Return a compiled stepper for ``dtype`` states (default: the model's ``dtype``).
+
+    Returns None if numba or a kernel is unavailable, or ``dtype`` is not
+    one of :data:`DTYPES`.
+    """
+    dtype = np.dtype(dtype or getattr(model, "dtype", np.float64))
+    if numba is None or not hasattr(model, "kernel") or dtype.name not in DTYPES:
+        return None
+    weights = getattr(integrator, "weights", None)
+    kind = "symplectic" if weights is not None else integrator.name
+    if kind not in _LOOPS:
+        return None
+    rhs, params = model.kernel()
+    work_stages = _LOOPS[kind][1]
+    return CompiledStepper(
+        rhs=compile_rhs(rhs, dtype.name),
+        loop=compile_loop(kind, dtype.name),
+        params=np.array(params, dtype=dtype, order="C"),
+        work_stages=work_stages,
+        weights=np.asarray(weights if weights is not None else (0.0,), dtype=np.float64),
+        name=f"compiled_{integrator.name}",
+        dtype=dtype,
+    )
@@ -0,0 +1,275 @@
+"""Implicit integrators for stiff systems.
+
+The Newton iteration matrix ``I - gamma * dt * J`` is factorized once and
+reused across steps; it is rebuilt from a fresh Jacobian only when the
+simplified Newton iteration stops contracting or fails to converge.
+Jacobians come from the model (``jacobian(state, time)``, dense or
+``scipy.sparse``) or from finite differences, optionally compressed with a
+sparsity pattern. Sparse factorizations need scipy.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, ClassVar, Dict, Optional
+
+import numpy as np
+
+from tz.integrators.base import DerivativeFn, StepAdvance
+
+try:
+    import scipy.linalg as sla
+    import scipy.sparse as sp
+    import scipy.sparse.linalg as spla
+except ImportError:  # pragma: no cover - optional dependency
+    sla = sp = spla = None
+
+JacobianFn = Callable[[np.ndarray, float], Any]
+LinearSolve = Callable[[np.ndarray], np.ndarray]
+
+
+def column_groups(pattern: Any) -> np.ndarray:
+    """Greedy colouring of Jacobian columns that share no nonzero row."""
+    if sp is not None and sp.issparse(pattern):
+        coo = sp.coo_matrix(pattern)
+        rows, cols = coo.row, coo.col
+        n = pattern.shape[1]
+    else:
+        rows, cols = np.nonzero(np.asarray(pattern))
+        n = np.shape(pattern)[1]
+    order = np.argsort(cols, kind="stable")
+    rows, cols = rows[order], cols[order]
+    bounds = np.searchsorted(cols, np.arange(n + 1))
+    colors = np.zeros(n, dtype=np.int64)
+    row_colors: Dict[int, set] = {}
+    for j in range(n):
+        column_rows = rows[bounds[j] : bounds[j + 1]]
+        used = set().union(*(row_colors.get(int(i), set()) for i in column_rows))
+        color = 0
+        while color in used:
+            color += 1
+        colors[j] = color
+        for i in column_rows:
+            row_colors.setdefault(int(i), set()).add(color)
+    return colors
+
+
+def finite_difference_jacobian(
+    deriv: DerivativeFn,
+    state: np.ndarray,
+    time: float,
+    *,
+    sparsity: Any = None,
+    colors: Optional[np.ndarray] = None,
+    f0: Optional[np.ndarray] = None,
+) -> Any:
+    """Forward-difference Jacobian of ``deriv`` with respect to the flattened state.
+
+    With a ``sparsity`` pattern, columns that share no row are perturbed
+    together, so the cost is one evaluation per colour instead of per column;
+    the result is ``scipy.sparse`` when scipy is available. Pass precomputed
+    ``colors`` from :func:`column_groups` to skip recolouring.
+    """
+    shape = state.shape
+    y = np.asarray(state, dtype=float).reshape(-1)
+    n = y.size
+    f0 = deriv(state, time).reshape(-1) if f0 is None else f0.reshape(-1)
+    eps = np.sqrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(y))
+    if sparsity is None:
+        jac = np.empty((n, n))
+        for j in range(n):
+            perturbed = y.copy()
+            perturbed[j] += eps[j]
+            jac[:, j] = (deriv(perturbed.reshape(shape), time).reshape(-1) - f0) / eps[j]
+        return jac
+
+    colors = column_groups(sparsity) if colors is None else colors
+    if sp is not None and sp.issparse(sparsity):
+        coo = sp.coo_matrix(sparsity)
+        rows, cols = coo.row, coo.col
+    else:
+        rows, cols = np.nonzero(np.asarray(sparsity))
+    diffs = np.empty((int(colors.max()) + 1 if n else 0, n))
+    for color in range(diffs.shape[0]):
+        perturbed = y.copy()
+        members = colors == color
+        perturbed[members] += eps[members]
+        diffs[color] = deriv(perturbed.reshape(shape), time).reshape(-1) - f0
+    values = diffs[colors[cols], rows] / eps[cols]
+    if sp is not None:
+        return sp.csr_matrix((values, (rows, cols)), shape=(n, n))
+    jac = np.zeros((n, n))
+    jac[rows, cols] = values
+    return jac
+
+
+def factorize(matrix: Any) -> LinearSolve:
+    """Factorize ``matrix`` once and return a solver reusing the factors."""
+    if sp is not None and sp.issparse(matrix):
+        return spla.splu(sp.csc_matrix(matrix)).solve
+    if sla is not None:
+        factors = sla.lu_factor(np.asarray(matrix))
+        return lambda rhs: sla.lu_solve(factors, rhs)
+    inverse = np.linalg.inv(np.asarray(matrix))
+    return lambda rhs: inverse @ rhs
+
+
+@dataclass
+class _NewtonSolver:
+    """Simplified Newton for ``y - gamma_dt * f(y, t) = rhs`` with a cached factorization."""
+
+    jacobian: Optional[JacobianFn]
+    sparsity: Any
+    tol: float
+    max_iter: int
+    refresh_rate: float
+    stats: Dict[str, int]
+    _solve: Optional[LinearSolve] = None
+    _gamma_dt: float = 0.0
+    # Size and dtype of the state the cached factorization was built for.
+    _key: Optional[tuple[int, np.dtype]] = None
+    _colors: Optional[np.ndarray] = None
+
+    def refresh(self, state: np.ndarray, time: float, gamma_dt: float, deriv: DerivativeFn) -> None:
+        if self.jacobian is not None:
+            jac = self.jacobian(state, time)
+        elif self.sparsity is None:
+            jac = finite_difference_jacobian(deriv, state, time)
+            self.stats["derivative_evals"] += state.size + 1
+        else:
+            if self._colors is None:
+                self._colors = column_groups(self.sparsity)
+            jac = finite_difference_jacobian(
+                deriv, state, time, sparsity=self.sparsity, colors=self._colors
+            )
+            self.stats["derivative_evals"] += int(self._colors.max()) + 2
+        self.stats["jacobian_evals"] += 1
+        n = state.size
+        if sp is not None and sp.issparse(jac):
+            matrix = sp.identity(n, format="csc") - gamma_dt * jac
+        else:
+            matrix = np.eye(n) - gamma_dt * np.asarray(jac)
+        self._solve = factorize(matrix)
+        self._gamma_dt = gamma_dt
+        self._key = (state.size, state.dtype)
+        self.stats["factorizations"] += 1
+
+    def solve(
+        self,
+        rhs: np.ndarray,
+        guess: np.ndarray,
+        time: float,
+        gamma_dt: float,
+        deriv: DerivativeFn,
+    ) -> np.ndarray:
+        shape = guess.shape
+        # A tolerance below the state's machine epsilon could never be met.
+        tol = max(self.tol, 4 * float(np.finfo(guess.dtype).eps))
+        fresh = False
+        while True:
+            stale = self._gamma_dt != gamma_dt or self._key != (guess.size, guess.dtype)
+            if self._solve is None or stale:
+                self.refresh(guess, time, gamma_dt, deriv)
+                fresh = True
+            y = guess.reshape(-1).copy()
+            previous = None
+            rate = 0.0
+            converged = False
+            for _ in range(self.max_iter):
+                residual = (
+                    y - gamma_dt * deriv(y.reshape(shape), time).reshape(-1) - rhs.reshape(-1)
+                )
+                self.stats["derivative_evals"] += 1
+                self.stats["newton_iterations"] += 1
+                delta = self._solve(-residual)
+                y += delta
+                norm = float(np.abs(delta).max()) if delta.size else 0.0
+                if norm <= tol * (1.0 + float(np.abs(y).max())):
+                    converged = True
+                    break
+                if previous is not None:
+                    rate = norm / previous
+                    if rate > 1.0:
+                        break
+                previous = norm
+            if converged:
+                if rate > self.refresh_rate:
+                    # Slow contraction: rebuild the Jacobian before the next step.
+                    self._solve = None
+                return y.reshape(shape)
+            if fresh:
+                raise RuntimeError("Newton iteration failed to converge with a fresh Jacobian")
+            self._solve = None
+
+
+@dataclass
+class BackwardEulerIntegrator(StepAdvance):
+    """First-order, L-stable backward Euler with a reused Newton factorization."""
+
+    jacobian: Optional[JacobianFn] = None
+    sparsity: Any = None
+    newton_tol: float = 1e-10
+    max_newton_iter: int = 8
+    refresh_rate: float = 0.5
+    name: str = "backward_euler"
+    stages: int = 1
+    stats: Dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(
+            ("derivative_evals", "jacobian_evals", "factorizations", "newton_iterations"), 0
+        )
+    )
+    _newton: Optional[_NewtonSolver] = field(default=None, init=False, repr=False)
+    one_step: ClassVar[bool] = False
+
+    def _solver(self) -> _NewtonSolver:
+        if self._newton is None:
+            self._newton = _NewtonSolver(
+                jacobian=self.jacobian,
+                sparsity=self.sparsity,
+                tol=self.newton_tol,
+                max_iter=self.max_newton_iter,
+                refresh_rate=self.refresh_rate,
+                stats=self.stats,
+            )
+        return self._newton
+
+    def step(self, state: np.ndarray, time: float, dt: float, deriv: DerivativeFn) -> np.ndarray:
+        return self._solver().solve(state, state, time + dt, dt, deriv)
+
+
+@dataclass
+class BDF2Integrator(BackwardEulerIntegrator):
+    """Second-order BDF; starts (and restarts on a new trajectory) with backward Euler.
+
+    The integrator remembers the previous step and continues from it when a
+    step starts where the last one ended, with the same ``dt`` and state
+    shape. Call :meth:`reset` to start a new trajectory at that time.
+    """
+
+    name: str = "bdf2"
+    # Previous state, end time and dt of the last step.
+    _history: Optional[tuple[np.ndarray, float, float]] = field(
+        default=None, init=False, repr=False
+    )
+
+    def reset(self) -> None:
+        """Forget the previous step, so the next one starts with backward Euler."""
+        self._history = None
+
+    def _continues(self, state: np.ndarray, time: float, dt: float) -> bool:
+        if self._history is None:
+            return False
+        previous, end, last_dt = self._history
+        # Chunk start times are ``t0 + k * dt``, so allow round-off against the stored end.
+        return previous.shape == state.shape and last_dt == dt and abs(time - end) <= 1e-6 * abs(dt)
+
+    def step(self, state: np.ndarray, time: float, dt: float, deriv: DerivativeFn) -> np.ndarray:
+        if not self._continues(state, time, dt):
+            new_state = self._solver().solve(state, state, time + dt, dt, deriv)
+        else:
+            previous = self._history[0]  # type: ignore[index]
+            rhs = (4.0 * state - previous) / 3.0
+            guess = 2.0 * state - previous
+            new_state = self._solver().solve(rhs, guess, time + dt, 2.0 * dt / 3.0, deriv)
+        self._history = (state, time + dt, dt)
+        return new_state
@@ -1,5 +1,19 @@
 """IO helpers."""
 
-from tz.io.run_tracking import build_run_dir, get_env_info, get_git_info, write_json, write_yaml
+from tz.io.run_tracking import (
+    GitInfo,
+    build_run_dir,
+    get_env_info,
+    get_git_info,
+    write_json,
+    write_yaml,
+)
 
-__all__ = ["build_run_dir", "get_env_info", "get_git_info", "write_json", "write_yaml"]
+__all__ = [
+    "GitInfo",
+    "build_run_dir",
+    "get_env_info",
+    "get_git_info",
+    "write_json",
+    "write_yaml",
+]
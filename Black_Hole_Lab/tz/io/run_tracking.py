@@ -35,7 +35,7 @@ def get_git_info(repo_root: Path) -> GitInfo:
 
 def get_env_info() -> Dict[str, Any]:
     """Collect environment metadata."""
-    packages = ["numpy", "pyyaml", "matplotlib", "pytest", "hypothesis"]
+    packages = ["numpy", "pyyaml", "matplotlib", "pytest", "hypothesis", "numba", "scipy"]
     versions = {}
     for name in packages:
         try:
@@ -1,5 +1,15 @@
 """Metrics exports."""
 
-from tz.metrics.diagnostics import energy_harmonic
+from tz.metrics.curvature import curvature_scalar, grid_laplacian
+from tz.metrics.diagnostics import energy_harmonic, precision_drift
+from tz.metrics.entropy import block_rows, node_entropy, stream_node_entropy
 
-__all__ = ["energy_harmonic"]
+__all__ = [
+    "block_rows",
+    "curvature_scalar",
+    "energy_harmonic",
+    "grid_laplacian",
+    "node_entropy",
+    "precision_drift",
+    "stream_node_entropy",
+]
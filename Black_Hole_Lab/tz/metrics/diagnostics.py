@@ -2,10 +2,31 @@
 
 from __future__ import annotations
 
+from typing import Dict, Union
+
 import numpy as np
 
 
-def energy_harmonic(state: np.ndarray, omega: float) -> float:
-    """Compute energy for harmonic oscillator."""
-    x, v = state
+def energy_harmonic(state: np.ndarray, omega: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    """Compute energy for harmonic oscillator (per member for ensemble states)."""
+    x = state[..., 0]
+    v = state[..., 1]
     return 0.5 * (v**2 + (omega * x) ** 2)
+
+
+def precision_drift(reference: np.ndarray, trial: np.ndarray) -> Dict[str, float]:
+    """Deviation of ``trial`` samples from the same samples of a float64 ``reference`` run.
+
+    Relative errors are scaled by the largest reference magnitude.
+    """
+    reference = np.asarray(reference, dtype=np.float64)
+    error = np.abs(np.asarray(trial, dtype=np.float64) - reference)
+    if error.size == 0:
+        return {"max_abs_error": 0.0, "max_rel_error": 0.0, "final_rel_error": 0.0}
+    scale = max(float(np.abs(reference).max()), np.finfo(np.float64).tiny)
+    per_sample = error.reshape(len(error), -1).max(axis=1)
+    return {
+        "max_abs_error": float(error.max()),
+        "max_rel_error": float(error.max()) / scale,
+        "final_rel_error": float(per_sample[-1]) / scale,
+    }
@@ -2,23 +2,235 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
-from tz.models.base import HarmonicOscillator, Model
+import numpy as np
 
+from tz.core.precision import Precision
+from tz.models.base import HarmonicOscillator, Model, Param
+from tz.models.fields import Field, GaussianWell, MultiWell
+from tz.models.lattice import MetricLattice, MetricRelaxation
+from tz.models.mesh import ParticleMesh
+from tz.models.nbody import BarnesHut, DirectSum, ForceSolver, NBody
+from tz.models.particles import EntropyWell, FieldParticles
+from tz.models.tables import (
+    REPO_ROOT,
+    TABLE_CACHE_DIR,
+    FieldTable,
+    cached_table,
+    tabulate,
+)
 
-def build_model(config: Dict[str, Any], *, xp: object = None) -> Model:
-    """Build model from config dictionary."""
+# Config keys each model accepts as per-member lists, for members that evolve independently.
+ENSEMBLE_PARAMETERS: Dict[str, Tuple[str, ...]] = {
+    "harmonic_oscillator": ("omega", "x0", "v0"),
+}
+
+
+def _param(value: Any) -> Param:
+    """Return a scalar parameter, or a float array for per-member values."""
+    if isinstance(value, (list, tuple)):
+        return np.asarray(value, dtype=float)
+    return float(value)
+
+
+def build_field(
+    config: Dict[str, Any],
+    *,
+    xp: object = None,
+    box: Tuple[float, float] = (0.0, 1.0),
+    dtype: Optional[str] = None,
+) -> Field:
+    """Build a particle driving field from config dictionary.
+
+    A ``table`` entry (``shape``, optional ``bounds`` and ``cache_dir``)
+    replaces the analytic field by a gridded :class:`FieldTable` over
+    ``bounds`` (default: ``box`` on every axis), cached on disk by config hash
+    under ``cache_dir`` (relative to the repository root, like run outputs).
+    ``dtype`` sets the storage precision of tables and lattice fields.
+    """
+    name = config.get("name", "gaussian")
+    xp = xp or np
+    table = config.get("table")
+    if table is not None:
+        source = {key: value for key, value in config.items() if key != "table"}
+        field = build_field(source, xp=xp)
+        shape = [int(n) for n in table.get("shape", [256] * field.dim)]
+        bounds = table.get("bounds") or [box] * field.dim
+        cache_dir = table.get("cache_dir", TABLE_CACHE_DIR)
+        if cache_dir is not None:
+            cache_dir = REPO_ROOT / cache_dir
+        scheme = table.get("scheme", "linear")
+        return cached_table(
+            field, source, bounds, shape, cache_dir, scheme=scheme, dtype=dtype, xp=xp
+        )
+    if name == "gaussian":
+        return GaussianWell(
+            center=tuple(float(c) for c in config.get("center", (0.5, 0.5))),
+            sigma=float(config.get("sigma", 0.1)),
+            strength=float(config.get("strength", 1.0)),
+            xp=xp,
+        )
+    if name == "multi_well":
+        sources = config.get("sources")
+        if sources is not None:
+            centers = [source["center"] for source in sources]
+            sigmas = [source.get("sigma", 0.1) for source in sources]
+            strengths = [source.get("strength", 1.0) for source in sources]
+        else:
+            centers, sigmas, strengths = config["centers"], config["sigmas"], config["strengths"]
+        cell_size = config.get("cell_size")
+        return MultiWell(
+            centers=np.asarray(centers, dtype=float),
+            sigmas=np.asarray(sigmas, dtype=float),
+            strengths=np.asarray(strengths, dtype=float),
+            cutoff=float(config.get("cutoff", 4.0)),
+            cell_size=float(cell_size) if cell_size is not None else None,
+            xp=xp,
+        )
+    if name == "metric_lattice":
+        # The relaxed metric of a lattice model, sampled from its grid.
+        lattice = MetricLattice(
+            size=int(config.get("size", 64)),
+            dx=float(config.get("dx", 1.0)),
+            coupling=float(config.get("coupling", 1.0)),
+            amplitude=float(config.get("amplitude", 1.0)),
+            width=float(config.get("width", 0.15)),
+            dtype=str(dtype or config.get("dtype", "float64")),
+            xp=xp,
+        )
+        return lattice.table(lattice.steady_state(), scheme=config.get("scheme", "linear"))
+    raise ValueError(f"Unknown field {name}")
+
+
+def build_force_solver(config: Dict[str, Any]) -> ForceSolver:
+    """Build an N-body force solver from config dictionary."""
+    name = config.get("name", "barnes_hut")
+    gravity = float(config.get("gravity", 1.0))
+    softening = float(config.get("softening", 0.0))
+    if name == "barnes_hut":
+        return BarnesHut(
+            theta=float(config.get("theta", 0.5)), gravity=gravity, softening=softening
+        )
+    if name == "direct":
+        return DirectSum(gravity=gravity, softening=softening)
+    if name == "particle_mesh":
+        box = config.get("box")
+        return ParticleMesh(
+            cells=int(config.get("cells", 64)),
+            box=tuple(float(b) for b in box) if box is not None else None,
+            periodic=bool(config.get("periodic", False)),
+            gravity=gravity,
+            softening=softening,
+        )
+    raise ValueError(f"Unknown force solver {name}")
+
+
+def build_model(
+    config: Dict[str, Any], *, xp: object = None, precision: Optional[Precision] = None
+) -> Model:
+    """Build model from config dictionary.
+
+    Parameters given as lists are treated as per-member ensemble values, and
+    ``members`` broadcasts scalar parameters to an ensemble of that size.
+    A ``precision`` sets the state dtype of models that declare one and the
+    storage dtype of lattices and field tables, overriding any ``dtype`` key.
+    """
     name = config.get("name", "harmonic_oscillator")
     xp = xp or __import__("numpy")
+    state_dtype = precision.state.name if precision is not None else "float64"
+    compute_dtype = precision.compute.name if precision is not None else None
+    n_members = config.get("members")
     if name == "harmonic_oscillator":
         return HarmonicOscillator(
-            omega=float(config.get("omega", 1.0)),
-            x0=float(config.get("x0", 1.0)),
-            v0=float(config.get("v0", 0.0)),
+            omega=_param(config.get("omega", 1.0)),
+            x0=_param(config.get("x0", 1.0)),
+            v0=_param(config.get("v0", 0.0)),
+            xp=xp,
+            n_members=int(n_members) if n_members else None,
+            dtype=state_dtype,
+        )
+    if name == "metric_relaxation":
+        return MetricRelaxation(
+            size=int(config.get("size", 16)),
+            dx=float(config.get("dx", 1.0)),
+            damping=float(config.get("damping", 0.1)),
+            amplitude=float(config.get("amplitude", 1.0)),
+            width=float(config.get("width", 0.15)),
+            dtype=state_dtype,
+            xp=xp,
+        )
+    if name == "metric_lattice":
+        return MetricLattice(
+            size=int(config.get("size", 64)),
+            dx=float(config.get("dx", 1.0)),
+            damping=float(config.get("damping", 0.1)),
+            coupling=float(config.get("coupling", 1.0)),
+            amplitude=float(config.get("amplitude", 1.0)),
+            width=float(config.get("width", 0.15)),
+            dtype=str(compute_dtype or config.get("dtype", "float64")),
+            state_dtype=state_dtype if precision is not None else None,
+            xp=xp,
+        )
+    if name == "entropy_well":
+        seed = config.get("seed")
+        box = tuple(float(b) for b in config.get("box", (0.0, 1.0)))
+        return EntropyWell(
+            n_particles=int(config.get("n_particles", 1000)),
+            field=build_field(config.get("field", {}), xp=xp, box=box, dtype=compute_dtype),
+            force_scale=float(config.get("force_scale", 10.0)),
+            box=box,
+            max_speed=float(config.get("max_speed", 0.1)),
+            seed=int(seed) if seed is not None else None,
+            xp=xp,
+        )
+    if name == "field_particles":
+        seed = config.get("seed")
+        box = tuple(float(b) for b in config.get("box", (0.0, 1.0)))
+        return FieldParticles(
+            n_particles=int(config.get("n_particles", 1000)),
+            field=build_field(config.get("field", {}), xp=xp, box=box, dtype=compute_dtype),
+            force_scale=float(config.get("force_scale", 1.0)),
+            box=box,
+            max_speed=float(config.get("max_speed", 0.0)),
+            seed=int(seed) if seed is not None else None,
+            xp=xp,
+        )
+    if name == "nbody":
+        seed = config.get("seed")
+        return NBody(
+            n_particles=int(config.get("n_particles", 1000)),
+            dim=int(config.get("dim", 3)),
+            total_mass=float(config.get("total_mass", 1.0)),
+            radius=float(config.get("radius", 1.0)),
+            max_speed=float(config.get("max_speed", 0.0)),
+            solver=build_force_solver(config.get("solver", {})),
+            seed=int(seed) if seed is not None else None,
             xp=xp,
         )
     raise ValueError(f"Unknown model {name}")
 
 
-__all__ = ["build_model", "HarmonicOscillator", "Model"]
+__all__ = [
+    "ENSEMBLE_PARAMETERS",
+    "build_field",
+    "build_force_solver",
+    "build_model",
+    "BarnesHut",
+    "DirectSum",
+    "EntropyWell",
+    "Field",
+    "FieldParticles",
+    "FieldTable",
+    "ForceSolver",
+    "GaussianWell",
+    "HarmonicOscillator",
+    "MetricLattice",
+    "MetricRelaxation",
+    "Model",
+    "MultiWell",
+    "NBody",
+    "ParticleMesh",
+    "cached_table",
+    "tabulate",
+]
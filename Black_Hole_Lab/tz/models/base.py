@@ -3,13 +3,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol
+from functools import cached_property
+from typing import Callable, Dict, Optional, Protocol, Union
 
 import numpy as np
 
+from tz.metrics.diagnostics import energy_harmonic
+
+Param = Union[float, np.ndarray]
+
 
 class Model(Protocol):
-    """Protocol for dynamical system models."""
+    """Protocol for dynamical system models.
+
+    States are ``(state_dim,)`` arrays, or ``(n_members, state_dim)`` arrays for
+    ensembles where every leading row is an independent member. Models may also
+    accept ``derivative(state, time, out=...)`` to write into a caller-owned
+    buffer, which enables the allocation-free integrators, and may define a
+    chunked ``advance`` with the integrator signature to replace stepping, or a
+    ``kernel()`` for the compiled path in :mod:`tz.integrators.compiled`.
+    Linear time-invariant models declare themselves by exposing
+    ``system_matrix()`` and are then advanced by :mod:`tz.integrators.linear`.
+    """
 
     name: str
 
@@ -19,22 +34,100 @@ class Model(Protocol):
     def derivative(self, state: np.ndarray, time: float) -> np.ndarray:
         ...
 
+    def observables(self, state: np.ndarray) -> Dict[str, float]:
+        """Scalar diagnostics recorded in ``metrics.csv`` and the findings DB."""
+        ...
+
+
+def ensemble_shape(*params: Param, n_members: Optional[int] = None) -> tuple[int, ...]:
+    """Return the member shape implied by per-member parameters."""
+    shapes = [np.shape(param) for param in params]
+    if n_members:
+        shapes.append((int(n_members),))
+    shape = np.broadcast_shapes(*shapes)
+    if len(shape) > 1:
+        raise ValueError(f"Ensemble parameters must be scalars or 1D arrays, got shape {shape}")
+    return shape
+
+
+def harmonic_rhs(state: np.ndarray, time: float, params: np.ndarray, out: np.ndarray) -> None:
+    """Compiled-kernel right-hand side; ``params[i, 0]`` is ``omega**2`` of member ``i``."""
+    for i in range(state.shape[0]):
+        out[i, 0] = state[i, 1]
+        out[i, 1] = -params[i, 0] * state[i, 0]
+
 
 @dataclass(frozen=True)
 class HarmonicOscillator:
-    """1D harmonic oscillator model."""
+    """1D harmonic oscillator model.
 
-    omega: float
-    x0: float
-    v0: float
+    ``omega``, ``x0`` and ``v0`` may be 1D arrays (one value per member); the
+    model then evolves an ``(n_members, 2)`` ensemble state of ``dtype``.
+    """
+
+    omega: Param
+    x0: Param
+    v0: Param
     xp: object = np
+    n_members: Optional[int] = None
+    dtype: str = "float64"
     name: str = "harmonic_oscillator"
 
+    @property
+    def members(self) -> tuple[int, ...]:
+        return ensemble_shape(self.omega, self.x0, self.v0, n_members=self.n_members)
+
     def initial_state(self) -> np.ndarray:
-        return self.xp.array([self.x0, self.v0], dtype=float)
+        state = self.xp.empty((*self.members, 2), dtype=self.dtype)
+        state[..., 0] = self.x0
+        state[..., 1] = self.v0
+        return state
+
+    @cached_property
+    def _neg_omega_sq(self) -> Param:
+        return -(self.xp.asarray(self.omega, dtype=self.dtype) ** 2)
+
+    def derivative(
+        self, state: np.ndarray, time: float, out: Optional[np.ndarray] = None  # noqa: ARG002
+    ) -> np.ndarray:
+        if out is None:
+            out = self.xp.empty_like(state)
+        out[..., 0] = state[..., 1]
+        self.xp.multiply(state[..., 0], self._neg_omega_sq, out=out[..., 1])
+        return out
+
+    def observables(self, state: np.ndarray) -> Dict[str, float]:
+        energy = energy_harmonic(state, self.omega)
+        if state.ndim == 1:
+            return {"x": float(state[0]), "v": float(state[1]), "energy": float(energy)}
+        return {
+            "energy_mean": float(np.mean(energy)),
+            "energy_min": float(np.min(energy)),
+            "energy_max": float(np.max(energy)),
+        }
+
+    def member_observables(self, states: np.ndarray) -> Dict[str, np.ndarray]:
+        """Per-member ``x``, ``v`` and ``energy`` arrays of stacked ensemble states.
+
+        ``states`` may carry leading sample axes, e.g. a ``(samples, n_members,
+        2)`` trajectory; each member's values are those :meth:`observables`
+        gives for that member run alone.
+        """
+        return {
+            "x": states[..., 0],
+            "v": states[..., 1],
+            # Per-member omega is a float64 array; match the scalar promotion of a lone run.
+            "energy": energy_harmonic(states, self.xp.asarray(self.omega, dtype=states.dtype)),
+        }
+
+    def system_matrix(self) -> np.ndarray:
+        """Return ``A`` with ``d(state)/dt = A @ state``, stacked per member."""
+        matrix = np.zeros((*self.members, 2, 2))
+        matrix[..., 0, 1] = 1.0
+        matrix[..., 1, 0] = -(np.asarray(self.omega, dtype=float) ** 2)
+        return matrix
 
-    def derivative(self, state: np.ndarray, time: float) -> np.ndarray:  # noqa: ARG002
-        x, v = state
-        dx = v
-        dv = -(self.omega**2) * x
-        return self.xp.array([dx, dv], dtype=float)
+    def kernel(self) -> tuple[Callable[..., None], np.ndarray]:
+        """Return the compiled-kernel right-hand side and per-member parameters."""
+        omega_sq = np.asarray(self.omega, dtype=float) ** 2
+        return harmonic_rhs, np.broadcast_to(omega_sq, self.members or (1,)).reshape(-1, 1)
@@ -0,0 +1,215 @@
+"""Scalar fields that drive particle models."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable, Optional, Protocol, Tuple
+
+import numpy as np
+
+
+class Field(Protocol):
+    """Scalar field sampled at ``(..., dim)`` positions.
+
+    ``gradient`` may write into a caller-owned ``out`` buffer (which can be a
+    strided view into a particle state) so stepping does not allocate.
+    """
+
+    @property
+    def dim(self) -> int: ...
+
+    def field(self, positions: np.ndarray) -> np.ndarray: ...
+
+    def gradient(self, positions: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray: ...
+
+
+def squared_norm(vectors: np.ndarray) -> np.ndarray:
+    """``sum(vectors**2, axis=-1)`` by columns, which beats a reduction over a short last axis."""
+    total = vectors[..., 0] * vectors[..., 0]
+    for axis in range(1, vectors.shape[-1]):
+        total += vectors[..., axis] * vectors[..., axis]
+    return total
+
+
+@dataclass(frozen=True)
+class GaussianWell:
+    """Gaussian entropy well ``S = strength * exp(-|x - center|**2 / (2 sigma**2))``."""
+
+    center: Tuple[float, ...] = (0.5, 0.5)
+    sigma: float = 0.1
+    strength: float = 1.0
+    xp: object = np
+
+    @property
+    def dim(self) -> int:
+        return len(self.center)
+
+    @cached_property
+    def _center(self) -> np.ndarray:
+        return self.xp.asarray(self.center, dtype=float)
+
+    def _offsets(self, positions: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """``positions - center`` in the precision of the positions."""
+        center = self._center.astype(positions.dtype, copy=False)
+        return self.xp.subtract(positions, center, out=out)
+
+    def field(self, positions: np.ndarray) -> np.ndarray:
+        r2 = squared_norm(self._offsets(positions))
+        return self.strength * self.xp.exp(-r2 / (2 * self.sigma**2))
+
+    def gradient(self, positions: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        xp = self.xp
+        if out is None:
+            out = xp.empty_like(positions)
+        self._offsets(positions, out=out)
+        weight = squared_norm(out)
+        weight *= -0.5 / self.sigma**2
+        xp.exp(weight, out=weight)
+        weight *= -self.strength / self.sigma**2
+        out *= weight[..., None]
+        return out
+
+    def laplacian(self, positions: np.ndarray) -> np.ndarray:
+        """Analytic Laplacian ``S * (r**2 / sigma**4 - dim / sigma**2)`` from a single ``exp``."""
+        r2 = squared_norm(self._offsets(positions))
+        field = self.xp.exp(r2 * (-0.5 / self.sigma**2))
+        field *= self.strength
+        r2 *= 1.0 / self.sigma**4
+        r2 -= self.dim / self.sigma**2
+        field *= r2
+        return field
+
+
+@dataclass(frozen=True)
+class MultiWell:
+    """Sum of Gaussian wells with per-source ``centers`` (M, dim), ``sigmas`` and ``strengths``.
+
+    With ``cutoff > 0`` source–particle pairs farther apart than ``cutoff *
+    sigma`` are skipped: sources are binned once into a uniform grid of
+    ``cell_size`` (default: half the median reach) and each particle only visits
+    the sources registered in its cell. Pairs are evaluated vectorized over
+    blocks of ``block_size`` particles.
+    Each truncated well contributes at most ``exp(-cutoff**2 / 2)`` of its
+    strength to the field. ``cutoff = 0`` evaluates every pair.
+    """
+
+    centers: np.ndarray
+    sigmas: np.ndarray
+    strengths: np.ndarray
+    cutoff: float = 4.0
+    cell_size: Optional[float] = None
+    block_size: int = 8192
+    xp: object = np
+
+    @property
+    def dim(self) -> int:
+        return int(np.shape(self.centers)[1])
+
+    @cached_property
+    def _index(self) -> tuple[np.ndarray, float, np.ndarray, np.ndarray, np.ndarray]:
+        """Grid origin, cell size, grid shape and the CSR cell -> source lists."""
+        centers = np.asarray(self.centers, dtype=float)
+        reach = self.cutoff * np.asarray(self.sigmas, dtype=float)
+        cell = float(self.cell_size or 0.5 * np.median(reach))
+        origin = (centers - reach[:, None]).min(axis=0)
+        lower = np.floor((centers - reach[:, None] - origin) / cell).astype(np.int64)
+        upper = np.floor((centers + reach[:, None] - origin) / cell).astype(np.int64)
+        shape = upper.max(axis=0) + 1
+        cells, sources = [], []
+        for source, (lo, hi) in enumerate(zip(lower, upper)):
+            block = np.stack(np.meshgrid(*map(np.arange, lo, hi + 1), indexing="ij"), axis=-1)
+            flat = np.ravel_multi_index(block.reshape(-1, self.dim).T, shape)
+            cells.append(flat)
+            sources.append(np.full(flat.size, source))
+        cells, sources = np.concatenate(cells), np.concatenate(sources)
+        order = np.argsort(cells, kind="stable")
+        indptr = np.searchsorted(cells[order], np.arange(int(np.prod(shape)) + 1))
+        return origin, cell, shape, indptr, sources[order]
+
+    def _pairs(self, points: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Point index, source index, ``(dim, pairs)`` offsets and squared distances in reach."""
+        xp = self.xp
+        centers = xp.asarray(self.centers, dtype=float)
+        n_points, n_sources = points.shape[0], centers.shape[0]
+        if self.cutoff <= 0:
+            counts = xp.full(n_points, n_sources)
+            source = xp.tile(xp.arange(n_sources), n_points)
+        else:
+            origin, cell, shape, indptr, cell_sources = self._index
+            coords = xp.floor((points - origin) / cell).astype(np.int64)
+            inside = xp.all((coords >= 0) & (coords < shape), axis=1)
+            flat = xp.ravel_multi_index(xp.where(inside[:, None], coords, 0).T, shape)
+            first = indptr[flat]
+            counts = xp.where(inside, indptr[flat + 1] - first, 0)
+            starts = xp.cumsum(counts) - counts
+            source = cell_sources[xp.arange(int(counts.sum())) + xp.repeat(first - starts, counts)]
+        # Pairs are grouped by point, so point data is expanded with repeat, not gathered.
+        particle = xp.repeat(xp.arange(n_points), counts)
+        offset = xp.stack(
+            [
+                xp.repeat(points[:, axis], counts) - xp.take(centers[:, axis], source)
+                for axis in range(self.dim)
+            ]
+        )
+        r2 = squared_norm(offset.T)
+        if self.cutoff > 0:
+            sigmas = xp.asarray(self.sigmas, dtype=float)
+            keep = xp.flatnonzero(r2 <= (self.cutoff * xp.take(sigmas, source)) ** 2)
+            particle, source, r2 = particle[keep], source[keep], r2[keep]
+            offset = xp.take(offset, keep, axis=1)
+        return particle, source, offset, r2
+
+    def _weights(self, source: np.ndarray, r2: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        sigma_sq = self.xp.take(self.xp.asarray(self.sigmas, dtype=float), source) ** 2
+        strengths = self.xp.take(self.xp.asarray(self.strengths, dtype=float), source)
+        return strengths * self.xp.exp(-r2 / (2 * sigma_sq)), sigma_sq
+
+    def _reduce(self, positions: np.ndarray, terms: Callable[..., np.ndarray]) -> np.ndarray:
+        """Sum per-pair ``terms(source, offset, r2)`` rows over sources, block by block.
+
+        Blocks keep the pair temporaries cache-sized, which roughly halves the
+        cost for 100k points against a single pass.
+        """
+        points = positions.reshape(-1, self.dim)
+        result = None
+        for start in range(0, points.shape[0], self.block_size):
+            block = points[start : start + self.block_size]
+            particle, source, offset, r2 = self._pairs(block)
+            values = terms(source, offset, r2)
+            if result is None:
+                result = self.xp.empty((values.shape[0], points.shape[0]))
+            for row, value in zip(result, values):
+                row[start : start + block.shape[0]] = self.xp.bincount(
+                    particle, value, block.shape[0]
+                )
+        if result is None:
+            result = self.xp.zeros((self.dim, 0))
+        return result
+
+    def field(self, positions: np.ndarray) -> np.ndarray:
+        def terms(source: np.ndarray, offset: np.ndarray, r2: np.ndarray) -> np.ndarray:
+            return self._weights(source, r2)[0][None]
+
+        return self._reduce(positions, terms)[0].reshape(positions.shape[:-1])
+
+    def gradient(self, positions: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        def terms(source: np.ndarray, offset: np.ndarray, r2: np.ndarray) -> np.ndarray:
+            values, sigma_sq = self._weights(source, r2)
+            return offset * (-values / sigma_sq)
+
+        if out is None:
+            out = self.xp.empty_like(positions)
+        components = self._reduce(positions, terms)
+        for axis in range(self.dim):
+            out[..., axis] = components[axis].reshape(positions.shape[:-1])
+        return out
+
+    def laplacian(self, positions: np.ndarray) -> np.ndarray:
+        """Analytic Laplacian, summed over the wells in reach."""
+
+        def terms(source: np.ndarray, offset: np.ndarray, r2: np.ndarray) -> np.ndarray:
+            values, sigma_sq = self._weights(source, r2)
+            return (values * (r2 / sigma_sq**2 - self.dim / sigma_sq))[None]
+
+        return self._reduce(positions, terms)[0].reshape(positions.shape[:-1])
@@ -0,0 +1,289 @@
+"""Self-gravitating N-body models and their force solvers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Protocol
+
+import numpy as np
+
+# Bits per axis in the Morton keys, i.e. the maximum tree depth.
+TREE_BITS = 16
+
+
+class ForceSolver(Protocol):
+    """Pairwise inverse-square accelerations ``G * sum_j m_j (x_j - x_i) / (r**2 + eps**2)**1.5``."""
+
+    name: str
+
+    def accelerations(
+        self, positions: np.ndarray, masses: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray: ...
+
+
+def _pair_terms(offsets: List[np.ndarray], masses: np.ndarray, softening: float) -> np.ndarray:
+    """``m / (r**2 + eps**2)**1.5`` per pair, zero for coincident points without softening."""
+    r2 = offsets[0] * offsets[0]
+    for offset in offsets[1:]:
+        r2 += offset * offset
+    r2 += softening**2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight = masses / (r2 * np.sqrt(r2))
+    weight[r2 == 0.0] = 0.0
+    return weight
+
+
+@dataclass(frozen=True)
+class DirectSum:
+    """Exact O(N**2) pair sum, evaluated in row blocks of about ``block_pairs`` pairs."""
+
+    gravity: float = 1.0
+    softening: float = 0.0
+    block_pairs: int = 1 << 22
+    name: str = "direct"
+
+    def at(self, points: np.ndarray, positions: np.ndarray, masses: np.ndarray) -> np.ndarray:
+        """Acceleration at ``points`` due to the bodies; coincident bodies are skipped."""
+        result = np.empty_like(points, dtype=float)
+        rows = max(1, self.block_pairs // max(len(positions), 1))
+        for start in range(0, len(points), rows):
+            block = points[start : start + rows]
+            offsets = [
+                positions[None, :, axis] - block[:, None, axis] for axis in range(points.shape[1])
+            ]
+            weight = _pair_terms(offsets, masses[None, :], self.softening)
+            for axis, offset in enumerate(offsets):
+                result[start : start + rows, axis] = self.gravity * np.einsum(
+                    "ij,ij->i", weight, offset
+                )
+        return result
+
+    def accelerations(
+        self, positions: np.ndarray, masses: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        if out is None:
+            out = np.empty_like(positions)
+        out[...] = self.at(positions, positions, masses)
+        return out
+
+
+@dataclass(frozen=True)
+class _Tree:
+    """Flattened Morton-ordered tree; node ``k`` holds sorted bodies ``start[k]:end[k]``."""
+
+    order: np.ndarray
+    start: np.ndarray
+    end: np.ndarray
+    mass: np.ndarray
+    com: np.ndarray
+    size: np.ndarray
+    leaf: np.ndarray
+    child_start: np.ndarray
+    child_end: np.ndarray
+
+
+def morton_codes(positions: np.ndarray, lower: np.ndarray, extent: float) -> np.ndarray:
+    """Interleave quantized coordinates into ``uint64`` Z-order keys."""
+    dim = positions.shape[1]
+    bits = TREE_BITS
+    scale = (1 << bits) / extent
+    quantized = np.clip(((positions - lower) * scale).astype(np.int64), 0, (1 << bits) - 1)
+    codes = np.zeros(len(positions), dtype=np.uint64)
+    for bit in range(bits):
+        for axis in range(dim):
+            plane = (quantized[:, axis] >> bit) & 1
+            codes |= plane.astype(np.uint64) << np.uint64(bit * dim + axis)
+    return codes
+
+
+def build_tree(positions: np.ndarray, masses: np.ndarray) -> _Tree:
+    """Build the tree level by level from sorted Morton codes.
+
+    A level's nodes are the runs of equal code prefixes, so masses and centres
+    of mass are segment sums (``reduceat``) and the children of a node are the
+    next level's runs that start inside it. Building stops once every node is
+    a single body, or at the code resolution.
+    """
+    dim = positions.shape[1]
+    bits = TREE_BITS
+    lower = positions.min(axis=0)
+    extent = float((positions.max(axis=0) - lower).max()) * (1 + 1e-9) or 1.0
+    codes = morton_codes(positions, lower, extent)
+    order = np.argsort(codes, kind="stable")
+    codes = codes[order]
+    sorted_positions = positions[order]
+    sorted_masses = masses[order]
+    weighted = sorted_positions * sorted_masses[:, None]
+
+    levels = []
+    for level in range(bits + 1):
+        keys = codes >> np.uint64(dim * (bits - level))
+        starts = np.concatenate([[0], np.flatnonzero(keys[1:] != keys[:-1]) + 1])
+        mass = np.add.reduceat(sorted_masses, starts)
+        com = np.add.reduceat(weighted, starts, axis=0) / mass[:, None]
+        ends = np.append(starts[1:], len(codes))
+        levels.append((starts, ends, mass, com, np.full(len(starts), extent / 2**level)))
+        if len(starts) == len(codes):
+            break
+
+    offsets = np.cumsum([0] + [len(level[0]) for level in levels])
+    child_start, child_end, leaf = [], [], []
+    for depth, (starts, ends, *_rest) in enumerate(levels):
+        if depth + 1 < len(levels):
+            next_starts = levels[depth + 1][0]
+            child_start.append(offsets[depth + 1] + np.searchsorted(next_starts, starts))
+            child_end.append(offsets[depth + 1] + np.searchsorted(next_starts, ends))
+            leaf.append(ends - starts == 1)
+        else:
+            child_start.append(np.zeros(len(starts), dtype=np.int64))
+            child_end.append(np.zeros(len(starts), dtype=np.int64))
+            leaf.append(np.ones(len(starts), dtype=bool))
+    columns = list(zip(*levels))
+    return _Tree(
+        order=order,
+        start=np.concatenate(columns[0]),
+        end=np.concatenate(columns[1]),
+        mass=np.concatenate(columns[2]),
+        com=np.concatenate(columns[3]),
+        size=np.concatenate(columns[4]),
+        leaf=np.concatenate(leaf),
+        child_start=np.concatenate(child_start),
+        child_end=np.concatenate(child_end),
+    )
+
+
+@dataclass(frozen=True)
+class BarnesHut:
+    """Barnes–Hut tree code with opening angle ``theta``.
+
+    Each body walks the tree breadth-first, vectorized over blocks of
+    ``block_size`` bodies: a node is used as a point mass at its centre of mass
+    when ``size < theta * distance`` and the body is not inside it, otherwise
+    it is opened. Leaves containing the body itself contribute their other
+    members. ``theta = 0`` opens everything and reproduces the direct sum.
+    """
+
+    theta: float = 0.5
+    gravity: float = 1.0
+    softening: float = 0.0
+    block_size: int = 1024
+    name: str = "barnes_hut"
+
+    def accelerations(
+        self, positions: np.ndarray, masses: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        if out is None:
+            out = np.empty_like(positions)
+        positions = np.asarray(positions, dtype=float)
+        masses = np.asarray(masses, dtype=float)
+        tree = build_tree(positions, masses)
+        # Body and node data as contiguous per-axis columns for cheap 1D gathers.
+        columns = [
+            np.ascontiguousarray(positions[tree.order, axis]) for axis in range(positions.shape[1])
+        ]
+        centres = [np.ascontiguousarray(tree.com[:, axis]) for axis in range(positions.shape[1])]
+        sorted_masses = masses[tree.order]
+        result = np.empty_like(positions)
+        for first in range(0, len(positions), self.block_size):
+            body = np.arange(first, min(first + self.block_size, len(positions)))
+            result[body] = self._walk(tree, body, columns, centres, sorted_masses)
+        out[tree.order] = self.gravity * result
+        return out
+
+    def _walk(
+        self,
+        tree: _Tree,
+        body: np.ndarray,
+        columns: List[np.ndarray],
+        centres: List[np.ndarray],
+        masses: np.ndarray,
+    ) -> np.ndarray:
+        total = np.zeros((len(body), len(columns)))
+        target = np.arange(len(body))
+        node = np.zeros(len(body), dtype=np.int64)
+        while target.size:
+            index = np.take(body, target)
+            inside = (np.take(tree.start, node) <= index) & (index < np.take(tree.end, node))
+            leaf = np.take(tree.leaf, node)
+            mass = np.take(tree.mass, node)
+            offsets = [np.take(c, node) - np.take(x, index) for c, x in zip(centres, columns)]
+            own = np.flatnonzero(leaf & inside)
+            if own.size:
+                # Drop the body from its own leaf: the remaining centre of mass is
+                # offset from the body by ``M / (M - m)`` times the full one.
+                remaining = mass[own] - np.take(masses, index[own])
+                factor = np.divide(
+                    mass[own], remaining, out=np.zeros_like(remaining), where=remaining > 0
+                )
+                for offset in offsets:
+                    offset[own] *= factor
+                mass[own] = remaining
+            r2 = offsets[0] * offsets[0]
+            for offset in offsets[1:]:
+                r2 += offset * offset
+            accept = ~inside & (np.take(tree.size, node) ** 2 < self.theta**2 * r2)
+            use = np.flatnonzero((accept | leaf) & (mass > 0))
+            weight = _pair_terms([offset[use] for offset in offsets], mass[use], self.softening)
+            for axis, offset in enumerate(offsets):
+                total[:, axis] += np.bincount(target[use], weight * offset[use], len(body))
+            expand = np.flatnonzero(~(accept | leaf))
+            parent = node[expand]
+            first = np.take(tree.child_start, parent)
+            counts = np.take(tree.child_end, parent) - first
+            target = np.repeat(target[expand], counts)
+            starts = np.cumsum(counts) - counts
+            node = np.arange(target.size) + np.repeat(first - starts, counts)
+        return total
+
+
+@dataclass(frozen=True)
+class NBody:
+    """``n_particles`` equal-mass bodies under mutual inverse-square attraction.
+
+    The state is ``(n_particles, 2 * dim)`` (positions then velocities), so
+    the symplectic integrators apply directly; ``solver`` evaluates the
+    accelerations. Bodies start uniformly in a ball of ``radius`` with
+    velocities uniform in ``[-max_speed, max_speed]``.
+    """
+
+    n_particles: int = 1000
+    dim: int = 3
+    total_mass: float = 1.0
+    radius: float = 1.0
+    max_speed: float = 0.0
+    solver: ForceSolver = BarnesHut()
+    seed: Optional[int] = None
+    xp: object = np
+    name: str = "nbody"
+
+    @property
+    def masses(self) -> np.ndarray:
+        return np.full(self.n_particles, self.total_mass / self.n_particles)
+
+    def initial_state(self) -> np.ndarray:
+        rng = np.random if self.seed is None else np.random.default_rng(self.seed)
+        shape = (self.n_particles, self.dim)
+        direction = rng.normal(size=shape)
+        direction /= np.linalg.norm(direction, axis=1, keepdims=True)
+        radius = self.radius * rng.uniform(0.0, 1.0, (self.n_particles, 1)) ** (1.0 / self.dim)
+        velocities = rng.uniform(-self.max_speed, self.max_speed, shape)
+        return self.xp.asarray(np.concatenate([direction * radius, velocities], axis=1))
+
+    def derivative(
+        self, state: np.ndarray, time: float, out: Optional[np.ndarray] = None  # noqa: ARG002
+    ) -> np.ndarray:
+        if out is None:
+            out = self.xp.empty_like(state)
+        out[:, : self.dim] = state[:, self.dim :]
+        self.solver.accelerations(state[:, : self.dim], self.masses, out=out[:, self.dim :])
+        return out
+
+    def observables(self, state: np.ndarray) -> Dict[str, float]:
+        positions, velocities = state[:, : self.dim], state[:, self.dim :]
+        masses = self.masses
+        centre = masses @ positions / self.total_mass
+        return {
+            "kinetic_energy": float(0.5 * masses @ np.sum(velocities**2, axis=1)),
+            "radius_rms": float(np.sqrt(np.mean(np.sum((positions - centre) ** 2, axis=1)))),
+            "momentum": float(np.linalg.norm(masses @ velocities)),
+        }
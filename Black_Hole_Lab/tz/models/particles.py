@@ -0,0 +1,228 @@
+"""Particle models."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import ClassVar, Dict, Optional, Tuple
+
+import numpy as np
+
+from tz.integrators.base import Chunk, DerivativeFn
+from tz.models.fields import Field, GaussianWell
+
+
+def uniform_state(
+    n_particles: int,
+    dim: int,
+    box: Tuple[float, float],
+    max_speed: float,
+    seed: Optional[int],
+    xp: object = np,
+) -> np.ndarray:
+    """Uniform positions in ``box`` and velocities in ``[-max_speed, max_speed]``."""
+    rng = np.random if seed is None else np.random.default_rng(seed)
+    shape = (n_particles, dim)
+    positions = rng.uniform(*box, shape)
+    velocities = rng.uniform(-max_speed, max_speed, shape)
+    return xp.asarray(np.concatenate([positions, velocities], axis=1))
+
+
+@dataclass(frozen=True)
+class EntropyWell:
+    """``n_particles`` point masses pushed by ``force_scale * grad(S)`` inside a reflective box.
+
+    The state is ``(n_particles, 2 * dim)``: positions in the first half of each
+    row and velocities in the second, so positions and velocities are
+    ``(n_particles, dim)`` views and the symplectic integrators apply unchanged.
+    :meth:`advance` ports the legacy ``Physics``/``Integrator`` pair: a
+    kick-then-drift (Euler–Cromer) step over whole arrays, updated in place,
+    with velocity reversal and clipping at the box walls after every step.
+    Particles do not interact, so the state is ``row_local``: any block of
+    rows can be stepped on its own. The runner uses :meth:`advance` for the
+    ``euler_cromer`` integrator (its ``scheme``); other integrators step
+    :meth:`derivative` and do not apply the walls.
+    """
+
+    row_local: ClassVar[bool] = True
+    scheme: ClassVar[str] = "euler_cromer"
+
+    n_particles: int = 1000
+    field: Field = GaussianWell()
+    force_scale: float = 10.0
+    box: Tuple[float, float] = (0.0, 1.0)
+    max_speed: float = 0.1
+    seed: Optional[int] = None
+    xp: object = np
+    name: str = "entropy_well"
+
+    @property
+    def dim(self) -> int:
+        return self.field.dim
+
+    def initial_state(self) -> np.ndarray:
+        """Uniform positions in the box and velocities in ``[-max_speed, max_speed]``."""
+        return uniform_state(
+            self.n_particles, self.dim, self.box, self.max_speed, self.seed, self.xp
+        )
+
+    def derivative(
+        self, state: np.ndarray, time: float, out: Optional[np.ndarray] = None  # noqa: ARG002
+    ) -> np.ndarray:
+        if out is None:
+            out = self.xp.empty_like(state)
+        dim = self.dim
+        out[:, :dim] = state[:, dim:]
+        self.field.gradient(state[:, :dim], out=out[:, dim:])
+        out[:, dim:] *= self.force_scale
+        return out
+
+    def reflect(self, positions: np.ndarray, velocities: np.ndarray) -> None:
+        """Reverse the normal velocity of particles outside the box and clip them back in."""
+        low, high = self.box
+        outside = positions < low
+        outside |= positions > high
+        if outside.any():
+            velocities[outside] *= -1.0
+            self.xp.clip(positions, low, high, out=positions)
+
+    def constrain(self, state: np.ndarray) -> np.ndarray:
+        """Apply the reflective walls to ``state`` in place."""
+        positions, velocities = state[:, : self.dim], state[:, self.dim :]
+        self.reflect(positions, velocities)
+        return state
+
+    def advance(
+        self,
+        state: np.ndarray,
+        time: float,  # noqa: ARG002
+        dt: float,
+        n_steps: int,
+        deriv: DerivativeFn,  # noqa: ARG002
+        *,
+        record_every: int = 0,
+    ) -> Chunk:
+        # Struct-of-arrays stepping: contiguous position and velocity blocks,
+        # written back into the interleaved state only when sampled.
+        dim = self.dim
+        positions = self.xp.ascontiguousarray(state[:, :dim])
+        velocities = self.xp.ascontiguousarray(state[:, dim:])
+        n_records = n_steps // record_every if record_every > 0 else 0
+        samples = self.xp.empty((n_records, *state.shape), dtype=state.dtype)
+        work = self.xp.empty_like(positions)
+        for k in range(n_steps):
+            self.field.gradient(positions, out=work)
+            work *= self.force_scale * dt
+            velocities += work
+            self.xp.multiply(velocities, dt, out=work)
+            positions += work
+            self.reflect(positions, velocities)
+            if record_every > 0 and (k + 1) % record_every == 0:
+                sample = samples[(k + 1) // record_every - 1]
+                sample[:, :dim] = positions
+                sample[:, dim:] = velocities
+        state[:, :dim] = positions
+        state[:, dim:] = velocities
+        return state, samples
+
+    def observables(self, state: np.ndarray) -> Dict[str, float]:
+        positions, velocities = state[:, : self.dim], state[:, self.dim :]
+        return {
+            "entropy_mean": float(self.xp.mean(self.field.field(positions))),
+            "kinetic_energy": float(0.5 * self.xp.mean(self.xp.sum(velocities**2, axis=1))),
+        }
+
+
+@dataclass(frozen=True)
+class FieldParticles:
+    """``n_particles`` free particles accelerated by ``force_scale * grad(field)``.
+
+    With a gridded field (e.g. ``MetricLattice.table``) the accelerations of
+    all particles are one vectorized nearest or multilinear gather.
+    :meth:`advance` is velocity Verlet (half-kick, drift, half-kick) over
+    contiguous position and velocity blocks, updated in place; the closing
+    acceleration of a step opens the next, so a step costs one gather and
+    matches ``verlet`` stepping of :meth:`derivative` bit for bit. Fields
+    with a ``cells`` method are gathered from particles sorted by cell once per
+    chunk, which keeps the lookups cache-local. There are no walls;
+    particles start uniformly in ``box`` on every axis. Rows are independent
+    (``row_local``), as in :class:`EntropyWell`. The runner uses
+    :meth:`advance` for the ``verlet`` integrator only.
+    """
+
+    row_local: ClassVar[bool] = True
+    scheme: ClassVar[str] = "verlet"
+
+    n_particles: int = 1000
+    field: Field = GaussianWell()
+    force_scale: float = 1.0
+    box: Tuple[float, float] = (0.0, 1.0)
+    max_speed: float = 0.0
+    seed: Optional[int] = None
+    xp: object = np
+    name: str = "field_particles"
+
+    @property
+    def dim(self) -> int:
+        return self.field.dim
+
+    def initial_state(self) -> np.ndarray:
+        return uniform_state(
+            self.n_particles, self.dim, self.box, self.max_speed, self.seed, self.xp
+        )
+
+    def derivative(
+        self, state: np.ndarray, time: float, out: Optional[np.ndarray] = None  # noqa: ARG002
+    ) -> np.ndarray:
+        if out is None:
+            out = self.xp.empty_like(state)
+        dim = self.dim
+        out[:, :dim] = state[:, dim:]
+        self.field.gradient(state[:, :dim], out=out[:, dim:])
+        out[:, dim:] *= self.force_scale
+        return out
+
+    def advance(
+        self,
+        state: np.ndarray,
+        time: float,  # noqa: ARG002
+        dt: float,
+        n_steps: int,
+        deriv: DerivativeFn,  # noqa: ARG002
+        *,
+        record_every: int = 0,
+    ) -> Chunk:
+        dim = self.dim
+        # Gridded fields gather faster from particles ordered by cell, so each
+        # chunk steps a cell-sorted copy and scatters it back.
+        cells = getattr(self.field, "cells", None)
+        order = self.xp.argsort(cells(state[:, :dim])) if cells is not None else slice(None)
+        positions = self.xp.ascontiguousarray(state[order, :dim])
+        velocities = self.xp.ascontiguousarray(state[order, dim:])
+        n_records = n_steps // record_every if record_every > 0 else 0
+        samples = self.xp.empty((n_records, *state.shape), dtype=state.dtype)
+        acceleration = self.field.gradient(positions, out=self.xp.empty_like(positions))
+        acceleration *= self.force_scale
+        work = self.xp.empty_like(positions)
+        for k in range(n_steps):
+            self.xp.multiply(acceleration, 0.5 * dt, out=work)
+            velocities += work
+            self.xp.multiply(velocities, dt, out=work)
+            positions += work
+            self.field.gradient(positions, out=acceleration)
+            acceleration *= self.force_scale
+            self.xp.multiply(acceleration, 0.5 * dt, out=work)
+            velocities += work
+            if record_every > 0 and (k + 1) % record_every == 0:
+                sample = samples[(k + 1) // record_every - 1]
+                sample[order, :dim] = positions
+                sample[order, dim:] = velocities
+        state[order, :dim] = positions
+        state[order, dim:] = velocities
+        return state, samples
+
+    def observables(self, state: np.ndarray) -> Dict[str, float]:
+        positions, velocities = state[:, : self.dim], state[:, self.dim :]
+        return {
+            "field_mean": float(self.xp.mean(self.field.field(positions))),
+            "kinetic_energy": float(0.5 * self.xp.mean(self.xp.sum(velocities**2, axis=1))),
+        }
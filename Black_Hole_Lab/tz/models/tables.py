@@ -0,0 +1,214 @@
+"""Gridded field tables sampled by multilinear interpolation."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from tz.metrics.curvature import grid_laplacian
+from tz.models.fields import Field
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+TABLE_CACHE_DIR = REPO_ROOT / "data" / "cache" / "field_tables"
+
+
+@dataclass(frozen=True)
+class FieldTable:
+    """A field and its gradient on a regular grid spanning ``bounds`` (one ``(low, high)`` per axis).
+
+    ``values`` has the grid shape and ``gradients`` the grid shape plus a
+    trailing ``dim`` axis, so a corner lookup gathers whole gradient rows.
+    Sampling is bilinear (2D) or trilinear (3D), or ``scheme="nearest"`` for
+    a single gather from the closest node, and clamps to the grid edge.
+    Either array may be a read-only memory map. :meth:`laplacian` samples a
+    stencil Laplacian of ``values`` computed once per table.
+    """
+
+    values: np.ndarray
+    gradients: np.ndarray
+    bounds: Tuple[Tuple[float, float], ...]
+    scheme: str = "linear"
+    xp: object = np
+
+    @property
+    def dim(self) -> int:
+        return self.values.ndim
+
+    @cached_property
+    def _layout(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        shape = np.asarray(self.values.shape)
+        lower = np.asarray([low for low, _ in self.bounds], dtype=float)
+        upper = np.asarray([high for _, high in self.bounds], dtype=float)
+        strides = np.asarray([int(np.prod(shape[axis + 1 :])) for axis in range(self.dim)])
+        return lower, (shape - 1) / (upper - lower), shape, strides
+
+    @cached_property
+    def _flat(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self.values.reshape(-1), self.gradients.reshape(-1, self.dim)
+
+    def cells(self, positions: np.ndarray) -> np.ndarray:
+        """Flat index of the grid cell (nearest node for ``scheme="nearest"``) of each position."""
+        return self._corners(positions)[0]
+
+    def _corners(self, positions: np.ndarray) -> Tuple[np.ndarray, list]:
+        """Base flat index and ``(offset, weight)`` for each of the ``2**dim`` cell corners.
+
+        The nearest scheme has the closest node as base and a single corner
+        with weight ``None``. Per-axis weight factors are multiplied out level
+        by level, so each corner weight costs one product.
+        """
+        xp = self.xp
+        lower, scale, shape, strides = self._layout
+        points = positions.reshape(-1, self.dim)
+        nearest = self.scheme == "nearest"
+        cells, factors = [], []
+        for axis in range(self.dim):
+            scaled = points[:, axis] * scale[axis]
+            scaled -= lower[axis] * scale[axis]
+            xp.clip(scaled, 0.0, shape[axis] - 1, out=scaled)
+            if nearest:
+                scaled += 0.5
+                cells.append(scaled.astype(np.int64))
+                continue
+            cell = scaled.astype(np.int64)
+            xp.minimum(cell, shape[axis] - 2, out=cell)
+            scaled -= cell
+            cells.append(cell)
+            # Weights in the table precision keep the corner products single-typed.
+            high = scaled.astype(self.gradients.dtype, copy=False)
+            factors.append((1.0 - high, high))
+        base = xp.ravel_multi_index(tuple(cells), tuple(shape))
+        if nearest:
+            return base, [(0, None)]
+        offsets, weights = [0], [None]
+        for axis, (low, high) in enumerate(factors):
+            offsets = [
+                offset + upper * int(strides[axis]) for offset in offsets for upper in (0, 1)
+            ]
+            weights = [f if w is None else w * f for w in weights for f in (low, high)]
+        return base, list(zip(offsets, weights))
+
+    @cached_property
+    def _laplacians(self) -> np.ndarray:
+        _, scale, _, _ = self._layout
+        return grid_laplacian(self.values, 1.0 / scale).reshape(-1)
+
+    def _sample(self, values: np.ndarray, positions: np.ndarray) -> np.ndarray:
+        base, corners = self._corners(positions)
+        result = None
+        for offset, weight in corners:
+            # Gathering from a shifted view avoids a ``base + offset`` index array.
+            term = self.xp.take(values[offset:], base)
+            if weight is not None:
+                term = term * weight
+            result = term if result is None else result + term
+        return result.reshape(positions.shape[:-1])
+
+    def field(self, positions: np.ndarray) -> np.ndarray:
+        return self._sample(self._flat[0], positions)
+
+    def laplacian(self, positions: np.ndarray) -> np.ndarray:
+        """Laplacian of the tabulated field, interpolated like :meth:`field`."""
+        return self._sample(self._laplacians, positions)
+
+    def gradient(self, positions: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        _, gradients = self._flat
+        if out is None:
+            out = self.xp.empty_like(positions)
+        # Accumulate in a contiguous buffer; ``out`` may be a strided state view.
+        base, corners = self._corners(positions)
+        total = None
+        for offset, weight in corners:
+            term = self.xp.take(gradients[offset:], base, axis=0)
+            if weight is not None:
+                term *= weight[:, None]
+            if total is None:
+                total = term
+            else:
+                total += term
+        out[...] = total.reshape(out.shape)
+        return out
+
+
+def tabulate(
+    field: Field,
+    bounds: Sequence[Tuple[float, float]],
+    shape: Sequence[int],
+    *,
+    scheme: str = "linear",
+    dtype: Optional[str] = None,
+    xp: object = np,
+) -> FieldTable:
+    """Sample ``field`` and its gradient at the nodes of a regular grid, stored as ``dtype``."""
+    axes = [np.linspace(low, high, int(n)) for (low, high), n in zip(bounds, shape)]
+    nodes = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1)
+    return FieldTable(
+        values=np.asarray(field.field(nodes), dtype=dtype),
+        gradients=np.asarray(field.gradient(nodes), dtype=dtype),
+        bounds=tuple((float(low), float(high)) for low, high in bounds),
+        scheme=scheme,
+        xp=xp,
+    )
+
+
+def table_key(
+    source: Dict[str, Any],
+    bounds: Sequence[Tuple[float, float]],
+    shape: Sequence[int],
+    dtype: Optional[str] = None,
+) -> str:
+    """Hash of the source field config, grid and non-default dtype, used as the cache file stem."""
+    payload: Dict[str, Any] = {
+        "source": source,
+        "bounds": [list(map(float, b)) for b in bounds],
+        "shape": list(shape),
+    }
+    if dtype is not None and np.dtype(dtype) != np.float64:
+        payload["dtype"] = np.dtype(dtype).name
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def cached_table(
+    field: Field,
+    source: Dict[str, Any],
+    bounds: Sequence[Tuple[float, float]],
+    shape: Sequence[int],
+    cache_dir: Optional[Path] = None,
+    *,
+    scheme: str = "linear",
+    dtype: Optional[str] = None,
+    xp: object = np,
+) -> FieldTable:
+    """Return the table for ``source`` from ``cache_dir``, tabulating and saving it on a miss.
+
+    Cached tables are opened as read-only memory maps, so concurrent runs
+    share pages instead of copies. Files are written under a temporary name
+    and renamed, so a sweep racing on the same key never reads a partial file.
+    """
+    if cache_dir is None:
+        return tabulate(field, bounds, shape, scheme=scheme, dtype=dtype, xp=xp)
+    cache_dir = Path(cache_dir)
+    stem = table_key(source, bounds, shape, dtype)
+    paths = {name: cache_dir / f"{stem}.{name}.npy" for name in ("values", "gradients")}
+    if not all(path.exists() for path in paths.values()):
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        table = tabulate(field, bounds, shape, scheme=scheme, dtype=dtype, xp=xp)
+        for name, path in paths.items():
+            partial = path.with_suffix(f".{os.getpid()}.tmp")
+            with partial.open("wb") as handle:
+                np.save(handle, getattr(table, name))
+            partial.replace(path)
+    return FieldTable(
+        values=np.load(paths["values"], mmap_mode="r"),
+        gradients=np.load(paths["gradients"], mmap_mode="r"),
+        bounds=tuple((float(low), float(high)) for low, high in bounds),
+        scheme=scheme,
+        xp=xp,
+    )
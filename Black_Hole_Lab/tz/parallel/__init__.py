@@ -0,0 +1,21 @@
+"""Parallel execution exports."""
+
+from tz.parallel.shared import SlabDecomposition, shared_array, slab_index
+from tz.parallel.threads import (
+    ChunkedAdvance,
+    chunk_bounds,
+    in_pool_thread,
+    run_chunks,
+    thread_pool,
+)
+
+__all__ = [
+    "ChunkedAdvance",
+    "SlabDecomposition",
+    "chunk_bounds",
+    "in_pool_thread",
+    "run_chunks",
+    "shared_array",
+    "slab_index",
+    "thread_pool",
+]
@@ -0,0 +1,303 @@
+"""Shared-memory slab decomposition of row-local particle runs across processes."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+import tracemalloc
+from dataclasses import dataclass, field
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from tz.integrators.base import Chunk, DerivativeFn
+from tz.parallel.threads import AdvanceFn
+
+# Slots of the shared control block written by the parent before every chunk.
+_TIME, _DT, _STEPS, _RECORD_EVERY, _EXCHANGE_EVERY, _STOP = range(6)
+# Seconds between checks that every worker is still alive while the parent waits.
+_WATCH_INTERVAL = 0.5
+
+
+def shared_array(shape: Tuple[int, ...], dtype: Any, blocks: List[SharedMemory]) -> np.ndarray:
+    """Array backed by a new shared-memory block, which is appended to ``blocks``."""
+    dtype = np.dtype(dtype)
+    block = SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+    blocks.append(block)
+    return np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def slab_index(coordinates: np.ndarray, box: Tuple[float, float], slabs: int) -> np.ndarray:
+    """Slab of each coordinate for ``slabs`` equal slabs of ``box``; outliers join the edge slabs."""
+    low, high = box
+    index = ((coordinates - low) * (slabs / (high - low))).astype(np.int64)
+    return np.clip(index, 0, slabs - 1, out=index)
+
+
+def _exchange(
+    rank: int,
+    shared: Dict[str, np.ndarray],
+    current: int,
+    offsets: np.ndarray,
+    box: Tuple[float, float],
+    axis: int,
+    barrier: Any,
+) -> np.ndarray:
+    """Move this worker's rows to the slabs they now belong to; return the new slab offsets.
+
+    Every worker publishes how many of its rows go to each slab, then writes
+    them straight to their place in the other state buffer: slab ``k`` holds
+    the rows from worker 0, then worker 1, and so on, each in their old order.
+    """
+    buffers, ids = shared["states"], shared["ids"]
+    counts = shared["counts"]
+    slabs = len(offsets) - 1
+    lo, hi = offsets[rank], offsets[rank + 1]
+    rows = buffers[current][lo:hi]
+    dest = slab_index(rows[:, axis], box, slabs)
+    counts[rank] = np.bincount(dest, minlength=slabs)
+    barrier.wait()
+    new_offsets = np.concatenate([[0], np.cumsum(counts.sum(axis=0))])
+    start = new_offsets[:-1] + counts[:rank].sum(axis=0)
+    order = np.argsort(dest, kind="stable")
+    sorted_dest = dest[order]
+    group_start = np.cumsum(counts[rank]) - counts[rank]
+    target = start[sorted_dest] + np.arange(order.size) - group_start[sorted_dest]
+    buffers[1 - current][target] = rows[order]
+    ids[1 - current][target] = ids[current][lo:hi][order]
+    shared["migrated"][rank] += order.size - counts[rank, rank]
+    barrier.wait()
+    return new_offsets
+
+
+def _worker_chunk(
+    rank: int,
+    shared: Dict[str, np.ndarray],
+    advance: AdvanceFn,
+    deriv: DerivativeFn,
+    box: Tuple[float, float],
+    axis: int,
+    barrier: Any,
+) -> None:
+    control = shared["control"]
+    time, dt = float(control[_TIME]), float(control[_DT])
+    n_steps, record_every, exchange_every = (
+        int(control[_STEPS]),
+        int(control[_RECORD_EVERY]),
+        int(control[_EXCHANGE_EVERY]),
+    )
+    offsets = shared["offsets"].copy()
+    current, done = 0, 0
+    while done < n_steps:
+        length = min(exchange_every, n_steps - done)
+        lo, hi = offsets[rank], offsets[rank + 1]
+        rows = shared["states"][current][lo:hi]
+        if hi > lo:
+            final, samples = advance(
+                rows, time + done * dt, dt, length, deriv, record_every=record_every
+            )
+            if final is not rows:
+                rows[...] = final
+            if len(samples):
+                first = done // record_every
+                ids = shared["ids"][current][lo:hi]
+                shared["samples"][first : first + len(samples), ids] = samples
+        done += length
+        if done < n_steps:
+            offsets = _exchange(rank, shared, current, offsets, box, axis, barrier)
+            current = 1 - current
+    lo, hi = offsets[rank], offsets[rank + 1]
+    shared["result"][shared["ids"][current][lo:hi]] = shared["states"][current][lo:hi]
+
+
+def _run_worker(
+    rank: int,
+    shared: Dict[str, np.ndarray],
+    advance: AdvanceFn,
+    deriv: DerivativeFn,
+    box: Tuple[float, float],
+    axis: int,
+    barrier: Any,
+    start: Any,
+    errors: Any,
+) -> None:
+    # Forked workers inherit the runner's allocation tracing, which slows every step.
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+    try:
+        while True:
+            start.wait()
+            if shared["control"][_STOP]:
+                return
+            _worker_chunk(rank, shared, advance, deriv, box, axis, barrier)
+            start.wait()
+    except threading.BrokenBarrierError:
+        return
+    except BaseException as error:  # noqa: BLE001 - reported to the parent
+        errors.put(f"slab worker {rank}: {error!r}")
+        barrier.abort()
+        start.abort()
+
+
+@dataclass
+class SlabDecomposition:
+    """Step a row-local particle state on ``workers`` processes, one spatial slab each.
+
+    The state lives in ``multiprocessing.shared_memory`` blocks. Forked
+    workers map the same blocks and inherit ``advance`` and the derivative,
+    so nothing is pickled. Before a chunk the parent orders the rows by slab
+    along ``axis`` of ``box``. Each worker steps its own contiguous rows for
+    ``exchange_every`` steps (rounded up to whole ``record_every`` intervals),
+    then particles that crossed into another slab migrate through a second
+    shared buffer, with barriers around the exchange. Samples and the final
+    state are scattered back to the original particle order, so results
+    equal serial stepping bit for bit. ``stats`` counts exchanges and
+    migrated particles. Needs the ``fork`` start method; call :meth:`close`
+    to stop the workers and free the blocks.
+    """
+
+    advance_fn: AdvanceFn
+    box: Tuple[float, float]
+    workers: int = 0
+    exchange_every: int = 10
+    max_records: int = 0
+    axis: int = 0
+    name: str = "processes"
+    stats: Dict[str, int] = field(default_factory=lambda: {"exchanges": 0, "migrated_particles": 0})
+    _shared: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    _blocks: List[SharedMemory] = field(default_factory=list, init=False, repr=False)
+    _processes: List[Any] = field(default_factory=list, init=False, repr=False)
+    _sync: Any = field(default=None, init=False, repr=False)
+    _errors: Any = field(default=None, init=False, repr=False)
+    _deriv: Optional[DerivativeFn] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.workers = self.workers or os.cpu_count() or 1
+
+    def _start(self, state: np.ndarray, n_records: int, deriv: DerivativeFn) -> None:
+        self.close()
+        context = multiprocessing.get_context("fork")
+        rows, blocks = state.shape[0], self._blocks
+        capacity = max(self.max_records, n_records)
+        self._shared = {
+            "control": shared_array((6,), np.float64, blocks),
+            "offsets": shared_array((self.workers + 1,), np.int64, blocks),
+            "counts": shared_array((self.workers, self.workers), np.int64, blocks),
+            "migrated": shared_array((self.workers,), np.int64, blocks),
+            "states": [shared_array(state.shape, state.dtype, blocks) for _ in range(2)],
+            "ids": [shared_array((rows,), np.int64, blocks) for _ in range(2)],
+            "result": shared_array(state.shape, state.dtype, blocks),
+            "samples": shared_array((capacity, *state.shape), state.dtype, blocks),
+        }
+        self._shared["migrated"][...] = 0
+        barrier = context.Barrier(self.workers)
+        self._sync = context.Barrier(self.workers + 1)
+        self._errors = context.SimpleQueue()
+        box = (float(self.box[0]), float(self.box[1]))
+        for rank in range(self.workers):
+            process = context.Process(
+                target=_run_worker,
+                args=(
+                    rank,
+                    self._shared,
+                    self.advance_fn,
+                    deriv,
+                    box,
+                    self.axis,
+                    barrier,
+                    self._sync,
+                    self._errors,
+                ),
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+        self._deriv = deriv
+
+    def _watch(self, done: threading.Event) -> None:
+        # A killed worker never reaches the barrier; break it so the parent stops waiting.
+        while not done.wait(_WATCH_INTERVAL):
+            if not all(process.is_alive() for process in self._processes):
+                self._sync.abort()
+                return
+
+    def _wait(self) -> None:
+        done = threading.Event()
+        watcher = threading.Thread(target=self._watch, args=(done,), daemon=True)
+        watcher.start()
+        try:
+            self._sync.wait()
+        except threading.BrokenBarrierError:
+            if not self._errors.empty():
+                message = self._errors.get()
+            else:
+                codes = [process.exitcode for process in self._processes]
+                message = f"slab worker failed (exit codes {codes})"
+            self.close()
+            raise RuntimeError(message) from None
+        finally:
+            done.set()
+            watcher.join()
+
+    def close(self) -> None:
+        """Stop the workers and release the shared-memory blocks."""
+        if self._processes:
+            self._shared["control"][_STOP] = 1.0
+            try:
+                self._sync.wait(timeout=10)
+            except threading.BrokenBarrierError:
+                pass
+            for process in self._processes:
+                process.join(timeout=10)
+                if process.is_alive():
+                    process.terminate()
+        self._processes = []
+        self._shared = None
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def advance(
+        self,
+        state: np.ndarray,
+        time: float,
+        dt: float,
+        n_steps: int,
+        deriv: DerivativeFn,
+        *,
+        record_every: int = 0,
+    ) -> Chunk:
+        n_records = n_steps // record_every if record_every > 0 else 0
+        shared = self._shared
+        if (
+            shared is None
+            or shared["result"].shape != state.shape
+            or shared["result"].dtype != state.dtype
+            or shared["samples"].shape[0] < n_records
+            or self._deriv != deriv
+        ):
+            self._start(state, n_records, deriv)
+            shared = self._shared
+        exchange_every = max(1, self.exchange_every)
+        if record_every > 0:
+            exchange_every = -(-exchange_every // record_every) * record_every
+
+        slabs = slab_index(state[:, self.axis], self.box, self.workers)
+        order = np.argsort(slabs, kind="stable")
+        np.take(state, order, axis=0, out=shared["states"][0])
+        shared["ids"][0][...] = order
+        shared["offsets"][1:] = np.cumsum(np.bincount(slabs, minlength=self.workers))
+        shared["offsets"][0] = 0
+        shared["control"][:] = (time, dt, n_steps, record_every, exchange_every, 0.0)
+        migrated = int(shared["migrated"].sum())
+        self._wait()
+        self._wait()
+
+        state[...] = shared["result"]
+        self.stats["exchanges"] += max(0, -(-n_steps // exchange_every) - 1)
+        # Counts restart with the workers, so accumulate this chunk's share.
+        self.stats["migrated_particles"] += int(shared["migrated"].sum()) - migrated
+        return state, shared["samples"][:n_records].copy()